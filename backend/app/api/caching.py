@@ -0,0 +1,164 @@
+import hashlib
+import json
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from ..core.cache import LRUCache
+from ..core.catalog import catalog_source, catalog_version
+from ..core.config import get_settings
+from ..schemas.model import serialize_model_row
+
+settings = get_settings()
+
+# Rendered JSON bodies of public read endpoints, keyed by route, query and catalog version.
+response_cache = LRUCache(settings.response_cache_size, ttl=settings.response_cache_ttl_seconds)
+
+# Pre-encoded ModelRead JSON per model, keyed by id and the model/vendor ``updated_at`` stamps, so
+# any update (which touches ``updated_at``) simply stops matching the stale entry.
+model_fragment_cache = LRUCache(settings.model_fragment_cache_size)
+
+
+def encode_json(content: Any) -> bytes:
+    """Encode JSON-compatible data exactly like ``JSONResponse`` does."""
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def model_fragment(row: Mapping[str, Any], fields: Optional[Tuple[str, ...]] = None) -> bytes:
+    """ModelRead JSON (or its ``fields`` subset) for a listing row, served from the fragment cache."""
+    key = (row["id"], row["updated_at"], row["vendor_updated_at"], fields)
+    fragment = model_fragment_cache.get(key)
+    if fragment is None:
+        fragment = encode_json(serialize_model_row(row, fields))
+        model_fragment_cache.set(key, fragment)
+    return fragment
+
+
+def encode_items_response(fragments: Sequence[bytes], **fields: Any) -> bytes:
+    """Encode ``{"items": [...], **fields}`` splicing in pre-encoded item fragments."""
+    body = b'{"items":[' + b",".join(fragments) + b"]"
+    return body + (b"," + encode_json(fields)[1:] if fields else b"}")
+
+
+def request_cache_key(request: Request, *extra: Hashable) -> tuple:
+    """Cache key for a request: path plus sorted non-empty query parameters."""
+    query = tuple(sorted((key, value) for key, value in request.query_params.multi_items() if value != ""))
+    return (request.url.path, query, *extra)
+
+
+def cached_json_response(
+    request: Request,
+    build: Callable[[], Any],
+    *,
+    session: Optional[Session] = None,
+    by_alias: bool = False,
+    extra_key: tuple = (),
+) -> Response:
+    """Serve the JSON rendering of ``build()`` from the response cache.
+
+    Entries are keyed by the current catalog version, so any admin write invalidates them all, and
+    by the database ``session`` reads (primary or replica).
+    ``build`` should return the same object the route would otherwise return for its
+    ``response_model``, or the already encoded JSON body as ``bytes``.
+
+    Responses carry validators for conditional requests. With a ``session`` the ``ETag`` and
+    ``Last-Modified`` headers come from the persisted catalog state, which is shared by every
+    worker, and a matching ``If-None-Match``/``If-Modified-Since`` is answered with ``304``
+    without calling ``build``. Without a session (data not stored in the catalog) the ``ETag``
+    only depends on the request and ``extra_key``.
+    """
+    state = catalog_version.refresh(session, settings.catalog_version_poll_seconds) if session is not None else None
+    lookup = _lookup(request, state, extra_key, catalog_source(session) if session is not None else None)
+    if lookup.response is not None:
+        return lookup.response
+    return _respond(lookup, _render(build(), by_alias))
+
+
+async def cached_json_response_async(
+    request: Request,
+    build: Callable[[], Awaitable[Any]],
+    *,
+    session: Optional[AsyncSession] = None,
+    by_alias: bool = False,
+    extra_key: tuple = (),
+) -> Response:
+    """``cached_json_response`` for async routes: ``build`` is awaited and ``session`` is async."""
+    state = None
+    if session is not None:
+        state = await session.run_sync(catalog_version.refresh, settings.catalog_version_poll_seconds)
+    lookup = _lookup(request, state, extra_key, catalog_source(session) if session is not None else None)
+    if lookup.response is not None:
+        return lookup.response
+    return _respond(lookup, _render(await build(), by_alias))
+
+
+class _Lookup(NamedTuple):
+    key: Optional[tuple]
+    headers: Dict[str, str]
+    # A 304 or cached response, ready to return.
+    response: Optional[Response]
+
+
+def _lookup(
+    request: Request, state: Optional[Tuple[int, int]], extra_key: tuple, source: Optional[str]
+) -> _Lookup:
+    request_key = request_cache_key(request, *extra_key)
+    digest = hashlib.sha1(repr(request_key).encode("utf-8")).hexdigest()[:16]
+    modified_at: Optional[int] = None
+    if state is not None:
+        version, modified_at = state
+        etag = f'"{version}-{digest}"'
+    else:
+        etag = f'"{digest}"'
+
+    headers: Dict[str, str] = {"ETag": etag, "Cache-Control": settings.http_cache_control}
+    if modified_at:
+        headers["Last-Modified"] = formatdate(modified_at, usegmt=True)
+
+    if _not_modified(request, etag, modified_at):
+        return _Lookup(None, headers, Response(status_code=304, headers=headers))
+    if not settings.response_cache_enabled:
+        return _Lookup(None, headers, None)
+    key = (*request_key, catalog_version.value, source)
+    body = response_cache.get(key)
+    if body is not None:
+        return _Lookup(key, headers, Response(content=body, media_type="application/json", headers=headers))
+    return _Lookup(key, headers, None)
+
+
+def _respond(lookup: _Lookup, body: bytes) -> Response:
+    if lookup.key is not None:
+        response_cache.set(lookup.key, body)
+    return Response(content=body, media_type="application/json", headers=lookup.headers)
+
+
+def _not_modified(request: Request, etag: str, modified_at: Optional[int]) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence over If-Modified-Since (RFC 9110, 13.2.2).
+        candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+        return any(
+            candidate == "*" or candidate.removeprefix("W/") == etag for candidate in candidates
+        )
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and modified_at:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since is None:
+            return False
+        return modified_at <= int(since.timestamp())
+    return False
+
+
+def _render(content: Any, by_alias: bool) -> bytes:
+    if isinstance(content, bytes):
+        return content
+    return JSONResponse(content=jsonable_encoder(content, by_alias=by_alias)).body
@@ -1,9 +1,12 @@
-from typing import Generator
+from functools import partial
+from typing import AsyncGenerator, Callable, ContextManager, Generator
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from ..core.database import get_session
+from ..core.database import get_async_session, get_read_session, get_session, read_session_context, session_context
+from .replica import reads_primary
 from ..services.auth_service import AuthService, get_auth_service, oauth2_scheme
 
 
@@ -11,6 +14,26 @@ def get_db() -> Generator[Session, None, None]:
     yield from get_session()
 
 
+def get_read_db(request: Request) -> Generator[Session, None, None]:
+    """Session for read-only routes: the read database, or the primary right after this client wrote."""
+    yield from get_read_session(primary=reads_primary(request))
+
+
+async def get_async_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async for session in get_async_session(primary=reads_primary(request)):
+        yield session
+
+
+def get_session_factory() -> Callable[[], ContextManager[Session]]:
+    """Sessions for work that outlives the request's ``get_db`` session, such as streamed bodies."""
+    return session_context
+
+
+def get_read_session_factory(request: Request) -> Callable[[], ContextManager[Session]]:
+    """``get_session_factory`` for read-only work, routed like ``get_read_db``."""
+    return partial(read_session_context, primary=reads_primary(request))
+
+
 def get_current_admin(
     token: str = Depends(oauth2_scheme),
     auth_service: AuthService = Depends(get_auth_service),
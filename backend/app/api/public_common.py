@@ -0,0 +1,88 @@
+"""Request parsing and response building shared by the sync (``public``) and async (``public_async``) routers."""
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from fastapi import Depends, HTTPException, Request
+
+from ..core.config import Settings, get_settings
+from ..models.vendor import Vendor
+from ..schemas.common import PaginatedResponse
+from ..schemas.currency import CurrencyConfig
+from ..schemas.model import ModelBatchRequest
+from ..schemas.vendor import VendorRead
+from ..services.search_service import VendorQueryParams
+from ..services.vendor_service import VendorService
+from ..utils.filters import parse_csv
+from ..utils.pagination import Page
+from .caching import cached_json_response, encode_items_response, model_fragment
+
+
+def get_vendor_service() -> VendorService:
+    return VendorService()
+
+
+def get_currency_config(request: Request, settings: Settings = Depends(get_settings)):
+    """``GET /public/currency``; it has no database access, so both routers mount this handler."""
+
+    def build() -> CurrencyConfig:
+        exchange_rates = {code.upper(): float(rate) for code, rate in settings.currency_exchange_rates.items()}
+        display_currency = settings.display_currency.upper()
+        available = sorted(exchange_rates.keys())
+        return CurrencyConfig(
+            displayCurrency=display_currency,
+            exchangeRates=exchange_rates,
+            availableCurrencies=available,
+        )
+
+    # Currency settings are not covered by the catalog version, so they are part of the key.
+    extra_key = (settings.display_currency, tuple(sorted(settings.currency_exchange_rates.items())))
+    return cached_json_response(request, build, by_alias=True, extra_key=extra_key)
+
+
+def vendor_query(params: VendorQueryParams) -> Dict[str, Any]:
+    """``VendorService.list_vendors`` keyword arguments for the query parameters."""
+    return dict(
+        status_filter=params.status,
+        search=params.search,
+        page=params.page,
+        page_size=params.page_size,
+        include_total=params.include_total,
+    )
+
+
+def vendor_page_response(page: Page[Vendor]) -> PaginatedResponse[VendorRead]:
+    return PaginatedResponse[VendorRead](
+        items=[VendorRead.from_orm(vendor) for vendor in page.items],
+        total=page.total,
+        page=page.page,
+        page_size=page.page_size,
+        has_more=page.has_more,
+    )
+
+
+def encode_model_page(page: Page[Mapping[str, Any]], fields: Optional[Tuple[str, ...]]) -> bytes:
+    return encode_items_response(
+        [model_fragment(row, fields) for row in page.items],
+        total=page.total,
+        page=page.page,
+        page_size=page.page_size,
+        has_more=page.has_more,
+        next_cursor=page.next_cursor,
+    )
+
+
+def parse_batch_ids(ids: str) -> List[int]:
+    try:
+        return ModelBatchRequest(ids=parse_csv(ids) or []).ids
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail="ids must be 1-100 comma separated integers") from exc
+
+
+def encode_batch(rows: Sequence[Mapping[str, Any]], missing: List[int]) -> bytes:
+    return encode_items_response([model_fragment(row) for row in rows], missing=missing)
+
+
+def encode_model(rows: Sequence[Mapping[str, Any]], missing: List[int]) -> bytes:
+    """The single model of a detail lookup, or ``404``."""
+    if not rows:
+        raise HTTPException(status_code=404, detail="Model not found")
+    return model_fragment(rows[0])
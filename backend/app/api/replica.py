@@ -0,0 +1,60 @@
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..core import database
+from ..core.config import get_settings
+
+# Set on responses to admin writes; while the client sends it back, its reads go to the primary.
+READ_PRIMARY_COOKIE = "read_primary"
+# The same signal for cross-origin clients, which do not send cookies: admin write responses carry
+# the window in seconds, and the client sends ``X-Read-Primary: 1`` on its requests until it ends.
+READ_PRIMARY_SECONDS_HEADER = "X-Read-Primary-Seconds"
+READ_PRIMARY_HEADER = "X-Read-Primary"
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+_ADMIN_PREFIX = "/api/admin/"
+# Admin endpoints that accept writes but never change the catalog.
+_NON_CATALOG_PREFIXES = ("/api/admin/auth/",)
+
+
+def reads_primary(connection: HTTPConnection) -> bool:
+    """Whether the client wrote recently and must read from the primary (read-your-writes)."""
+    return READ_PRIMARY_COOKIE in connection.cookies or connection.headers.get(READ_PRIMARY_HEADER) == "1"
+
+
+class ReadYourWritesMiddleware:
+    """Pins a client's reads to the primary for ``READ_YOUR_WRITES_SECONDS`` after an admin write.
+
+    Only active with a separate read database. Pure ASGI, so streamed request and response
+    bodies pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or database.read_engine is database.engine or not _is_catalog_write(scope):
+            await self.app(scope, receive, send)
+            return
+
+        seconds = get_settings().read_your_writes_seconds
+        cookie = f"{READ_PRIMARY_COOKIE}=1; Max-Age={seconds}; Path=/api; HttpOnly; SameSite=lax"
+
+        async def send_pinned(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                headers = MutableHeaders(scope=message)
+                headers.append("set-cookie", cookie)
+                headers[READ_PRIMARY_SECONDS_HEADER] = str(seconds)
+            await send(message)
+
+        await self.app(scope, receive, send_pinned)
+
+
+def _is_catalog_write(scope: Scope) -> bool:
+    path = scope["path"]
+    return (
+        scope["method"] not in SAFE_METHODS
+        and path.startswith(_ADMIN_PREFIX)
+        and not path.startswith(_NON_CATALOG_PREFIXES)
+    )
@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Depends, HTTPException
+
+from ...api.deps import get_current_admin
+from ...core.jobs import import_jobs
+from ...schemas.job import JobRead
+
+router = APIRouter(prefix="/admin/jobs", tags=["admin-jobs"], dependencies=[Depends(get_current_admin)])
+
+
+@router.get("/{job_id}", response_model=JobRead)
+def get_job(job_id: str):
+    job = import_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return JobRead.from_orm(job)
@@ -1,19 +1,38 @@
-from fastapi import APIRouter, Depends, status
-
-from ...api.deps import get_current_admin, get_db
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from ...api.caching import encode_items_response, model_fragment
+from ...api.deps import get_current_admin, get_db, get_read_db, get_read_session_factory, get_session_factory
+from ...api.streaming import (
+    GZIP_ERRORS,
+    MEDIA_TYPES,
+    check_gzip,
+    encode_stream,
+    gzip_stream,
+    read_lines,
+    spool_request_body,
+)
+from ...core.config import get_settings
+from ...core.jobs import Job, JobQueueFull, import_jobs
 from ...repositories.model_repository import ModelRepository
 from ...repositories.vendor_repository import VendorRepository
+from ...schemas.job import JobRead
 from ...schemas.responses import ModelPaginatedResponse
 from ...schemas.model import (
     ModelBulkExportItem,
     ModelBulkImportRequest,
     ModelBulkImportResult,
     ModelCreate,
+    ModelChunkedImportResult,
     ModelRead,
     ModelUpdate,
 )
 from ...services.model_service import ModelService
-from ...services.search_service import ModelSearchParams
+from ...services.search_service import ModelFieldsParams, ModelSearchParams
 from ...services.vendor_service import VendorService
 from .admin_vendors import get_vendor_service
 
@@ -26,16 +45,31 @@ router = APIRouter(prefix="/admin/models", tags=["admin-models"], dependencies=[
 @router.get("", response_model=ModelPaginatedResponse, response_model_by_alias=False)
 def list_models(
     params: ModelSearchParams = Depends(ModelSearchParams),
+    fields: ModelFieldsParams = Depends(ModelFieldsParams),
     service: ModelService = Depends(ModelService),
     repo: ModelRepository = Depends(ModelRepository),
-    session=Depends(get_db),
+    session=Depends(get_read_db),
 ):
+    if fields.fields is not None:
+        page = service.list_models(session, repository=repo, as_rows=True, fields=fields.fields, **params.dict())
+        body = encode_items_response(
+            [model_fragment(row, fields.fields) for row in page.items],
+            total=page.total,
+            page=page.page,
+            page_size=page.page_size,
+            has_more=page.has_more,
+            next_cursor=page.next_cursor,
+        )
+        return Response(content=body, media_type="application/json")
+
     page = service.list_models(session, repository=repo, **params.dict())
     return ModelPaginatedResponse(
         items=[ModelRead.from_orm(model) for model in page.items],
         total=page.total,
         page=page.page,
         page_size=page.page_size,
+        has_more=page.has_more,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -59,22 +93,92 @@ def create_model(
 
 @router.get("/export", response_model=list[ModelBulkExportItem])
 def export_models(
+    format: str = Query(default="json", pattern="^(json|ndjson)$"),
+    gzip: bool = Query(default=False),
     service: ModelService = Depends(ModelService),
     repo: ModelRepository = Depends(ModelRepository),
-    session=Depends(get_db),
+    session_factory=Depends(get_read_session_factory),
 ):
-    return service.export_models(session, repo)
+    # The body is produced after the request's dependencies have closed, so it opens its own session.
+    def body():
+        with session_factory() as session:
+            yield from encode_stream(service.iter_export_items(session, repo), format)
+
+    headers = {"Content-Disposition": f'attachment; filename="models.{format}"'}
+    content = body()
+    if gzip:
+        content = gzip_stream(content)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(content, media_type=MEDIA_TYPES[format], headers=headers)
 
 
-@router.post("/import", response_model=ModelBulkImportResult)
+@router.post("/import", response_model=ModelBulkImportResult, responses={202: {"model": JobRead}})
 def import_models(
     payload: ModelBulkImportRequest,
+    run_async: bool = Query(default=False, alias="async"),
+    dry_run: bool = Query(default=False),
     service: ModelService = Depends(ModelService),
     repo: ModelRepository = Depends(ModelRepository),
     vendor_repo: VendorRepository = Depends(VendorRepository),
     session=Depends(get_db),
+    session_factory=Depends(get_session_factory),
 ):
-    return service.import_models(session, payload, repo, vendor_repo)
+    if not run_async:
+        return service.import_models(session, payload, repo, vendor_repo, dry_run=dry_run)
+
+    def work(job: Job) -> dict:
+        def progress(processed: int) -> None:
+            job.processed = processed
+
+        # One transaction, like the synchronous import: a failure leaves the catalog untouched.
+        # ``processed`` advances with every written batch, before the final commit.
+        with session_factory() as job_session:
+            result = service.import_models(
+                job_session, payload, repo, vendor_repo, dry_run=dry_run, on_progress=progress
+            )
+        return result.dict()
+
+    try:
+        job = import_jobs.submit("model_import", work, total=len(payload.items))
+    except JobQueueFull as exc:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail="Too many import jobs queued") from exc
+    return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=jsonable_encoder(JobRead.from_orm(job)))
+
+
+@router.post("/import/ndjson", response_model=ModelChunkedImportResult)
+async def import_models_ndjson(
+    request: Request,
+    offset: int = Query(default=0, ge=0),
+    chunk_size: Optional[int] = Query(default=None, ge=1, le=10000),
+    dry_run: bool = Query(default=False),
+    service: ModelService = Depends(ModelService),
+    repo: ModelRepository = Depends(ModelRepository),
+    vendor_repo: VendorRepository = Depends(VendorRepository),
+    session_factory=Depends(get_session_factory),
+):
+    upload = await spool_request_body(request)
+    compressed = request.headers.get("content-encoding") == "gzip"
+    try:
+        if compressed:
+            try:
+                await run_in_threadpool(check_gzip, upload)
+            except GZIP_ERRORS as exc:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Request body is not valid gzip data (Content-Encoding: gzip)",
+                ) from exc
+        return await run_in_threadpool(
+            service.import_ndjson,
+            read_lines(upload, compressed=compressed),
+            session_factory=session_factory,
+            repository=repo,
+            vendor_repository=vendor_repo,
+            chunk_size=chunk_size or get_settings().import_chunk_size,
+            offset=offset,
+            dry_run=dry_run,
+        )
+    finally:
+        upload.close()
 
 
 @router.get(
@@ -84,7 +188,7 @@ def get_model(
     model_id: int,
     service: ModelService = Depends(ModelService),
     repo: ModelRepository = Depends(ModelRepository),
-    session=Depends(get_db),
+    session=Depends(get_read_db),
 ):
     model = service.get_model(session, model_id, repo)
     return ModelRead.from_orm(model)
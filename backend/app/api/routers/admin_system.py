@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends
+
+from ...api.caching import model_fragment_cache, response_cache
+from ...api.deps import get_current_admin
+from ...core.catalog import catalog_version
+from ...core.pool import pool_stats
+from ...repositories.base import count_cache
+from ...services.model_service import facet_cache
+
+router = APIRouter(prefix="/admin/system", tags=["admin-system"], dependencies=[Depends(get_current_admin)])
+
+
+@router.get("/cache")
+def get_cache_stats() -> dict:
+    return {
+        "catalog_version": catalog_version.value,
+        "caches": {
+            "response": response_cache.stats(),
+            "model_fragment": model_fragment_cache.stats(),
+            "count": count_cache.stats(),
+            "facet": facet_cache.stats(),
+        },
+    }
+
+
+@router.get("/pool")
+def get_pool_stats() -> dict:
+    return {"pools": pool_stats()}
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, status
 
-from ...api.deps import get_current_admin, get_db
+from ...api.deps import get_current_admin, get_db, get_read_db
 from ...repositories.vendor_repository import VendorRepository
 from ...schemas.common import PaginatedResponse
 from ...schemas.vendor import VendorCreate, VendorRead, VendorUpdate
@@ -22,9 +22,10 @@ def list_vendors(
     page_size: int = 20,
     status: str | None = None,
     search: str | None = None,
+    include_total: bool = True,
     repo: VendorRepository = Depends(VendorRepository),
     service: VendorService = Depends(get_vendor_service),
-    session=Depends(get_db),
+    session=Depends(get_read_db),
 ):
     result = service.list_vendors(
         session,
@@ -33,12 +34,14 @@ def list_vendors(
         search=search,
         page=page,
         page_size=page_size,
+        include_total=include_total,
     )
     return PaginatedResponse[VendorRead](
         items=[VendorRead.from_orm(vendor) for vendor in result.items],
         total=result.total,
         page=result.page,
         page_size=result.page_size,
+        has_more=result.has_more,
     )
 
 
@@ -65,7 +68,7 @@ def get_vendor(
     vendor_id: int,
     repo: VendorRepository = Depends(VendorRepository),
     service: VendorService = Depends(get_vendor_service),
-    session=Depends(get_db),
+    session=Depends(get_read_db),
 ):
     vendor = service.get_vendor(session, vendor_id, repo)
     return VendorRead.from_orm(vendor)
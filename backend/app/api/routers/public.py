@@ -1,19 +1,26 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
 
-from ...api.deps import get_db
+from ...api.caching import cached_json_response
+from ...api.deps import get_read_db
+from ...api.public_common import (
+    encode_batch,
+    encode_model,
+    encode_model_page,
+    get_currency_config,
+    get_vendor_service,
+    parse_batch_ids,
+    vendor_page_response,
+    vendor_query,
+)
 from ...repositories.model_repository import ModelRepository
 from ...repositories.vendor_repository import VendorRepository
 from ...schemas.common import PaginatedResponse
 from ...schemas.currency import CurrencyConfig
-from ...schemas.model import ModelRead
+from ...schemas.model import ModelBatchRequest, ModelBatchResponse, ModelFacets, ModelRead
 from ...schemas.vendor import VendorRead
 from ...services.model_service import ModelService
-from ...services.search_service import ModelSearchParams, VendorQueryParams
+from ...services.search_service import ModelFieldsParams, ModelSearchParams, VendorQueryParams
 from ...services.vendor_service import VendorService
-from ...core.config import Settings, get_settings
-
-def get_vendor_service() -> VendorService:
-    return VendorService()
 
 router = APIRouter(prefix="/public", tags=["public"])
 
@@ -24,24 +31,16 @@ router = APIRouter(prefix="/public", tags=["public"])
     response_model_by_alias=False,
 )
 def list_vendors(
+    request: Request,
     params: VendorQueryParams = Depends(VendorQueryParams),
     repo: VendorRepository = Depends(VendorRepository),
     service: VendorService = Depends(get_vendor_service),
-    session=Depends(get_db),
+    session=Depends(get_read_db),
 ):
-    page = service.list_vendors(
-        session,
-        repository=repo,
-        status_filter=params.status,
-        search=params.search,
-        page=params.page,
-        page_size=params.page_size,
-    )
-    return PaginatedResponse(
-        items=[VendorRead.from_orm(vendor) for vendor in page.items],
-        total=page.total,
-        page=page.page,
-        page_size=page.page_size,
+    return cached_json_response(
+        request,
+        lambda: vendor_page_response(service.list_vendors(session, repository=repo, **vendor_query(params))),
+        session=session,
     )
 
 
@@ -51,40 +50,76 @@ def list_vendors(
     response_model_by_alias=False,
 )
 def list_models(
+    request: Request,
+    params: ModelSearchParams = Depends(ModelSearchParams),
+    fields: ModelFieldsParams = Depends(ModelFieldsParams),
+    repo: ModelRepository = Depends(ModelRepository),
+    service: ModelService = Depends(ModelService),
+    session=Depends(get_read_db),
+):
+    def build() -> bytes:
+        # Read-only fast path: plain rows spliced in as cached ModelRead JSON fragments.
+        page = service.list_models(session, repository=repo, as_rows=True, fields=fields.fields, **params.dict())
+        return encode_model_page(page, fields.fields)
+
+    return cached_json_response(request, build, session=session)
+
+
+@router.get("/models/facets", response_model=ModelFacets)
+def get_model_facets(
+    request: Request,
     params: ModelSearchParams = Depends(ModelSearchParams),
     repo: ModelRepository = Depends(ModelRepository),
     service: ModelService = Depends(ModelService),
-    session=Depends(get_db),
+    session=Depends(get_read_db),
 ):
-    page = service.list_models(session, repository=repo, **params.dict())
-    return PaginatedResponse[ModelRead](
-        items=[ModelRead.from_orm(model) for model in page.items],
-        total=page.total,
-        page=page.page,
-        page_size=page.page_size,
+    return cached_json_response(
+        request,
+        lambda: service.get_facets(session, repository=repo, **params.filters()),
+        session=session,
+        by_alias=True,
     )
 
 
+@router.get("/models/batch", response_model=ModelBatchResponse, response_model_by_alias=False)
+def get_models_batch(
+    request: Request,
+    ids: str = Query(..., description="Comma separated model ids"),
+    repo: ModelRepository = Depends(ModelRepository),
+    service: ModelService = Depends(ModelService),
+    session=Depends(get_read_db),
+):
+    model_ids = parse_batch_ids(ids)
+    return cached_json_response(
+        request, lambda: encode_batch(*service.get_model_rows(session, model_ids, repository=repo)), session=session
+    )
+
+
+@router.post("/models/batch", response_model=ModelBatchResponse, response_model_by_alias=False)
+def post_models_batch(
+    payload: ModelBatchRequest,
+    repo: ModelRepository = Depends(ModelRepository),
+    service: ModelService = Depends(ModelService),
+    session=Depends(get_read_db),
+):
+    body = encode_batch(*service.get_model_rows(session, payload.ids, repository=repo))
+    return Response(content=body, media_type="application/json")
+
+
 @router.get(
     "/models/{model_id}", response_model=ModelRead, response_model_by_alias=False
 )
 def get_model(
+    request: Request,
     model_id: int,
     repo: ModelRepository = Depends(ModelRepository),
     service: ModelService = Depends(ModelService),
-    session=Depends(get_db),
+    session=Depends(get_read_db),
 ):
-    model = service.get_model(session, model_id, repository=repo)
-    return ModelRead.from_orm(model)
-
-
-@router.get("/currency", response_model=CurrencyConfig)
-def get_currency_config(settings: Settings = Depends(get_settings)) -> CurrencyConfig:
-    exchange_rates = {code.upper(): float(rate) for code, rate in settings.currency_exchange_rates.items()}
-    display_currency = settings.display_currency.upper()
-    available = sorted(exchange_rates.keys())
-    return CurrencyConfig(
-        displayCurrency=display_currency,
-        exchangeRates=exchange_rates,
-        availableCurrencies=available,
+    return cached_json_response(
+        request, lambda: encode_model(*service.get_model_rows(session, [model_id], repository=repo)), session=session
     )
+
+
+# Shared with ``public_async``.
+router.add_api_route("/currency", get_currency_config, methods=["GET"], response_model=CurrencyConfig)
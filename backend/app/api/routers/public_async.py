@@ -0,0 +1,132 @@
+"""The public catalog routes as ``async def`` handlers on the async engine.
+
+Mounted instead of ``public`` when ``ASYNC_DATABASE_ENABLED`` is set: responses are identical, but
+requests waiting on the database are suspended on the event loop instead of each occupying a
+threadpool worker.
+"""
+from fastapi import APIRouter, Depends, Query, Request, Response
+
+from ...api.caching import cached_json_response_async
+from ...api.deps import get_async_db
+from ...api.public_common import (
+    encode_batch,
+    encode_model,
+    encode_model_page,
+    get_currency_config,
+    get_vendor_service,
+    parse_batch_ids,
+    vendor_page_response,
+    vendor_query,
+)
+from ...repositories.model_repository import AsyncModelRepository
+from ...repositories.vendor_repository import AsyncVendorRepository
+from ...schemas.common import PaginatedResponse
+from ...schemas.currency import CurrencyConfig
+from ...schemas.model import ModelBatchRequest, ModelBatchResponse, ModelFacets, ModelRead
+from ...schemas.vendor import VendorRead
+from ...services.model_service import ModelService
+from ...services.search_service import ModelFieldsParams, ModelSearchParams, VendorQueryParams
+from ...services.vendor_service import VendorService
+
+router = APIRouter(prefix="/public", tags=["public"])
+
+
+@router.get(
+    "/vendors",
+    response_model=PaginatedResponse[VendorRead],
+    response_model_by_alias=False,
+)
+async def list_vendors(
+    request: Request,
+    params: VendorQueryParams = Depends(VendorQueryParams),
+    repo: AsyncVendorRepository = Depends(AsyncVendorRepository),
+    service: VendorService = Depends(get_vendor_service),
+    session=Depends(get_async_db),
+):
+    async def build() -> PaginatedResponse[VendorRead]:
+        return vendor_page_response(await service.list_vendors_async(session, repository=repo, **vendor_query(params)))
+
+    return await cached_json_response_async(request, build, session=session)
+
+
+@router.get(
+    "/models",
+    response_model=PaginatedResponse[ModelRead],
+    response_model_by_alias=False,
+)
+async def list_models(
+    request: Request,
+    params: ModelSearchParams = Depends(ModelSearchParams),
+    fields: ModelFieldsParams = Depends(ModelFieldsParams),
+    repo: AsyncModelRepository = Depends(AsyncModelRepository),
+    service: ModelService = Depends(ModelService),
+    session=Depends(get_async_db),
+):
+    async def build() -> bytes:
+        page = await service.list_models_async(
+            session, repository=repo, as_rows=True, fields=fields.fields, **params.dict()
+        )
+        return encode_model_page(page, fields.fields)
+
+    return await cached_json_response_async(request, build, session=session)
+
+
+@router.get("/models/facets", response_model=ModelFacets)
+async def get_model_facets(
+    request: Request,
+    params: ModelSearchParams = Depends(ModelSearchParams),
+    repo: AsyncModelRepository = Depends(AsyncModelRepository),
+    service: ModelService = Depends(ModelService),
+    session=Depends(get_async_db),
+):
+    async def build() -> ModelFacets:
+        return await service.get_facets_async(session, repository=repo, **params.filters())
+
+    return await cached_json_response_async(request, build, session=session, by_alias=True)
+
+
+@router.get("/models/batch", response_model=ModelBatchResponse, response_model_by_alias=False)
+async def get_models_batch(
+    request: Request,
+    ids: str = Query(..., description="Comma separated model ids"),
+    repo: AsyncModelRepository = Depends(AsyncModelRepository),
+    service: ModelService = Depends(ModelService),
+    session=Depends(get_async_db),
+):
+    model_ids = parse_batch_ids(ids)
+
+    async def build() -> bytes:
+        return encode_batch(*await service.get_model_rows_async(session, model_ids, repository=repo))
+
+    return await cached_json_response_async(request, build, session=session)
+
+
+@router.post("/models/batch", response_model=ModelBatchResponse, response_model_by_alias=False)
+async def post_models_batch(
+    payload: ModelBatchRequest,
+    repo: AsyncModelRepository = Depends(AsyncModelRepository),
+    service: ModelService = Depends(ModelService),
+    session=Depends(get_async_db),
+):
+    body = encode_batch(*await service.get_model_rows_async(session, payload.ids, repository=repo))
+    return Response(content=body, media_type="application/json")
+
+
+@router.get(
+    "/models/{model_id}", response_model=ModelRead, response_model_by_alias=False
+)
+async def get_model(
+    request: Request,
+    model_id: int,
+    repo: AsyncModelRepository = Depends(AsyncModelRepository),
+    service: ModelService = Depends(ModelService),
+    session=Depends(get_async_db),
+):
+    async def build() -> bytes:
+        return encode_model(*await service.get_model_rows_async(session, [model_id], repository=repo))
+
+    return await cached_json_response_async(request, build, session=session)
+
+
+# No database access, so the sync handler is shared.
+router.add_api_route("/currency", get_currency_config, methods=["GET"], response_model=CurrencyConfig)
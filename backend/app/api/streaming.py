@@ -0,0 +1,88 @@
+import gzip
+import zlib
+from tempfile import SpooledTemporaryFile
+from typing import IO, Any, Iterable, Iterator
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+
+from .caching import encode_json
+
+# Uploads larger than this are spooled to a temporary file instead of memory.
+SPOOL_MAX_BYTES = 1024 * 1024
+
+# Encoded items are buffered into chunks of about this size before being written to the client.
+STREAM_CHUNK_BYTES = 64 * 1024
+
+MEDIA_TYPES = {"json": "application/json", "ndjson": "application/x-ndjson"}
+
+
+def _buffered(parts: Iterable[bytes]) -> Iterator[bytes]:
+    buffer = bytearray()
+    for part in parts:
+        buffer += part
+        if len(buffer) >= STREAM_CHUNK_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def _json_array(items: Iterable[Any]) -> Iterator[bytes]:
+    separator = b"["
+    for item in items:
+        yield separator
+        yield encode_json(jsonable_encoder(item))
+        separator = b","
+    yield b"[]" if separator == b"[" else b"]"
+
+
+def _ndjson(items: Iterable[Any]) -> Iterator[bytes]:
+    for item in items:
+        yield encode_json(jsonable_encoder(item)) + b"\n"
+
+
+def encode_stream(items: Iterable[Any], fmt: str) -> Iterator[bytes]:
+    """Encode ``items`` lazily as a JSON array (``json``) or one document per line (``ndjson``)."""
+    return _buffered(_ndjson(items) if fmt == "ndjson" else _json_array(items))
+
+
+def gzip_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Compress a byte stream into a single gzip member without buffering it whole."""
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+async def spool_request_body(request: Request) -> IO[bytes]:
+    """Copy the request body into a temporary file as it arrives, rewound and ready to read."""
+    spool = SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    async for chunk in request.stream():
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
+
+
+# Raised by ``gzip`` for bodies that are not gzip data, are truncated, or are corrupt.
+GZIP_ERRORS = (gzip.BadGzipFile, EOFError, zlib.error)
+
+
+def check_gzip(upload: IO[bytes]) -> None:
+    """Decompress ``upload`` once, discarding the output, so bad data fails before anything is imported.
+
+    Raises one of ``GZIP_ERRORS``; ``upload`` is rewound either way.
+    """
+    try:
+        with gzip.GzipFile(fileobj=upload, mode="rb") as stream:
+            while stream.read(STREAM_CHUNK_BYTES):
+                pass
+    finally:
+        upload.seek(0)
+
+
+def read_lines(upload: IO[bytes], compressed: bool = False) -> Iterator[bytes]:
+    """Lines of an uploaded body, gunzipped on the fly when ``compressed``."""
+    yield from gzip.GzipFile(fileobj=upload, mode="rb") if compressed else upload
@@ -0,0 +1,129 @@
+import time
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from ..models.catalog import CatalogState
+
+_CHANGED_KEY = "catalog_changed"
+_STATE_ID = 1
+# ``Session.info`` key naming the database a session reads: "primary" (the default) or "replica".
+CATALOG_SOURCE_KEY = "catalog_source"
+
+
+def catalog_source(session: Session) -> str:
+    return session.info.get(CATALOG_SOURCE_KEY, "primary")
+
+
+class CatalogVersion:
+    """Process-wide counter bumped whenever vendor/model data is written.
+
+    Caches key their entries by ``key(session)``, the current value plus the database the session
+    reads, so a bump invalidates all of them at once and replica reads never share entries with
+    primary reads. The persisted ``catalog_state`` row of each database is observed periodically
+    (see ``refresh``) so writes made by other processes, or replicated to a read replica, bump
+    this counter too.
+    """
+
+    def __init__(self) -> None:
+        self._value = 0
+        self._lock = Lock()
+        # Per source: last observed state and when it was read.
+        self._states: Dict[str, Tuple[Tuple[int, int], float]] = {}
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    @property
+    def state(self) -> Optional[Tuple[int, int]]:
+        """Last observed ``(version, modified_at)`` of the primary's persisted catalog state."""
+        observed = self._states.get("primary")
+        return observed[0] if observed else None
+
+    def key(self, session: Session) -> Tuple[int, str]:
+        return (self._value, catalog_source(session))
+
+    def current_key(self, session: Session, max_age: float) -> Tuple[int, str]:
+        """``key`` after a ``refresh``, for caches read outside the response cache."""
+        self.refresh(session, max_age)
+        return self.key(session)
+
+    def bump(self) -> int:
+        with self._lock:
+            self._value += 1
+            # Re-read the persisted states on the next refresh.
+            self._states = {source: (state, 0.0) for source, (state, _) in self._states.items()}
+            return self._value
+
+    def refresh(self, session: Session, max_age: float) -> Tuple[int, int]:
+        """Re-read the persisted state of the session's database if older than ``max_age`` seconds.
+
+        Any change bumps the counter, including the first observation of a source: entries cached
+        before it was read may predate writes made elsewhere.
+        """
+        source = catalog_source(session)
+        now = time.monotonic()
+        observed = self._states.get(source)
+        if observed is not None and now - observed[1] < max_age:
+            return observed[0]
+        state = read_catalog_state(session)
+        with self._lock:
+            previous = self._states.get(source)
+            if previous is None or state != previous[0]:
+                self._value += 1
+            self._states[source] = (state, now)
+        return state
+
+
+catalog_version = CatalogVersion()
+
+
+def read_catalog_state(session: Session) -> Tuple[int, int]:
+    row = session.get(CatalogState, _STATE_ID)
+    if row is None:
+        return (0, 0)
+    return (row.version, row.modified_at)
+
+
+def mark_catalog_changed(session: Session) -> None:
+    """Invalidate catalog caches now and again when the session's transaction ends.
+
+    Each change also advances the persisted ``catalog_state`` row, which commits or rolls back
+    together with the data. The second in-process bump drops anything cached from a concurrent
+    read that raced the commit.
+    """
+    session.info[_CHANGED_KEY] = True
+    session.connection().execute(
+        text(
+            "UPDATE catalog_state SET version = version + 1, modified_at = "
+            "CASE WHEN modified_at + 1 > :now THEN modified_at + 1 ELSE :now END WHERE id = :state_id"
+        ),
+        {"now": int(time.time()), "state_id": _STATE_ID},
+    )
+    catalog_version.bump()
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session: Session, flush_context) -> None:
+    catalog_objects = [
+        obj
+        for obj in (*session.new, *session.dirty, *session.deleted)
+        if not isinstance(obj, CatalogState)
+    ]
+    if catalog_objects:
+        mark_catalog_changed(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _on_execute(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        mark_catalog_changed(state.session)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _after_transaction_end(session: Session, transaction) -> None:
+    if transaction.parent is None and session.info.pop(_CHANGED_KEY, False):
+        catalog_version.bump()
@@ -9,6 +9,8 @@ class Settings(BaseSettings):
     environment: str = Field("development", env="ENVIRONMENT")
     database_url: str = Field("sqlite:///./app.db", env="DATABASE_URL")
     echo_sql: bool = Field(False, env="ECHO_SQL")
+    # Apply pending schema migrations at startup; disable when `python -m app.migrate` runs before deploy.
+    auto_migrate: bool = Field(True, env="AUTO_MIGRATE")
 
     secret_key: str = Field("change-me", env="SECRET_KEY")
     access_token_expire_minutes: int = Field(60 * 24, env="ACCESS_TOKEN_EXPIRE_MINUTES")
@@ -30,6 +32,51 @@ class Settings(BaseSettings):
     s3_signature_version: str = Field(default="s3v4", env="S3_SIGNATURE_VERSION")
     s3_upload_acl: Optional[str] = Field(default="public-read", env="S3_UPLOAD_ACL")
 
+    count_cache_size: int = Field(1024, env="COUNT_CACHE_SIZE")
+    facet_cache_size: int = Field(256, env="FACET_CACHE_SIZE")
+    response_cache_enabled: bool = Field(True, env="RESPONSE_CACHE_ENABLED")
+    response_cache_size: int = Field(1024, env="RESPONSE_CACHE_SIZE")
+    response_cache_ttl_seconds: float = Field(300, env="RESPONSE_CACHE_TTL_SECONDS")
+    model_fragment_cache_size: int = Field(10000, env="MODEL_FRAGMENT_CACHE_SIZE")
+    import_batch_size: int = Field(500, env="IMPORT_BATCH_SIZE")
+    import_chunk_size: int = Field(1000, env="IMPORT_CHUNK_SIZE")
+    import_job_workers: int = Field(1, env="IMPORT_JOB_WORKERS")
+    import_job_queue_size: int = Field(4, env="IMPORT_JOB_QUEUE_SIZE")
+    job_history_size: int = Field(100, env="JOB_HISTORY_SIZE")
+    export_batch_size: int = Field(1000, env="EXPORT_BATCH_SIZE")
+    catalog_version_poll_seconds: float = Field(1.0, env="CATALOG_VERSION_POLL_SECONDS")
+    # Connection pool of each engine (in-memory SQLite always uses a single connection).
+    db_pool_size: int = Field(5, env="DB_POOL_SIZE")
+    db_pool_max_overflow: int = Field(10, env="DB_POOL_MAX_OVERFLOW")
+    db_pool_timeout_seconds: float = Field(30.0, env="DB_POOL_TIMEOUT_SECONDS")
+    # Replace connections older than this; -1 keeps them.
+    db_pool_recycle_seconds: int = Field(-1, env="DB_POOL_RECYCLE_SECONDS")
+    db_pool_pre_ping: bool = Field(False, env="DB_POOL_PRE_PING")
+    db_pool_use_lifo: bool = Field(False, env="DB_POOL_USE_LIFO")
+    # Checkouts slower than this are logged as warnings.
+    db_pool_slow_checkout_ms: float = Field(100.0, env="DB_POOL_SLOW_CHECKOUT_MS")
+    # Read-only copy (replica, snapshot file) for public and admin reads; writes always use DATABASE_URL.
+    read_database_url: Optional[str] = Field(None, env="READ_DATABASE_URL")
+    # How long a client reads from the primary after an admin write, until the replica catches up.
+    read_your_writes_seconds: int = Field(10, env="READ_YOUR_WRITES_SECONDS")
+    # Serve the public catalog routes from ``async def`` handlers on an async engine (see core.database).
+    async_database_enabled: bool = Field(False, env="ASYNC_DATABASE_ENABLED")
+    # Defaults to DATABASE_URL with its async driver (aiosqlite, asyncpg).
+    async_database_url: Optional[str] = Field(None, env="ASYNC_DATABASE_URL")
+    # Only used with READ_DATABASE_URL, which it defaults to with the async driver.
+    async_read_database_url: Optional[str] = Field(None, env="ASYNC_READ_DATABASE_URL")
+    # SQLite connection profile, applied as PRAGMAs to every new connection (see core.database).
+    sqlite_pragmas_enabled: bool = Field(True, env="SQLITE_PRAGMAS_ENABLED")
+    sqlite_journal_mode: str = Field("WAL", env="SQLITE_JOURNAL_MODE")
+    sqlite_synchronous: str = Field("NORMAL", env="SQLITE_SYNCHRONOUS")
+    sqlite_busy_timeout_ms: int = Field(5000, env="SQLITE_BUSY_TIMEOUT_MS")
+    sqlite_mmap_size: int = Field(256 * 1024 * 1024, env="SQLITE_MMAP_SIZE")
+    # Negative values are KiB, positive values pages.
+    sqlite_cache_size: int = Field(-64 * 1024, env="SQLITE_CACHE_SIZE")
+    sqlite_temp_store: str = Field("MEMORY", env="SQLITE_TEMP_STORE")
+    sqlite_foreign_keys: bool = Field(True, env="SQLITE_FOREIGN_KEYS")
+    http_cache_control: str = Field("public, no-cache", env="HTTP_CACHE_CONTROL")
+
     display_currency: str = Field("USD", env="DISPLAY_CURRENCY")
     currency_exchange_rates: dict[str, float] = Field(
         default_factory=lambda: {"USD": 1.0}, env="CURRENCY_EXCHANGE_RATES"
@@ -77,6 +124,18 @@ class Settings(BaseSettings):
             return trimmed
         return value
 
+    @validator("sqlite_journal_mode", "sqlite_synchronous", "sqlite_temp_store", pre=True)
+    def validate_sqlite_pragma(cls, value: str, field):  # type: ignore[override]
+        allowed = {
+            "sqlite_journal_mode": {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"},
+            "sqlite_synchronous": {"OFF", "NORMAL", "FULL", "EXTRA"},
+            "sqlite_temp_store": {"DEFAULT", "FILE", "MEMORY"},
+        }[field.name]
+        normalized = str(value).strip().upper()
+        if normalized not in allowed:
+            raise ValueError(f"must be one of {', '.join(sorted(allowed))}")
+        return normalized
+
     @validator("display_currency", pre=True)
     def normalize_display_currency(cls, value: Optional[str]):  # type: ignore[override]
         if not value:
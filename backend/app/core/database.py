@@ -1,46 +1,326 @@
-from contextlib import contextmanager
-from typing import Generator
+import json
+import time
+from contextlib import asynccontextmanager, contextmanager
+from functools import partial
+from typing import Any, AsyncGenerator, Callable, Generator, List, Optional, Sequence, Tuple
 
-from sqlalchemy import inspect, text
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import event, func, insert, inspect, select, text
+from sqlalchemy.engine import Connection, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.schema import CreateIndex
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from .config import get_settings
-from ..models.model import Model
+from .catalog import CATALOG_SOURCE_KEY
+from .config import Settings, get_settings
+from .migrations import Migration, latest_version, migration_lock, run_migrations, schema_version
+from .pool import instrument, pool_options
+from ..models.catalog import CatalogState
+from ..models.model import MODEL_CONTENT_FIELDS, MODEL_NATURAL_KEY, MODEL_TAG_LINKS, Model
+from ..models.vendor import Vendor
+from ..repositories.search_index import model_search_index
+from ..utils.filters import decode_string_list
+from ..utils.hashing import content_hash
+from ..utils.pricing import PRICE_COLUMNS, decode_price_data, extract_price_columns
 
 settings = get_settings()
 
-connect_args = {"check_same_thread": False} if settings.database_url.startswith("sqlite") else {}
-engine = create_engine(settings.database_url, echo=settings.echo_sql, connect_args=connect_args)
+# Indexes from earlier releases, superseded by the indexes declared on the models.
+OBSOLETE_INDEXES = (
+    "ix_model_vendor_id",
+    "ix_model_model",
+    "ix_model_vendor_model_id",
+    "ix_model_release_date",
+    "ix_model_status",
+    "ix_vendor_name",
+)
 
 
-def init_db() -> None:
-    SQLModel.metadata.create_all(bind=engine)
-    _run_schema_migrations()
+def sqlite_pragmas(settings: Settings, *, read_only: bool = False) -> List[Tuple[str, Any]]:
+    """The configured SQLite profile as ``(pragma, value)`` pairs, empty when disabled.
 
+    ``read_only`` leaves out the journal mode, which only the writer of a database may change.
+    """
+    if not settings.sqlite_pragmas_enabled:
+        return []
+    pragmas: List[Tuple[str, Any]] = [
+        # First, so that switching the journal mode waits for other connections instead of failing.
+        ("busy_timeout", settings.sqlite_busy_timeout_ms),
+        ("journal_mode", settings.sqlite_journal_mode),
+        ("synchronous", settings.sqlite_synchronous),
+        ("mmap_size", settings.sqlite_mmap_size),
+        ("cache_size", settings.sqlite_cache_size),
+        ("temp_store", settings.sqlite_temp_store),
+        ("foreign_keys", "ON" if settings.sqlite_foreign_keys else "OFF"),
+    ]
+    if read_only:
+        pragmas = [(name, value) for name, value in pragmas if name != "journal_mode"]
+    return pragmas
 
-def _run_schema_migrations() -> None:
-    inspector = inspect(engine)
 
-    if not inspector.has_table(Model.__tablename__):
+def configure_sqlite(target: Engine, pragmas: Sequence[Tuple[str, Any]]) -> None:
+    """Apply ``pragmas`` to every connection ``target`` opens."""
+    if not pragmas:
         return
 
-    columns = {column["name"] for column in inspector.get_columns(Model.__tablename__)}
-
-    if "release_date" not in columns:
+    @event.listens_for(target, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
         try:
-            with engine.begin() as connection:
-                connection.execute(text("ALTER TABLE model ADD COLUMN release_date DATE"))
-        except SQLAlchemyError as exc:
-            # Re-raise with more context so startup failure is easier to triage
-            raise RuntimeError("Failed to apply schema migration adding model.release_date column") from exc
+            for name, value in pragmas:
+                cursor.execute(f"PRAGMA {name} = {value}")
+        finally:
+            cursor.close()
 
-    if "categories" not in columns:
-        try:
-            with engine.begin() as connection:
-                connection.execute(text("ALTER TABLE model ADD COLUMN categories VARCHAR"))
-        except SQLAlchemyError as exc:
-            raise RuntimeError("Failed to apply schema migration adding model.categories column") from exc
+
+def create_db_engine(url: str, settings: Settings, *, read_only: bool = False) -> Engine:
+    target = create_engine(
+        url,
+        echo=settings.echo_sql,
+        connect_args={"check_same_thread": False} if url.startswith("sqlite") else {},
+        json_serializer=partial(json.dumps, ensure_ascii=False),
+        **pool_options(url, settings),
+    )
+    if target.dialect.name == "sqlite":
+        configure_sqlite(target, sqlite_pragmas(settings, read_only=read_only))
+    return target
+
+
+engine = create_db_engine(settings.database_url, settings)
+# Catalog reads go here: a replica or snapshot when READ_DATABASE_URL is set, else the primary.
+read_engine = (
+    create_db_engine(settings.read_database_url, settings, read_only=True) if settings.read_database_url else engine
+)
+instrument("primary", engine, settings)
+if read_engine is not engine:
+    instrument("read", read_engine, settings)
+
+# Async drivers for a sync URL's backend.
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+
+def async_database_url(url: str, setting: str = "ASYNC_DATABASE_URL") -> str:
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        raise RuntimeError(f"No async driver known for {parsed.drivername!r}; set {setting}")
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def async_read_database_url(settings: Settings) -> str:
+    """``ASYNC_READ_DATABASE_URL``, or ``READ_DATABASE_URL`` with its async driver."""
+    return settings.async_read_database_url or async_database_url(
+        settings.read_database_url, "ASYNC_READ_DATABASE_URL"
+    )
+
+
+def create_async_db_engine(url: str, settings: Settings, *, read_only: bool = False) -> AsyncEngine:
+    """Async engine for ``url``, with the same SQLite profile as the sync engines."""
+    target = create_async_engine(
+        url,
+        echo=settings.echo_sql,
+        json_serializer=partial(json.dumps, ensure_ascii=False),
+        **pool_options(url, settings, is_async=True),
+    )
+    if target.dialect.name == "sqlite":
+        configure_sqlite(target.sync_engine, sqlite_pragmas(settings, read_only=read_only))
+    return target
+
+
+# Only created when the async read path is enabled, so its driver is an optional dependency.
+async_engine: Optional[AsyncEngine] = None
+async_read_engine: Optional[AsyncEngine] = None
+if settings.async_database_enabled:
+    async_engine = create_async_db_engine(
+        settings.async_database_url or async_database_url(settings.database_url), settings
+    )
+    # Like ``read_engine``: the read database when one is configured, else the primary.
+    async_read_engine = (
+        create_async_db_engine(async_read_database_url(settings), settings, read_only=True)
+        if settings.read_database_url
+        else async_engine
+    )
+    instrument("async", async_engine, settings)
+    if async_read_engine is not async_engine:
+        instrument("async_read", async_read_engine, settings)
+
+
+def init_db() -> None:
+    """Startup check: one version read (and a lookup of the search index table) when the schema is current.
+
+    A database that is behind is migrated in place when ``AUTO_MIGRATE`` is set (the default, for
+    single-process deployments). Otherwise startup fails until ``python -m app.migrate`` has run.
+    """
+    with engine.connect() as connection:
+        current = schema_version(connection)
+        if current >= SCHEMA_VERSION:
+            model_search_index.detect(connection)
+            return
+    if not settings.auto_migrate:
+        raise RuntimeError(
+            f"Database schema is at version {current} but this release needs {SCHEMA_VERSION}; "
+            "run `python -m app.migrate` first"
+        )
+    migrate()
+
+
+def migrate() -> List[Migration]:
+    """Bring the database to ``SCHEMA_VERSION`` and return the migrations applied by this call."""
+    applied = run_migrations(engine, MIGRATIONS)
+    # Also repairs an FTS index that drifted from the model table.
+    with migration_lock(engine) as connection:
+        model_search_index.ensure(connection)
+    return applied
+
+
+def _create_schema(connection: Connection) -> None:
+    SQLModel.metadata.create_all(bind=connection)
+    _insert_catalog_state(connection)
+
+
+def _has_table(name: str) -> Callable[[Connection], bool]:
+    return lambda connection: inspect(connection).has_table(name)
+
+
+def _has_column(name: str) -> Callable[[Connection], bool]:
+    def detect(connection: Connection) -> bool:
+        return name in {column["name"] for column in inspect(connection).get_columns(Model.__tablename__)}
+
+    return detect
+
+
+def _add_model_column(name: str, column_type: str) -> Callable[[Connection], None]:
+    return lambda connection: connection.execute(text(f"ALTER TABLE model ADD COLUMN {name} {column_type}"))
+
+
+def _create_model_tag_links(connection: Connection) -> None:
+    for link in MODEL_TAG_LINKS.values():
+        link.__table__.create(bind=connection)
+    _backfill_model_tags(connection)
+
+
+def _add_model_price_columns(connection: Connection) -> None:
+    for column in PRICE_COLUMNS:
+        connection.execute(text(f"ALTER TABLE model ADD COLUMN {column} FLOAT"))
+    _backfill_price_columns(connection)
+
+
+def _create_catalog_state(connection: Connection) -> None:
+    CatalogState.__table__.create(bind=connection)
+    _insert_catalog_state(connection)
+
+
+def _replace_catalog_indexes(connection: Connection) -> None:
+    """Swap the single-column indexes of earlier releases for the declared sort, filter and natural key indexes."""
+    _check_duplicate_models(connection)
+    for name in OBSOLETE_INDEXES:
+        connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    for table in (Vendor.__table__, Model.__table__):
+        for index in table.indexes:
+            connection.execute(CreateIndex(index, if_not_exists=True))
+
+
+def _add_model_content_hash(connection: Connection) -> None:
+    connection.execute(text("ALTER TABLE model ADD COLUMN content_hash VARCHAR"))
+    _backfill_content_hashes(connection)
+
+
+def _check_duplicate_models(connection: Connection) -> None:
+    """Refuse to migrate while rows would violate the unique ``(vendor_id, lower(vendor_model_id))`` index."""
+    key = [column.label(f"key_{index}") for index, column in enumerate(MODEL_NATURAL_KEY)]
+    duplicates = connection.execute(
+        select(*key, func.count().label("rows"))
+        .where(Model.vendor_model_id.is_not(None))
+        .group_by(*MODEL_NATURAL_KEY)
+        .having(func.count() > 1)
+        .limit(10)
+    ).all()
+    if duplicates:
+        listed = ", ".join(f"vendor {row.key_0} / {row.key_1!r} ({row.rows} rows)" for row in duplicates)
+        raise RuntimeError(
+            f"Duplicate models prevent creating the unique vendor model id index; merge or delete them first: {listed}"
+        )
+
+
+def _normalize_model_json_columns(connection: Connection) -> None:
+    """Rewrite the JSON columns of ``model`` as single-encoded JSON.
+
+    Older releases stored JSON text that was sometimes encoded twice; values are decoded with the
+    same rules the read path used to apply on every request. Empty lists and undecodable values
+    become NULL.
+    """
+    list_fields = list(MODEL_TAG_LINKS)
+    rows = connection.execute(text(f"SELECT id, price_data, {', '.join(list_fields)} FROM model")).all()
+    params = []
+    for row in rows:
+        values = {field: decode_string_list(getattr(row, field)) or None for field in list_fields}
+        values["price_data"] = decode_price_data(row.price_data)
+        encoded = {
+            field: json.dumps(value, ensure_ascii=False) if value is not None else None
+            for field, value in values.items()
+        }
+        if any(encoded[field] != getattr(row, field) for field in encoded):
+            params.append({"model_id": row.id, **encoded})
+    if params:
+        assignments = ", ".join(f"{field} = :{field}" for field in ["price_data", *list_fields])
+        connection.execute(text(f"UPDATE model SET {assignments} WHERE id = :model_id"), params)
+
+
+def _backfill_content_hashes(connection: Connection) -> None:
+    content_columns = [Model.__table__.c[field] for field in MODEL_CONTENT_FIELDS]
+    rows = connection.execute(select(Model.__table__.c.id, *content_columns)).mappings().all()
+    params = [{"model_id": row["id"], "content_hash": content_hash(row, MODEL_CONTENT_FIELDS)} for row in rows]
+    if params:
+        connection.execute(text("UPDATE model SET content_hash = :content_hash WHERE id = :model_id"), params)
+
+
+def _insert_catalog_state(connection: Connection) -> None:
+    connection.execute(insert(CatalogState).values(id=1, version=0, modified_at=int(time.time())))
+
+
+def _backfill_price_columns(connection: Connection) -> None:
+    rows = connection.execute(
+        text("SELECT id, price_model, price_data FROM model WHERE price_data IS NOT NULL")
+    ).all()
+    params = [
+        {"model_id": row.id, **extract_price_columns(row.price_model, row.price_data)}
+        for row in rows
+    ]
+    if params:
+        assignments = ", ".join(f"{column} = :{column}" for column in PRICE_COLUMNS)
+        connection.execute(text(f"UPDATE model SET {assignments} WHERE id = :model_id"), params)
+
+
+def _backfill_model_tags(connection: Connection) -> None:
+    """Populate the new tag association tables from the JSON list columns."""
+    fields = list(MODEL_TAG_LINKS)
+    rows = connection.execute(text(f"SELECT id, {', '.join(fields)} FROM model")).all()
+    for field, link in MODEL_TAG_LINKS.items():
+        params = [
+            {"model_id": row.id, "value": value}
+            for row in rows
+            for value in decode_string_list(getattr(row, field))
+        ]
+        if params:
+            connection.execute(insert(link), params)
+
+
+# Add new migrations at the end with the next version; never change an applied one. ``detect`` is
+# only needed by the changes that databases from before versioning may already have.
+MIGRATIONS = [
+    Migration(1, "create_schema", _create_schema, detect=_has_table(Model.__tablename__)),
+    Migration(
+        2, "add_model_release_date", _add_model_column("release_date", "DATE"), detect=_has_column("release_date")
+    ),
+    Migration(3, "add_model_categories", _add_model_column("categories", "VARCHAR"), detect=_has_column("categories")),
+    Migration(4, "normalize_model_json_columns", _normalize_model_json_columns),
+    Migration(5, "create_model_tag_links", _create_model_tag_links),
+    Migration(6, "add_model_price_columns", _add_model_price_columns),
+    Migration(7, "add_model_content_hash", _add_model_content_hash),
+    Migration(8, "create_catalog_state", _create_catalog_state),
+    Migration(9, "replace_catalog_indexes", _replace_catalog_indexes),
+]
+SCHEMA_VERSION = latest_version(MIGRATIONS)
 
 
 @contextmanager
@@ -59,3 +339,40 @@ def session_context() -> Generator[Session, None, None]:
 def get_session() -> Generator[Session, None, None]:
     with session_context() as session:
         yield session
+
+
+@contextmanager
+def read_session_context(primary: bool = False) -> Generator[Session, None, None]:
+    """A session for catalog reads on ``read_engine``, or on the primary when ``primary`` is set.
+
+    Used for read-your-writes: a client that just wrote reads from the primary until the
+    replica has caught up.
+    """
+    bind = engine if primary else read_engine
+    session = Session(bind=bind)
+    session.info[CATALOG_SOURCE_KEY] = "primary" if bind is engine else "replica"
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def get_read_session(primary: bool = False) -> Generator[Session, None, None]:
+    with read_session_context(primary) as session:
+        yield session
+
+
+@asynccontextmanager
+async def async_session_context(primary: bool = False) -> AsyncGenerator[AsyncSession, None]:
+    """``read_session_context`` on the async engines."""
+    if async_engine is None:
+        raise RuntimeError("The async database is not enabled (ASYNC_DATABASE_ENABLED)")
+    bind = async_engine if primary else async_read_engine
+    async with AsyncSession(bind, expire_on_commit=False) as session:
+        session.info[CATALOG_SOURCE_KEY] = "primary" if bind is async_engine else "replica"
+        yield session
+
+
+async def get_async_session(primary: bool = False) -> AsyncGenerator[AsyncSession, None]:
+    async with async_session_context(primary) as session:
+        yield session
@@ -0,0 +1,109 @@
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from threading import Lock
+from typing import Any, Callable, Dict, Optional
+
+from .config import get_settings
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class JobQueueFull(Exception):
+    """Raised when a job is submitted while the queue already holds ``max_pending`` jobs."""
+
+
+class Job:
+    """State of one background job, written by its worker and read by the status endpoint."""
+
+    def __init__(self, kind: str, total: Optional[int] = None) -> None:
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = "queued"
+        self.total = total
+        self.processed = 0
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.created_at = datetime.utcnow()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("succeeded", "failed")
+
+    @property
+    def duration_seconds(self) -> Optional[float]:
+        if self.started_at is None:
+            return None
+        return ((self.finished_at or datetime.utcnow()) - self.started_at).total_seconds()
+
+
+class JobRunner:
+    """Runs jobs on a dedicated, bounded thread pool and keeps their state in memory.
+
+    The pool is separate from the threads serving requests, so long jobs cannot starve the API.
+    At most ``max_pending`` jobs wait for a worker; further submissions raise ``JobQueueFull``.
+    Only the latest ``history`` finished jobs are kept. State is per process.
+    """
+
+    def __init__(self, workers: int, max_pending: int, history: int) -> None:
+        self.workers = workers
+        self.max_pending = max_pending
+        self.history = history
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._pending = 0
+        self._lock = Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def submit(self, kind: str, work: Callable[[Job], Optional[Dict[str, Any]]], total: Optional[int] = None) -> Job:
+        """Queue ``work(job)``; its return value becomes the job's result."""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise JobQueueFull(f"{self._pending} jobs are already waiting")
+            job = Job(kind, total)
+            self._jobs[job.id] = job
+            self._pending += 1
+            self._prune()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job")
+            executor = self._executor
+        executor.submit(self._run, job, work)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job: Job, work: Callable[[Job], Optional[Dict[str, Any]]]) -> None:
+        with self._lock:
+            self._pending -= 1
+        job.status = "running"
+        job.started_at = datetime.utcnow()
+        try:
+            result = work(job)
+            if result is not None:
+                job.result = result
+            job.status = "succeeded"
+        except Exception as exc:  # noqa: BLE001 - surfaced through the job status
+            logger.exception("Job %s (%s) failed", job.id, job.kind)
+            job.error = str(exc) or exc.__class__.__name__
+            job.status = "failed"
+        finally:
+            job.finished_at = datetime.utcnow()
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(len(finished) - self.history, 0)]:
+            del self._jobs[job_id]
+
+
+_settings = get_settings()
+import_jobs = JobRunner(_settings.import_job_workers, _settings.import_job_queue_size, _settings.job_history_size)
@@ -0,0 +1,129 @@
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Generator, List, NamedTuple, Optional, Sequence, Set
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.schema import CreateTable
+
+from ..models.migration import SchemaMigration
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+# Arbitrary key of the PostgreSQL advisory lock held while migrating.
+_POSTGRES_LOCK_KEY = 0x6D7068
+
+
+class Migration(NamedTuple):
+    """One schema version. ``apply`` runs in the transaction that records it, so it is all or nothing.
+
+    The first migration creates the current schema from the models, so on an empty database it is
+    the only one applied and every later version is recorded with it.
+
+    ``detect`` tells whether a database from before versioning already has the change. Such a
+    database is adopted once by recording the versions it has; the rest are applied as usual.
+    """
+
+    version: int
+    name: str
+    apply: Callable[[Connection], None]
+    detect: Optional[Callable[[Connection], bool]] = None
+
+
+def schema_version(connection: Connection) -> int:
+    """Highest applied migration version; 0 for a new database or one that predates versioning."""
+    try:
+        return connection.execute(select(func.max(SchemaMigration.version))).scalar() or 0
+    except SQLAlchemyError:
+        # No schema_migration table yet.
+        connection.rollback()
+        return 0
+
+
+def latest_version(migrations: Sequence[Migration]) -> int:
+    return max((migration.version for migration in migrations), default=0)
+
+
+def run_migrations(engine: Engine, migrations: Sequence[Migration]) -> List[Migration]:
+    """Apply the pending ``migrations`` in version order and return the ones this call applied.
+
+    Each migration runs under ``migration_lock`` and re-reads the applied versions there, so
+    concurrent runs apply each version once and the others skip it.
+    """
+    ordered = sorted(migrations, key=lambda migration: migration.version)
+    applied: List[Migration] = []
+    with migration_lock(engine) as connection:
+        if not _applied_versions(connection):
+            applied.extend(_start(connection, ordered))
+    for migration in ordered:
+        with migration_lock(engine) as connection:
+            if migration.version in _applied_versions(connection):
+                continue
+            logger.info("Applying schema migration %s (%s)", migration.version, migration.name)
+            try:
+                migration.apply(connection)
+            except SQLAlchemyError as exc:
+                # Re-raise with the migration named so a failed startup is easier to triage.
+                raise RuntimeError(f"Failed to apply schema migration {migration.version} ({migration.name})") from exc
+            _record(connection, [migration])
+        applied.append(migration)
+    return applied
+
+
+@contextmanager
+def migration_lock(engine: Engine) -> Generator[Connection, None, None]:
+    """A transaction holding the database's migration lock, committed on success.
+
+    The lock is ``BEGIN IMMEDIATE`` on SQLite and an advisory lock on PostgreSQL. The
+    ``schema_migration`` table is created under it, so a fresh database can be migrated by
+    several processes at once.
+    """
+    with engine.connect() as connection:
+        _lock(connection)
+        try:
+            connection.execute(CreateTable(SchemaMigration.__table__, if_not_exists=True))
+            yield connection
+        except BaseException:
+            connection.rollback()
+            raise
+        connection.commit()
+
+
+def _start(connection: Connection, migrations: Sequence[Migration]) -> List[Migration]:
+    """Record the versions of an unversioned database, creating the schema if it is empty."""
+    first = migrations[0]
+    if first.detect is not None and first.detect(connection):
+        present = [migration for migration in migrations if migration.detect is not None and migration.detect(connection)]
+        logger.info("Adopting an unversioned database at versions %s", [migration.version for migration in present])
+        _record(connection, present)
+        return []
+    logger.info("Creating the schema at version %s", latest_version(migrations))
+    first.apply(connection)
+    _record(connection, migrations)
+    return list(migrations)
+
+
+def _applied_versions(connection: Connection) -> Set[int]:
+    return set(connection.execute(select(SchemaMigration.version)).scalars())
+
+
+def _record(connection: Connection, migrations: Sequence[Migration]) -> None:
+    if migrations:
+        connection.execute(
+            insert(SchemaMigration),
+            [
+                {"version": migration.version, "name": migration.name, "applied_at": datetime.utcnow()}
+                for migration in migrations
+            ],
+        )
+
+
+def _lock(connection: Connection) -> None:
+    if connection.dialect.name == "sqlite":
+        # pysqlite only opens a transaction before DML; an explicit BEGIN also covers the DDL and
+        # takes the write lock up front.
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+    elif connection.dialect.name == "postgresql":
+        connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _POSTGRES_LOCK_KEY})
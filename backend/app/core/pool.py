@@ -0,0 +1,195 @@
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from threading import Lock
+from typing import Any, Dict, List, Optional, Union
+
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, PoolProxiedConnection, QueuePool
+from sqlalchemy.util.queue import AsyncAdaptedQueue, Queue
+
+from .config import Settings
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+# Upper bounds (milliseconds) of the checkout wait histogram buckets; slower checkouts count as "inf".
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Time the checkout in progress has spent blocked on the pool's queue, per thread or asyncio task.
+_queue_waits: ContextVar[Optional[List[float]]] = ContextVar("pool_queue_waits", default=None)
+
+
+class PoolStats:
+    """Checkout counters and a wait-time histogram for one engine's connection pool."""
+
+    def __init__(self, name: str, slow_checkout_ms: float) -> None:
+        self.name = name
+        self.slow_checkout_ms = slow_checkout_ms
+        self._lock = Lock()
+        self.checkouts = 0
+        self.slow_checkouts = 0
+        self.timeouts = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def record(self, pool: Pool, waited_ms: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait_ms += waited_ms
+            self.max_wait_ms = max(self.max_wait_ms, waited_ms)
+            self.buckets[bisect_left(WAIT_BUCKETS_MS, waited_ms)] += 1
+            if timed_out:
+                self.timeouts += 1
+            elif waited_ms >= self.slow_checkout_ms:
+                self.slow_checkouts += 1
+        if timed_out or waited_ms >= self.slow_checkout_ms:
+            logger.warning(
+                "%s a %s database connection after %.0f ms (%s)",
+                "Timed out waiting for" if timed_out else "Checked out",
+                self.name,
+                waited_ms,
+                pool.status(),
+            )
+
+    def snapshot(self, pool: Pool) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {"pool": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            stats.update(
+                size=pool.size(),
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                # QueuePool counts from -size; only connections beyond ``size`` are overflow.
+                overflow=max(pool.overflow(), 0),
+                timeout_seconds=pool.timeout(),
+            )
+        with self._lock:
+            stats.update(
+                checkouts=self.checkouts,
+                slow_checkouts=self.slow_checkouts,
+                timeouts=self.timeouts,
+                wait_ms={
+                    "avg": round(self.total_wait_ms / self.checkouts, 3) if self.checkouts else None,
+                    "max": round(self.max_wait_ms, 3),
+                    "histogram": {
+                        **{str(bound): count for bound, count in zip(WAIT_BUCKETS_MS, self.buckets)},
+                        "inf": self.buckets[-1],
+                    },
+                },
+            )
+        return stats
+
+
+class _TimedQueue:
+    """Adds the time a blocking ``get`` waits for a returned connection to the running checkout."""
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        waits = _queue_waits.get()
+        if waits is None or not block:
+            return super().get(block, timeout)  # type: ignore[misc]
+        started = time.perf_counter()
+        try:
+            return super().get(block, timeout)  # type: ignore[misc]
+        finally:
+            waits.append((time.perf_counter() - started) * 1000)
+
+
+class _TimedSyncQueue(_TimedQueue, Queue):
+    pass
+
+
+class _TimedAsyncQueue(_TimedQueue, AsyncAdaptedQueue):
+    pass
+
+
+class _InstrumentedPool:
+    """Records every checkout into ``stats`` with the time it waited for a free connection.
+
+    Only the wait on the pool's queue counts: opening a new connection (and its pragmas) or a
+    pre-ping is not waiting for the pool.
+    """
+
+    stats: Optional[PoolStats] = None
+
+    def connect(self) -> PoolProxiedConnection:
+        waits: List[float] = []
+        token = _queue_waits.set(waits)
+        try:
+            connection = super().connect()  # type: ignore[misc]
+        except PoolTimeoutError:
+            if self.stats is not None:
+                self.stats.record(self, sum(waits), timed_out=True)  # type: ignore[arg-type]
+            raise
+        finally:
+            _queue_waits.reset(token)
+        if self.stats is not None:
+            self.stats.record(self, sum(waits))  # type: ignore[arg-type]
+        return connection
+
+    def recreate(self) -> Pool:
+        # ``engine.dispose()`` swaps in a fresh pool; keep counting into the same stats.
+        pool = super().recreate()  # type: ignore[misc]
+        pool.stats = self.stats
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPool, QueuePool):
+    _queue_class = _TimedSyncQueue
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPool, AsyncAdaptedQueuePool):
+    _queue_class = _TimedAsyncQueue
+
+
+# Instrumented engines by name, for the admin system endpoint.
+engines: Dict[str, Engine] = {}
+
+
+def pool_options(url: str, settings: Settings, *, is_async: bool = False) -> Dict[str, Any]:
+    """``create_engine`` pool arguments for ``url`` from the ``DB_POOL_*`` settings.
+
+    In-memory SQLite keeps SQLAlchemy's single-connection pool: every connection would otherwise
+    be a separate, empty database.
+    """
+    options: Dict[str, Any] = {
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+    }
+    if _is_memory_sqlite(url):
+        return options
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_pool_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_use_lifo=settings.db_pool_use_lifo,
+    )
+    return options
+
+
+def instrument(name: str, target: Union[Engine, AsyncEngine], settings: Settings) -> None:
+    """Register ``target`` under ``name`` and start recording its checkouts."""
+    sync_engine = target.sync_engine if isinstance(target, AsyncEngine) else target
+    if isinstance(sync_engine.pool, _InstrumentedPool):
+        sync_engine.pool.stats = PoolStats(name, settings.db_pool_slow_checkout_ms)
+    engines[name] = sync_engine
+
+
+def pool_stats() -> Dict[str, Dict[str, Any]]:
+    stats: Dict[str, Dict[str, Any]] = {}
+    for name, target in engines.items():
+        pool = target.pool
+        recorder = getattr(pool, "stats", None)
+        stats[name] = recorder.snapshot(pool) if recorder is not None else {"pool": type(pool).__name__}
+    return stats
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite":
+        return False
+    database = parsed.database or ""
+    return database in ("", ":memory:") or parsed.query.get("mode") == "memory"
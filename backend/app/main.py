@@ -1,16 +1,32 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from .api.routers import admin_auth, admin_models, admin_vendors, public, uploads
+from .api.replica import READ_PRIMARY_SECONDS_HEADER, ReadYourWritesMiddleware
+from .api.routers import admin_auth, admin_jobs, admin_models, admin_system, admin_vendors, public, public_async, uploads
 from .core.config import get_settings
+from .core import database
 from .core.database import init_db
+from .core.jobs import import_jobs
 from .core.logging import configure_logging
 
 configure_logging()
 settings = get_settings()
 init_db()
 
-app = FastAPI(title="Model Price Hub", openapi_url="/api/openapi.json")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    import_jobs.shutdown()
+    for async_engine in (database.async_engine, database.async_read_engine):
+        if async_engine is not None:
+            await async_engine.dispose()
+
+
+app = FastAPI(title="Model Price Hub", openapi_url="/api/openapi.json", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -18,13 +34,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Read by the admin UI on another origin to keep its reads on the primary after a write.
+    expose_headers=[READ_PRIMARY_SECONDS_HEADER],
 )
+app.add_middleware(ReadYourWritesMiddleware)
 
 app.include_router(admin_auth.router, prefix="/api")
 app.include_router(admin_vendors.router, prefix="/api")
 app.include_router(admin_models.router, prefix="/api")
-app.include_router(public.router, prefix="/api")
+app.include_router(public_async.router if settings.async_database_enabled else public.router, prefix="/api")
 app.include_router(uploads.router, prefix="/api")
+app.include_router(admin_system.router, prefix="/api")
+app.include_router(admin_jobs.router, prefix="/api")
 
 
 @app.get("/api/health")
@@ -0,0 +1,20 @@
+"""Apply pending schema migrations, as a deploy step before the workers start.
+
+Run from ``backend/``::
+
+    python -m app.migrate
+"""
+from .core.database import SCHEMA_VERSION, migrate
+from .core.logging import configure_logging
+
+
+def main() -> None:
+    configure_logging()
+    applied = migrate()
+    if applied:
+        print(f"Applied {', '.join(f'{migration.version} ({migration.name})' for migration in applied)}")
+    print(f"Schema is at version {SCHEMA_VERSION}")
+
+
+if __name__ == "__main__":
+    main()
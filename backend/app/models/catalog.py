@@ -0,0 +1,16 @@
+from sqlmodel import Field
+
+from .base import DBModel
+
+
+class CatalogState(DBModel, table=True):
+    """Single-row table (``id = 1``) versioning the vendor/model catalog.
+
+    Every write transaction increments ``version`` and moves ``modified_at`` (Unix seconds)
+    strictly forward, so processes sharing the database can detect each other's writes.
+    """
+
+    __tablename__ = "catalog_state"
+
+    version: int = Field(default=0, nullable=False)
+    modified_at: int = Field(default=0, nullable=False)
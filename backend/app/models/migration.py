@@ -0,0 +1,13 @@
+from datetime import datetime
+
+from sqlmodel import Field, SQLModel
+
+
+class SchemaMigration(SQLModel, table=True):
+    """A versioned schema migration applied to this database; the highest is its schema version."""
+
+    __tablename__ = "schema_migration"
+
+    version: int = Field(primary_key=True, sa_column_kwargs={"autoincrement": False})
+    name: str
+    applied_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
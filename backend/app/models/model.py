@@ -1,9 +1,12 @@
 from datetime import date
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
-from sqlmodel import Field, Relationship
+from sqlalchemy import JSON, Index, case, func, literal_column, text
+from sqlmodel import Field, Relationship, SQLModel
 
+from ..utils import hashing
+from ..utils.pricing import PRICE_COLUMNS
 from .base import DBModel, TimestampMixin
 
 
@@ -16,25 +19,105 @@ class ModelStatus(str, Enum):
 class Model(DBModel, TimestampMixin, table=True):
     __tablename__ = "model"
 
-    vendor_id: int = Field(foreign_key="vendor.id", index=True)
-    model: str = Field(index=True)
-    vendor_model_id: Optional[str] = Field(default=None, index=True)
+    vendor_id: int = Field(foreign_key="vendor.id")
+    model: str
+    vendor_model_id: Optional[str] = None
     description: Optional[str] = None
     model_image: Optional[str] = None
     max_context_tokens: Optional[int] = None
     max_output_tokens: Optional[int] = None
-    model_capability: Optional[str] = None
+    model_capability: Optional[List[str]] = Field(default=None, sa_type=JSON(none_as_null=True))
     model_url: Optional[str] = None
     price_model: Optional[str] = None
     price_currency: Optional[str] = None
-    price_data: Optional[str] = None
-    categories: Optional[str] = Field(default=None, sa_column_kwargs={"nullable": True})
-    release_date: Optional[date] = Field(default=None, index=True)
+    price_data: Optional[dict] = Field(default=None, sa_type=JSON(none_as_null=True))
+    # Derived from price_model/price_data at write time (see utils.pricing) so price sorts run in SQL.
+    price_headline: Optional[float] = None
+    price_input: Optional[float] = None
+    price_output: Optional[float] = None
+    price_per_call: Optional[float] = None
+    categories: Optional[List[str]] = Field(default=None, sa_type=JSON(none_as_null=True))
+    release_date: Optional[date] = None
     note: Optional[str] = None
-    license: Optional[str] = None
-    status: ModelStatus = Field(default=ModelStatus.enabled, index=True)
+    license: Optional[List[str]] = Field(default=None, sa_type=JSON(none_as_null=True))
+    status: ModelStatus = Field(default=ModelStatus.enabled)
+    # Hash of MODEL_CONTENT_FIELDS; imports compare it to skip rows that would not change.
+    content_hash: Optional[str] = None
 
     vendor: "Vendor" = Relationship(back_populates="models")
 
+    def compute_content_hash(self) -> str:
+        return hashing.content_hash({field: getattr(self, field) for field in MODEL_CONTENT_FIELDS}, MODEL_CONTENT_FIELDS)
+
+
+# Editable fields: everything except keys, timestamps, the hash itself and the derived price columns.
+MODEL_CONTENT_FIELDS = tuple(
+    column.name
+    for column in Model.__table__.c
+    if column.name not in ("id", "created_at", "updated_at", "content_hash", *PRICE_COLUMNS)
+)
+
+# ORDER BY prefix that sorts models without a price last in ascending price order.
+PRICE_MISSING_FIRST_KEY = case((Model.price_headline.is_(None), literal_column("1")), else_=literal_column("0"))
+
+# Listings filtered with ``status=enabled`` (rendered inline, see ModelRepository) can use the
+# smaller partial indexes below.
+ENABLED_MODELS = text("status = 'enabled'")
+
+# Sort keys of ``ModelRepository.search``; each ends with ``id`` to match the keyset tiebreaker.
+_SORT_INDEX_COLUMNS = {
+    "model": lambda: (func.lower(Model.model), Model.id),
+    "created_at": lambda: (Model.created_at, Model.id),
+    "updated_at": lambda: (Model.updated_at, Model.id),
+    "release_date": lambda: (Model.release_date, Model.id),
+    "price_asc": lambda: (PRICE_MISSING_FIRST_KEY, Model.price_headline, Model.id),
+    # Scanned backwards for price_desc, which leaves NULL prices last.
+    "price_desc": lambda: (Model.price_headline, Model.id),
+}
+for _name, _columns in _SORT_INDEX_COLUMNS.items():
+    Index(f"ix_model_sort_{_name}", *_columns())
+    Index(
+        f"ix_model_enabled_sort_{_name}",
+        *_columns(),
+        sqlite_where=ENABLED_MODELS,
+        postgresql_where=ENABLED_MODELS,
+    )
+
+Index("ix_model_vendor_id_status", Model.vendor_id, Model.status)
+# Natural key of a model: vendor model ids are unique per vendor, case-insensitively. Also the
+# conflict target of ``ModelRepository.upsert``.
+MODEL_NATURAL_KEY = (Model.vendor_id, func.lower(Model.vendor_model_id))
+Index("uq_model_vendor_id_lower_vendor_model_id", *MODEL_NATURAL_KEY, unique=True)
+
+
+class ModelTagLink(SQLModel):
+    """Exact-match value of a list attribute (capability, license, category) of a model."""
+
+    model_id: int = Field(foreign_key="model.id", primary_key=True)
+    value: str = Field(primary_key=True)
+
+
+class ModelCapabilityLink(ModelTagLink, table=True):
+    __tablename__ = "model_capability_link"
+    __table_args__ = (Index("ix_model_capability_link_value_model_id", "value", "model_id"),)
+
+
+class ModelLicenseLink(ModelTagLink, table=True):
+    __tablename__ = "model_license_link"
+    __table_args__ = (Index("ix_model_license_link_value_model_id", "value", "model_id"),)
+
+
+class ModelCategoryLink(ModelTagLink, table=True):
+    __tablename__ = "model_category_link"
+    __table_args__ = (Index("ix_model_category_link_value_model_id", "value", "model_id"),)
+
+
+# Maps each JSON list column on ``Model`` to the association table mirroring it.
+MODEL_TAG_LINKS: dict[str, type[ModelTagLink]] = {
+    "model_capability": ModelCapabilityLink,
+    "license": ModelLicenseLink,
+    "categories": ModelCategoryLink,
+}
+
 
 from .vendor import Vendor  # noqa: E402
@@ -1,6 +1,7 @@
 from enum import Enum
 from typing import Optional
 
+from sqlalchemy import Index, func
 from sqlmodel import Field, Relationship
 
 from .base import DBModel, TimestampMixin
@@ -14,7 +15,7 @@ class VendorStatus(str, Enum):
 class Vendor(DBModel, TimestampMixin, table=True):
     __tablename__ = "vendor"
 
-    name: str = Field(index=True)
+    name: str
     description: Optional[str] = None
     vendor_image: Optional[str] = None
     url: Optional[str] = None
@@ -25,4 +26,7 @@ class Vendor(DBModel, TimestampMixin, table=True):
     models: list["Model"] = Relationship(back_populates="vendor", sa_relationship_kwargs={"cascade": "all, delete"})
 
 
+Index("ix_vendor_lower_name", func.lower(Vendor.name))
+
+
 from .model import Model  # noqa: E402  # circular import fix
@@ -1,16 +1,55 @@
-from typing import Generic, Optional, Sequence, Type, TypeVar
+from typing import Any, Generic, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Type, TypeVar
 
+from sqlalchemy import func
+from sqlalchemy.sql import Select
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from ..core.cache import LRUCache, filter_hash
+from ..core.catalog import catalog_version
+from ..core.config import get_settings
 from ..models.base import DBModel
 
 ModelType = TypeVar("ModelType", bound=DBModel)
+RepositoryType = TypeVar("RepositoryType", bound="BaseRepository")
+
+# Totals of filtered listings, keyed by (table, catalog version, filter hash).
+count_cache = LRUCache(get_settings().count_cache_size)
+
+
+def chunks(items: Sequence[Any], size: int) -> Iterator[List[Any]]:
+    """Split ``items`` into lists of at most ``size`` elements (bounds IN lists and executemany batches)."""
+    for start in range(0, len(items), size):
+        yield list(items[start : start + size])
+
+
+class SearchResult(NamedTuple):
+    items: Sequence[Any]
+    total: Optional[int]
+    has_more: bool
+    next_cursor: Optional[str] = None
 
 
 class BaseRepository(Generic[ModelType]):
     def __init__(self, model: Type[ModelType]):
         self.model = model
 
+    def count(self, session: Session, statement: Select, filters: Mapping[str, Any]) -> int:
+        """Count rows of ``statement``, cached until the catalog version changes."""
+        key = (
+            self.model.__tablename__,
+            *catalog_version.current_key(session, get_settings().catalog_version_poll_seconds),
+            filter_hash(filters),
+        )
+        cached = count_cache.get(key)
+        if cached is not None:
+            return cached
+        count_stmt = select(func.count()).select_from(statement.subquery())
+        total_result = session.exec(count_stmt).one()
+        total = int(total_result[0] if isinstance(total_result, tuple) else total_result)
+        count_cache.set(key, total)
+        return total
+
     def get(self, session: Session, obj_id: int) -> Optional[ModelType]:
         return session.get(self.model, obj_id)
 
@@ -29,11 +68,33 @@ class BaseRepository(Generic[ModelType]):
         session.flush()
 
     def update(self, session: Session, obj: ModelType, data: dict) -> ModelType:
+        """Apply ``data``; ``updated_at`` is only touched when a value actually changes."""
+        changed = False
         for field, value in data.items():
-            setattr(obj, field, value)
-        if hasattr(obj, "touch"):
+            if getattr(obj, field) != value:
+                setattr(obj, field, value)
+                changed = True
+        if changed and hasattr(obj, "touch"):
             obj.touch()
         session.add(obj)
         session.flush()
         session.refresh(obj)
         return obj
+
+
+class AsyncRepository(Generic[RepositoryType]):
+    """Awaitable counterpart of a repository, for an ``AsyncSession``.
+
+    The wrapped repository builds the statements and maps the results inside
+    ``AsyncSession.run_sync``, while the statements themselves run on the async driver, so a
+    request waiting on the database does not hold a worker thread.
+    """
+
+    def __init__(self, repository: RepositoryType):
+        self.sync = repository
+
+    async def get(self, session: AsyncSession, obj_id: int) -> Optional[Any]:
+        return await session.run_sync(self.sync.get, obj_id)
+
+    async def search(self, session: AsyncSession, **options: Any) -> SearchResult:
+        return await session.run_sync(lambda sync_session: self.sync.search(sync_session, **options))
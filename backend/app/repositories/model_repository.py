@@ -1,12 +1,61 @@
-from typing import Iterable, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
 
-from sqlalchemy import func, or_
+from sqlalchemy import String, and_, delete, exists, false, func, insert, literal, or_, tuple_
+from sqlalchemy import select as sa_select
+from sqlalchemy import update as sa_update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Row, RowMapping
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.selectable import Subquery
 from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from ..models.model import Model
+from ..core.config import get_settings
+from ..models.model import MODEL_CONTENT_FIELDS, MODEL_NATURAL_KEY, MODEL_TAG_LINKS, PRICE_MISSING_FIRST_KEY, Model
 from ..models.vendor import Vendor
-from .base import BaseRepository
+from ..utils.filters import decode_string_list
+from ..utils.hashing import content_hash
+from ..utils.pagination import decode_cursor, encode_cursor
+from ..utils.pricing import PRICE_COLUMNS
+from .base import AsyncRepository, BaseRepository, SearchResult, chunks
+from .search_index import model_search_index
+
+_ROW_COLUMNS = {
+    **{column.name: column for column in Model.__table__.c},
+    "vendor_name": Vendor.__table__.c.name.label("vendor_name"),
+    "vendor_image": Vendor.__table__.c.vendor_image.label("vendor_image"),
+    "vendor_updated_at": Vendor.__table__.c.updated_at.label("vendor_updated_at"),
+}
+# Response fields rendered from columns other than their own name.
+_FIELD_COLUMNS = {"vendor": ("vendor_id", "vendor_name", "vendor_image")}
+# Always selected: they identify a row version (see ``api.caching.model_fragment``).
+_KEY_COLUMNS = ("id", "updated_at", "vendor_updated_at")
+
+# Dialects with ``INSERT ... ON CONFLICT DO UPDATE`` (see ``ModelRepository.upsert``).
+_UPSERT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+# Columns needed to render ``ModelRead`` without loading ORM objects (see ``search(as_rows=True)``).
+LISTING_COLUMNS = tuple(
+    column for name, column in _ROW_COLUMNS.items() if name not in PRICE_COLUMNS and name != "content_hash"
+)
+
+
+def listing_columns(fields: Optional[Iterable[str]] = None) -> tuple:
+    """Columns needed to render the given response fields (all ``ModelRead`` fields by default)."""
+    if fields is None:
+        return LISTING_COLUMNS
+    names = dict.fromkeys(_KEY_COLUMNS)
+    for field in fields:
+        names.update(dict.fromkeys(_FIELD_COLUMNS.get(field, (field,))))
+    return tuple(_ROW_COLUMNS[name] for name in names)
+
+SORT_OPTIONS = {
+    f"{key}_{direction}"
+    for key in ("vendor", "model", "release", "created", "updated", "price")
+    for direction in ("asc", "desc")
+}
 
 
 class ModelRepository(BaseRepository[Model]):
@@ -29,15 +78,103 @@ class ModelRepository(BaseRepository[Model]):
         price_currency: Optional[str] = None,
         license_values: Optional[Iterable[str]] = None,
         categories: Optional[Iterable[str]] = None,
+        tag_match: str = "all",
         status: Optional[str] = None,
         search: Optional[str] = None,
         offset: int = 0,
         limit: int = 20,
         sort: Optional[str] = None,
-        fetch_all: bool = False,
-    ) -> Tuple[Sequence[Model], int]:
-        statement = select(Model).options(selectinload(Model.vendor)).join(Vendor)
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        as_rows: bool = False,
+        fields: Optional[Iterable[str]] = None,
+    ) -> SearchResult:
+        """Search models ordered by ``sort``.
+
+        With ``cursor`` the page starts right after the cursor position (keyset pagination).
+        ``total`` is only computed (and served from the count cache when possible) for offset
+        pages with ``include_total``; otherwise ``has_more`` comes from fetching one extra row.
+        With ``as_rows`` the items are read-only row mappings selected in the same statement,
+        skipping ORM hydration; ``fields`` narrows them to the columns those response fields need.
+        """
+        filters = {
+            "vendor_id": vendor_id,
+            "vendor_name": vendor_name,
+            "model_name": model_name,
+            "vendor_model_id": vendor_model_id,
+            "description": description,
+            "min_context_tokens": min_context_tokens,
+            "max_context_tokens": max_context_tokens,
+            "capabilities": capabilities,
+            "price_model": price_model,
+            "price_currency": price_currency,
+            "license_values": license_values,
+            "categories": categories,
+            "tag_match": tag_match,
+            "status": status,
+            "search": search,
+        }
+        if as_rows:
+            statement = sa_select(*listing_columns(fields)).select_from(Model.__table__.join(Vendor.__table__))
+        else:
+            statement = select(Model).options(selectinload(Model.vendor)).join(Vendor)
+        statement, search_match = self._apply_filters(statement, **filters)
+
+        terms = self._sort_terms(sort, search_match)
+        sort_key = self._sort_key(sort, search_match)
+        statement = statement.add_columns(
+            *[expression.label(f"sort_key_{index}") for index, (expression, _, _) in enumerate(terms)]
+        )
+        statement = statement.order_by(
+            *[expression.desc() if descending else expression.asc() for expression, descending, _ in terms]
+        )
+
+        if cursor:
+            values = decode_cursor(cursor, sort_key, self._cursor_kinds(terms))
+            statement = statement.where(self._after_cursor(terms, values))
+            offset = 0
+
+        total = None
+        if include_total and not cursor:
+            total = self.count(session, statement, filters)
+            rows = session.execute(statement.offset(offset).limit(limit)).all()
+            has_more = offset + len(rows) < total
+        else:
+            rows = session.execute(statement.offset(offset).limit(limit + 1)).all()
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+
+        next_cursor = None
+        if rows and has_more:
+            last = rows[-1]._mapping
+            next_cursor = encode_cursor(sort_key, [last[f"sort_key_{index}"] for index in range(len(terms))])
+        items = [row._mapping for row in rows] if as_rows else [row[0] for row in rows]
+        return SearchResult(items, total, has_more, next_cursor)
+
+    def _apply_filters(
+        self,
+        statement: Select,
+        *,
+        vendor_id: Optional[int] = None,
+        vendor_name: Optional[str] = None,
+        model_name: Optional[str] = None,
+        vendor_model_id: Optional[str] = None,
+        description: Optional[str] = None,
+        min_context_tokens: Optional[int] = None,
+        max_context_tokens: Optional[int] = None,
+        capabilities: Optional[Iterable[str]] = None,
+        price_model: Optional[str] = None,
+        price_currency: Optional[str] = None,
+        license_values: Optional[Iterable[str]] = None,
+        categories: Optional[Iterable[str]] = None,
+        tag_match: str = "all",
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> Tuple[Select, Optional[Subquery]]:
+        """Apply listing filters to a statement that already joins ``Vendor``.
 
+        Returns the filtered statement and the full-text match subquery (if one was joined).
+        """
         if vendor_id is not None:
             statement = statement.where(Model.vendor_id == vendor_id)
         if vendor_name:
@@ -57,76 +194,312 @@ class ModelRepository(BaseRepository[Model]):
         if max_context_tokens is not None:
             statement = statement.where(Model.max_context_tokens <= max_context_tokens)
         if capabilities:
-            for capability in capabilities:
-                statement = statement.where(Model.model_capability.contains(capability))
+            statement = statement.where(self._tag_filter("model_capability", capabilities, tag_match))
         if price_model:
             statement = statement.where(Model.price_model == price_model)
         if price_currency:
             statement = statement.where(Model.price_currency == price_currency)
         if license_values:
-            for license_value in license_values:
-                statement = statement.where(Model.license.contains(license_value))
+            statement = statement.where(self._tag_filter("license", license_values, tag_match))
         if categories:
-            def _unicode_escape(value: str) -> str:
-                try:
-                    return value.encode("unicode_escape").decode("ascii")
-                except Exception:
-                    return value
-
-            for category in categories:
-                escaped = _unicode_escape(category)
-                statement = statement.where(
-                    or_(Model.categories.contains(category), Model.categories.contains(escaped))
-                )
+            statement = statement.where(self._tag_filter("categories", categories, tag_match))
         if status:
-            statement = statement.where(Model.status == status)
+            # Rendered inline so SQLite can use the partial ``status = 'enabled'`` indexes.
+            statement = statement.where(Model.status == literal(status, literal_execute=True))
+        search_match = None
         if search:
-            like = f"%{search.lower()}%"
-            statement = statement.where(
-                or_(
-                    func.lower(Model.model).like(like),
-                    func.lower(Model.vendor_model_id).like(like),
-                    func.lower(Model.description).like(like),
-                    func.lower(Vendor.name).like(like),
-                )
+            search_match = model_search_index.matches(search)
+            if search_match is not None:
+                statement = statement.join(search_match, search_match.c.model_id == Model.id)
+            else:
+                for term in model_search_index.terms(search):
+                    like = f"%{term.lower()}%"
+                    statement = statement.where(
+                        or_(
+                            func.lower(Model.model).like(like),
+                            func.lower(Model.vendor_model_id).like(like),
+                            func.lower(Model.description).like(like),
+                            func.lower(Vendor.name).like(like),
+                        )
+                    )
+        return statement, search_match
+
+    def facets(self, session: Session, **filters) -> dict:
+        """Aggregate distinct values with counts (and numeric ranges) over the filtered models."""
+        filtered_ids, _ = self._apply_filters(select(Model.id).join(Vendor), **filters)
+        filtered_ids = filtered_ids.subquery("filtered_models")
+        in_filtered = Model.id.in_(select(filtered_ids.c.id))
+
+        def value_counts(column, *where) -> list[tuple]:
+            statement = (
+                select(column, func.count())
+                .where(*where)
+                .where(column.is_not(None))
+                .group_by(column)
+                .order_by(func.count().desc(), column.asc())
             )
+            return session.execute(statement).all()
 
-        if sort:
-            direction = "desc" if sort.endswith("_desc") else "asc"
-            key = sort.split("_")[0]
-            if key == "vendor":
-                order_column = func.lower(Vendor.name)
-            elif key == "model":
-                order_column = func.lower(Model.model)
-            elif key == "release":
-                order_column = Model.release_date
-            elif key == "created":
-                order_column = Model.created_at
-            elif key == "updated":
-                order_column = Model.updated_at
-            else:
-                order_column = None
+        vendors = session.execute(
+            select(Vendor.id, Vendor.name, func.count(Model.id))
+            .join(Model, Model.vendor_id == Vendor.id)
+            .where(in_filtered)
+            .group_by(Vendor.id, Vendor.name)
+            .order_by(func.count(Model.id).desc(), Vendor.name.asc())
+        ).all()
+        tags = {
+            field: value_counts(link.value, link.model_id.in_(select(filtered_ids.c.id)))
+            for field, link in MODEL_TAG_LINKS.items()
+        }
+        ranges = session.execute(
+            select(
+                func.min(Model.max_context_tokens),
+                func.max(Model.max_context_tokens),
+                func.min(Model.max_output_tokens),
+                func.max(Model.max_output_tokens),
+                func.count(Model.id),
+            ).where(in_filtered)
+        ).one()
 
-            if order_column is not None:
-                if direction == "desc":
-                    statement = statement.order_by(order_column.desc(), Model.id.desc())
-                else:
-                    statement = statement.order_by(order_column.asc(), Model.id.asc())
+        return {
+            "total": ranges[4],
+            "vendors": [{"id": row[0], "value": row[1], "count": row[2]} for row in vendors],
+            "capabilities": [{"value": row[0], "count": row[1]} for row in tags["model_capability"]],
+            "licenses": [{"value": row[0], "count": row[1]} for row in tags["license"]],
+            "categories": [{"value": row[0], "count": row[1]} for row in tags["categories"]],
+            "price_models": [{"value": row[0], "count": row[1]} for row in value_counts(Model.price_model, in_filtered)],
+            "price_currencies": [
+                {"value": row[0], "count": row[1]} for row in value_counts(Model.price_currency, in_filtered)
+            ],
+            "max_context_tokens": {"min": ranges[0], "max": ranges[1]},
+            "max_output_tokens": {"min": ranges[2], "max": ranges[3]},
+        }
+
+    @staticmethod
+    def _sort_key(sort: Optional[str], search_match) -> str:
+        if sort == "relevance" and search_match is not None:
+            return sort
+        if sort in SORT_OPTIONS:
+            return sort
+        return "created_desc"
+
+    def _sort_terms(self, sort: Optional[str], search_match) -> list[tuple[ColumnElement, bool, bool]]:
+        """Return ``(expression, descending, nullable)`` ORDER BY terms, ending with the id tiebreaker."""
+        sort_key = self._sort_key(sort, search_match)
+        if sort_key == "relevance":
+            return [(search_match.c.rank, False, False), (Model.id, False, False)]
+
+        key, direction = sort_key.rsplit("_", 1)
+        descending = direction == "desc"
+        if key == "price":
+            # Models without a price sort last in both directions; descending order gets that
+            # from SQLite's NULL ordering, which keeps both orders index-backed.
+            if descending:
+                return [(Model.price_headline, True, True), (Model.id, True, False)]
+            return [
+                (PRICE_MISSING_FIRST_KEY, False, False),
+                (Model.price_headline, False, True),
+                (Model.id, False, False),
+            ]
+        columns = {
+            "vendor": (func.lower(Vendor.name, type_=String), False),
+            "model": (func.lower(Model.model, type_=String), False),
+            "release": (Model.release_date, True),
+            "created": (Model.created_at, False),
+            "updated": (Model.updated_at, False),
+        }
+        column, nullable = columns[key]
+        return [(column, descending, nullable), (Model.id, descending, False)]
+
+    @staticmethod
+    def _cursor_kinds(terms: list[tuple[ColumnElement, bool, bool]]) -> list[type]:
+        """Python types of the sort keys; the untyped missing-price flag is a number."""
+        kinds = []
+        for expression, _, _ in terms:
+            try:
+                kinds.append(expression.type.python_type)
+            except NotImplementedError:
+                kinds.append(float)
+        return kinds
+
+    @staticmethod
+    def _after_cursor(terms: list[tuple[ColumnElement, bool, bool]], values: list) -> ColumnElement:
+        """Keyset predicate selecting rows strictly after ``values`` in the order given by ``terms``.
+
+        NULLs follow SQLite ordering: first in ascending and last in descending order.
+        """
+        clauses = []
+        equal_prefix: list[ColumnElement] = []
+        for (expression, descending, nullable), value in zip(terms, values):
+            if value is None:
+                after = expression.is_not(None) if nullable and not descending else false()
+                equal = expression.is_(None)
             else:
-                statement = statement.order_by(Model.created_at.desc())
+                after = expression < value if descending else expression > value
+                if nullable and descending:
+                    after = or_(after, expression.is_(None))
+                equal = expression == value
+            clauses.append(and_(*equal_prefix, after))
+            equal_prefix.append(equal)
+        return or_(*clauses)
 
-        if sort is None:
-            statement = statement.order_by(Model.created_at.desc())
+    @staticmethod
+    def _tag_filter(field: str, values: Iterable[str], match: str):
+        """Build an indexed EXISTS filter matching tag values exactly.
 
-        count_stmt = select(func.count()).select_from(statement.subquery())
-        total_result = session.exec(count_stmt).one()
-        total_value = total_result[0] if isinstance(total_result, tuple) else total_result
+        ``match="all"`` requires every value to be present, ``match="any"`` at least one.
+        """
+        link = MODEL_TAG_LINKS[field]
+        wanted = [value.strip() for value in values if value and value.strip()]
+        if match == "any":
+            return exists().where(link.model_id == Model.id, link.value.in_(wanted))
+        clauses = [exists().where(link.model_id == Model.id, link.value == value) for value in wanted]
+        return and_(*clauses)
 
-        if fetch_all:
-            results = session.exec(statement).all()
-        else:
-            results = session.exec(statement.offset(offset).limit(limit)).all()
-        return results, int(total_value)
+    def sync_tags(self, session: Session, model: Model, fields: Optional[Iterable[str]] = None) -> None:
+        """Rewrite the association rows mirroring the model's list columns."""
+        fields = MODEL_TAG_LINKS if fields is None else fields
+        self.replace_tags(session, {model.id: {field: getattr(model, field) for field in fields}})
+
+    def replace_tags(self, session: Session, values: Mapping[int, Mapping[str, Any]]) -> None:
+        """Rewrite association rows from ``{model_id: {field: list value}}``; absent fields are kept."""
+        batch_size = get_settings().import_batch_size
+        for field, link in MODEL_TAG_LINKS.items():
+            model_ids = [model_id for model_id, data in values.items() if field in data]
+            for chunk in chunks(model_ids, batch_size):
+                session.execute(delete(link).where(link.model_id.in_(chunk)))
+            params = [
+                {"model_id": model_id, "value": value}
+                for model_id in model_ids
+                for value in decode_string_list(values[model_id][field])
+            ]
+            for chunk in chunks(params, batch_size):
+                session.execute(insert(link), chunk)
+
+    def get_by_vendor_model_keys(
+        self, session: Session, keys: Iterable[Tuple[int, str]]
+    ) -> Dict[Tuple[int, str], Row]:
+        """Existing models for ``(vendor_id, lower(vendor_model_id))`` keys, fetched in chunked IN queries.
+
+        Rows carry ``id``, ``content_hash`` and the ``MODEL_CONTENT_FIELDS``, enough to derive the
+        price columns and content hash of an update.
+        """
+        key_columns = (Model.vendor_id, func.lower(Model.vendor_model_id))
+        found: Dict[Tuple[int, str], Row] = {}
+        for chunk in chunks(sorted(set(keys)), get_settings().import_batch_size):
+            statement = sa_select(
+                Model.id, *[column.label(f"key_{index}") for index, column in enumerate(key_columns)],
+                Model.content_hash, *[Model.__table__.c[field] for field in MODEL_CONTENT_FIELDS],
+            ).where(tuple_(*key_columns).in_(chunk))
+            for row in session.execute(statement):
+                found.setdefault((row.key_0, row.key_1), row)
+        return found
+
+    def upsert(
+        self,
+        session: Session,
+        rows: Sequence[Mapping[str, Any]],
+        on_batch: Optional[Callable[[int], None]] = None,
+    ) -> List[int]:
+        """Insert or update models by natural key with ``INSERT ... ON CONFLICT DO UPDATE``; ids in input order.
+
+        New models get the defaults of ``Model(**row)``. Existing ones only take the fields present in
+        the row, plus ``updated_at``. Rows with the same fields are sent as one statement per batch.
+        Keys must be unique within ``rows``, and rows should carry their ``content_hash``.
+        ``on_batch`` receives the number of rows of each batch once it is written.
+        """
+        make_insert = _UPSERT_INSERTS.get(session.get_bind().dialect.name)
+        if make_insert is None:
+            return self._upsert_by_lookup(session, rows, on_batch)
+
+        table = Model.__table__
+        columns = [column.name for column in table.c if column.name != "id"]
+        groups: Dict[frozenset, List[Tuple[int, Dict[str, Any]]]] = {}
+        for position, row in enumerate(rows):
+            model = Model(**row)
+            groups.setdefault(frozenset(row), []).append(
+                (position, {column: getattr(model, column) for column in columns})
+            )
+
+        ids: List[Optional[int]] = [None] * len(rows)
+        for fields, group in groups.items():
+            statement = make_insert(table)
+            # vendor_model_id is always rewritten so RETURNING echoes the ids exactly as given.
+            updated = (fields | {"vendor_model_id", "updated_at"}) - {"vendor_id", "created_at"}
+            statement = statement.on_conflict_do_update(
+                index_elements=list(MODEL_NATURAL_KEY),
+                set_={name: statement.excluded[name] for name in sorted(updated)},
+            ).returning(table.c.id, table.c.vendor_id, table.c.vendor_model_id)
+            for chunk in chunks(group, get_settings().import_batch_size):
+                positions = {(values["vendor_id"], values["vendor_model_id"]): position for position, values in chunk}
+                result = session.execute(statement, [values for _, values in chunk])
+                chunk_ids = []
+                for model_id, vendor_id, vendor_model_id in result:
+                    ids[positions[(vendor_id, vendor_model_id)]] = model_id
+                    chunk_ids.append(model_id)
+                model_search_index.refresh(session, chunk_ids)
+                if on_batch is not None:
+                    on_batch(len(chunk))
+        return ids
+
+    def _upsert_by_lookup(
+        self,
+        session: Session,
+        rows: Sequence[Mapping[str, Any]],
+        on_batch: Optional[Callable[[int], None]] = None,
+    ) -> List[int]:
+        """``upsert`` for dialects without ``ON CONFLICT``: look each batch up, then update or insert row by row.
+
+        Unlike ``ON CONFLICT``, a row inserted by a concurrent import after the lookup makes the
+        insert fail on the unique index instead of being updated.
+        """
+        table = Model.__table__
+        columns = [column.name for column in table.c if column.name != "id"]
+        ids: List[int] = []
+        for chunk in chunks(rows, get_settings().import_batch_size):
+            existing = self.get_by_vendor_model_keys(
+                session, [(row["vendor_id"], row["vendor_model_id"].lower()) for row in chunk]
+            )
+            chunk_ids = []
+            for row in chunk:
+                model = Model(**row)
+                found = existing.get((row["vendor_id"], row["vendor_model_id"].lower()))
+                if found is None:
+                    values = {column: getattr(model, column) for column in columns}
+                    chunk_ids.append(session.execute(insert(table).values(values)).inserted_primary_key[0])
+                    continue
+                fields = (set(row) | {"vendor_model_id", "updated_at"}) - {"vendor_id", "created_at"}
+                session.execute(
+                    sa_update(table).where(table.c.id == found.id).values({name: getattr(model, name) for name in fields})
+                )
+                chunk_ids.append(found.id)
+            ids.extend(chunk_ids)
+            model_search_index.refresh(session, chunk_ids)
+            if on_batch is not None:
+                on_batch(len(chunk))
+        return ids
+
+    def create(self, session: Session, obj_in: Model) -> Model:
+        obj_in.content_hash = obj_in.compute_content_hash()
+        model = super().create(session, obj_in)
+        model_search_index.refresh(session, [model.id])
+        return model
+
+    def update(self, session: Session, obj: Model, data: dict) -> Model:
+        changes = {field: value for field, value in data.items() if getattr(obj, field) != value}
+        if not changes:
+            return obj
+        content = {field: changes.get(field, getattr(obj, field)) for field in MODEL_CONTENT_FIELDS}
+        changes["content_hash"] = content_hash(content, MODEL_CONTENT_FIELDS)
+        model = super().update(session, obj, changes)
+        model_search_index.refresh(session, [model.id])
+        return model
+
+    def delete(self, session: Session, obj: Model) -> None:
+        for link in MODEL_TAG_LINKS.values():
+            session.exec(delete(link).where(link.model_id == obj.id))
+        model_search_index.remove(session, [obj.id])
+        super().delete(session, obj)
 
     def get_by_vendor_and_vendor_model_id(
         self, session: Session, vendor_id: int, vendor_model_id: str
@@ -139,6 +512,41 @@ class ModelRepository(BaseRepository[Model]):
         )
         return session.exec(statement).first()
 
-    def list_with_vendor(self, session: Session) -> Sequence[Model]:
-        statement = select(Model).options(selectinload(Model.vendor))
+    def get_many(self, session: Session, ids: Sequence[int]) -> Sequence[Model]:
+        """Load the given models with their vendors in one round-trip, in no particular order."""
+        if not ids:
+            return []
+        statement = select(Model).options(selectinload(Model.vendor)).where(Model.id.in_(ids))
         return session.exec(statement).all()
+
+    def get_rows(self, session: Session, ids: Sequence[int]) -> Sequence[RowMapping]:
+        """``LISTING_COLUMNS`` rows of the given models, in no particular order."""
+        if not ids:
+            return []
+        statement = (
+            sa_select(*LISTING_COLUMNS)
+            .select_from(Model.__table__.join(Vendor.__table__))
+            .where(Model.__table__.c.id.in_(ids))
+        )
+        return session.execute(statement).mappings().all()
+
+    def iter_export_rows(self, session: Session, batch_size: int) -> Iterator[RowMapping]:
+        """Every model as a table row plus ``vendor_name``, in id order, fetched ``batch_size`` rows at a time."""
+        statement = (
+            sa_select(*Model.__table__.c, _ROW_COLUMNS["vendor_name"])
+            .select_from(Model.__table__.join(Vendor.__table__))
+            .order_by(Model.__table__.c.id)
+            .execution_options(yield_per=batch_size)
+        )
+        yield from session.execute(statement).mappings()
+
+
+class AsyncModelRepository(AsyncRepository[ModelRepository]):
+    def __init__(self) -> None:
+        super().__init__(ModelRepository())
+
+    async def facets(self, session: AsyncSession, **filters) -> dict:
+        return await session.run_sync(lambda sync_session: self.sync.facets(sync_session, **filters))
+
+    async def get_rows(self, session: AsyncSession, ids: Sequence[int]) -> Sequence[RowMapping]:
+        return await session.run_sync(self.sync.get_rows, ids)
@@ -0,0 +1,148 @@
+import re
+from typing import Iterable, Optional
+
+from sqlalchemy import Float, Integer, bindparam, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.sql.selectable import Subquery
+from sqlmodel import Session
+
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_TERM_PATTERN = re.compile(r"\w", re.UNICODE)
+
+
+class ModelSearchIndex:
+    """SQLite FTS5 index over model name, vendor model id, description and vendor name.
+
+    The virtual table keeps its own copy of the indexed text with ``rowid`` equal to
+    ``model.id``. When FTS5 is not compiled in (or the database is not SQLite) the
+    index reports itself unavailable and callers fall back to ``LIKE`` matching.
+    """
+
+    table_name = "model_search"
+    # bm25 weights for (model, vendor_model_id, description, vendor_name)
+    weights = (10.0, 5.0, 1.0, 3.0)
+
+    def __init__(self) -> None:
+        self.available = False
+
+    def ensure(self, connection: Connection) -> None:
+        """Create the index if needed and rebuild it when it has drifted from the model table."""
+        if connection.dialect.name != "sqlite":
+            self.available = False
+            return
+
+        try:
+            connection.execute(
+                text(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table_name} USING fts5("
+                    "model, vendor_model_id, description, vendor_name, "
+                    "tokenize = 'unicode61 remove_diacritics 2')"
+                )
+            )
+            indexed = connection.execute(text(f"SELECT count(*) FROM {self.table_name}")).scalar_one()
+            total = connection.execute(text("SELECT count(*) FROM model")).scalar_one()
+            if indexed != total:
+                self._rebuild(connection)
+        except OperationalError as exc:
+            logger.warning("FTS5 unavailable, falling back to LIKE search: %s", exc)
+            self.available = False
+            return
+
+        self.available = True
+
+    def detect(self, connection: Connection) -> None:
+        """Use the index if a migration has created it, without checking its contents."""
+        self.available = connection.dialect.name == "sqlite" and (
+            connection.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": self.table_name}
+            ).first()
+            is not None
+        )
+
+    def _rebuild(self, connection: Connection) -> None:
+        connection.execute(text(f"DELETE FROM {self.table_name}"))
+        connection.execute(text(self._insert_sql("")))
+
+    def _insert_sql(self, where: str) -> str:
+        return (
+            f"INSERT INTO {self.table_name} (rowid, model, vendor_model_id, description, vendor_name) "
+            "SELECT model.id, model.model, coalesce(model.vendor_model_id, ''), "
+            "coalesce(model.description, ''), vendor.name "
+            f"FROM model JOIN vendor ON vendor.id = model.vendor_id {where}"
+        )
+
+    def refresh(
+        self,
+        session: Session,
+        model_ids: Optional[Iterable[int]] = None,
+        *,
+        vendor_id: Optional[int] = None,
+    ) -> None:
+        """Re-index the given models, or every model of ``vendor_id``."""
+        if not self.available:
+            return
+        if vendor_id is not None:
+            session.execute(
+                text(
+                    f"DELETE FROM {self.table_name} WHERE rowid IN (SELECT id FROM model WHERE vendor_id = :vendor_id)"
+                ),
+                {"vendor_id": vendor_id},
+            )
+            session.execute(text(self._insert_sql("WHERE model.vendor_id = :vendor_id")), {"vendor_id": vendor_id})
+            return
+
+        ids = [model_id for model_id in model_ids or [] if model_id is not None]
+        if not ids:
+            return
+        self.remove(session, ids)
+        statement = text(self._insert_sql("WHERE model.id IN :model_ids")).bindparams(
+            bindparam("model_ids", expanding=True)
+        )
+        session.execute(statement, {"model_ids": ids})
+
+    def remove(self, session: Session, model_ids: Iterable[int]) -> None:
+        if not self.available:
+            return
+        ids = list(model_ids)
+        if ids:
+            statement = text(f"DELETE FROM {self.table_name} WHERE rowid IN :model_ids").bindparams(
+                bindparam("model_ids", expanding=True)
+            )
+            session.execute(statement, {"model_ids": ids})
+
+    @staticmethod
+    def terms(search: str) -> list[str]:
+        """Split free text into search terms, dropping fragments with no word characters."""
+        return [term for term in search.split() if _TERM_PATTERN.search(term)]
+
+    def match_expression(self, search: str) -> Optional[str]:
+        """Build an FTS5 query requiring every term, each as a prefix match."""
+        terms = self.terms(search)
+        if not terms:
+            return None
+        return " ".join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+
+    def matches(self, search: str) -> Optional[Subquery]:
+        """Subquery of ``(model_id, rank)`` for the search; lower rank is more relevant."""
+        if not self.available:
+            return None
+        expression = self.match_expression(search)
+        if expression is None:
+            return None
+        weights = ", ".join(str(weight) for weight in self.weights)
+        statement = (
+            text(
+                f"SELECT rowid AS model_id, bm25({self.table_name}, {weights}) AS rank "
+                f"FROM {self.table_name} WHERE {self.table_name} MATCH :search_query"
+            )
+            .bindparams(search_query=expression)
+            .columns(model_id=Integer, rank=Float)
+        )
+        return statement.subquery("search_match")
+
+
+model_search_index = ModelSearchIndex()
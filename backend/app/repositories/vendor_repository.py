@@ -1,10 +1,12 @@
-from typing import Optional, Sequence, Tuple
+from typing import Dict, Iterable, Optional
 
 from sqlalchemy import func
 from sqlmodel import Session, select
 
+from ..core.config import get_settings
 from ..models.vendor import Vendor
-from .base import BaseRepository
+from .base import AsyncRepository, BaseRepository, SearchResult, chunks
+from .search_index import model_search_index
 
 
 class VendorRepository(BaseRepository[Vendor]):
@@ -19,7 +21,8 @@ class VendorRepository(BaseRepository[Vendor]):
         search: Optional[str] = None,
         offset: int = 0,
         limit: int = 20,
-    ) -> Tuple[Sequence[Vendor], int]:
+        include_total: bool = True,
+    ) -> SearchResult:
         statement = select(Vendor)
         if status:
             statement = statement.where(Vendor.status == status)
@@ -27,12 +30,19 @@ class VendorRepository(BaseRepository[Vendor]):
             like = f"%{search.lower()}%"
             statement = statement.where(func.lower(Vendor.name).like(like))
 
-        count_stmt = select(func.count()).select_from(statement.subquery())
-        total_result = session.exec(count_stmt).one()
-        total_value = total_result[0] if isinstance(total_result, tuple) else total_result
+        if include_total:
+            total = self.count(session, statement, {"status": status, "search": search})
+            results = session.exec(statement.offset(offset).limit(limit)).all()
+            return SearchResult(results, total, offset + len(results) < total)
 
-        results = session.exec(statement.offset(offset).limit(limit)).all()
-        return results, int(total_value)
+        results = session.exec(statement.offset(offset).limit(limit + 1)).all()
+        return SearchResult(results[:limit], None, len(results) > limit)
+
+    def update(self, session: Session, obj: Vendor, data: dict) -> Vendor:
+        vendor = super().update(session, obj, data)
+        if "name" in data:
+            model_search_index.refresh(session, vendor_id=vendor.id)
+        return vendor
 
     def get_by_name(self, session: Session, name: str) -> Optional[Vendor]:
         statement = (
@@ -41,3 +51,17 @@ class VendorRepository(BaseRepository[Vendor]):
             .limit(1)
         )
         return session.exec(statement).first()
+
+    def get_by_names(self, session: Session, names: Iterable[str]) -> Dict[str, Vendor]:
+        """Vendors matching any of ``names`` case-insensitively, keyed by lower-cased name."""
+        keys = sorted({name.lower() for name in names})
+        vendors: Dict[str, Vendor] = {}
+        for chunk in chunks(keys, get_settings().import_batch_size):
+            for vendor in session.exec(select(Vendor).where(func.lower(Vendor.name).in_(chunk))).all():
+                vendors.setdefault(vendor.name.lower(), vendor)
+        return vendors
+
+
+class AsyncVendorRepository(AsyncRepository[VendorRepository]):
+    def __init__(self) -> None:
+        super().__init__(VendorRepository())
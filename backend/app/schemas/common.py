@@ -18,9 +18,11 @@ class Pagination(BaseModel):
 
 class PaginatedResponse(GenericModel, Generic[T]):
     items: List[T]
-    total: int
+    total: Optional[int]
     page: int
     page_size: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
 
 class QueryParams(BaseModel):
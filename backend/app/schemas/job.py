@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel
+
+
+class JobRead(BaseModel):
+    id: str
+    kind: str
+    status: str
+    total: Optional[int]
+    processed: int
+    result: Optional[Dict[str, Any]]
+    error: Optional[str]
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    duration_seconds: Optional[float]
+
+    class Config:
+        orm_mode = True
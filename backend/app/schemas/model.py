@@ -1,10 +1,10 @@
-import json
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from pydantic import BaseModel, Field, root_validator, validator
 
 from ..models.model import ModelStatus
+from ..utils.pricing import PRICE_COLUMNS
 
 
 class ModelBase(BaseModel):
@@ -83,59 +83,108 @@ class ModelRead(ModelBase):
         orm_mode = True
         allow_population_by_field_name = True
 
-    @staticmethod
-    def _decode_string_list(value: object) -> list[str]:
-        def expand(item: object) -> list[str]:
-            if item is None:
-                return []
-            if isinstance(item, list):
-                result: list[str] = []
-                for entry in item:
-                    result.extend(expand(entry))
-                return result
-            if isinstance(item, str):
-                stripped = item.strip()
-                if not stripped:
-                    return []
-                try:
-                    parsed = json.loads(stripped)
-                except Exception:
-                    return [stripped]
-                if isinstance(parsed, (list, str)):
-                    return expand(parsed)
-                return [stripped]
-            return []
-
-        decoded: list[str] = []
-        for entry in expand(value):
-            normalized = entry.strip()
-            if normalized and normalized not in decoded:
-                decoded.append(normalized)
-        return decoded
-
-    @validator("model_capability", pre=True)
-    def parse_capabilities(cls, value):  # type: ignore[override]
-        return cls._decode_string_list(value)
-
-    @validator("categories", pre=True)
-    def parse_categories(cls, value):  # type: ignore[override]
-        return cls._decode_string_list(value)
-
-    @validator("price_data", pre=True)
-    def parse_price(cls, value):  # type: ignore[override]
-        seen = set()
-        current = value
-        while isinstance(current, str) and current not in seen:
-            seen.add(current)
-            try:
-                current = json.loads(current)
-            except Exception:
-                break
-        return current if isinstance(current, dict) else value
-
-    @validator("license", pre=True)
-    def parse_license(cls, value):  # type: ignore[override]
-        return cls._decode_string_list(value)
+    @validator("model_capability", "categories", "license", pre=True)
+    def default_empty_list(cls, value):  # type: ignore[override]
+        return value or []
+
+
+def _isoformat(value: Optional[date]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _status_value(value: Any) -> Any:
+    return value.value if isinstance(value, ModelStatus) else value
+
+
+# JSON value of each ``ModelRead`` field (plus the derived price columns, which sparse fieldsets
+# may request) computed from a listing row, in ``ModelRead`` field order.
+_ROW_FIELD_SERIALIZERS: Dict[str, Callable[[Mapping[str, Any]], Any]] = {
+    "vendor_id": lambda row: row["vendor_id"],
+    "model": lambda row: row["model"],
+    "vendor_model_id": lambda row: row["vendor_model_id"],
+    "description": lambda row: row["description"],
+    "model_image": lambda row: row["model_image"],
+    "max_context_tokens": lambda row: row["max_context_tokens"],
+    "max_output_tokens": lambda row: row["max_output_tokens"],
+    "model_capability": lambda row: row["model_capability"] or [],
+    "model_url": lambda row: row["model_url"],
+    "price_model": lambda row: row["price_model"],
+    "price_currency": lambda row: row["price_currency"],
+    "price_data": lambda row: row["price_data"],
+    "categories": lambda row: row["categories"] or [],
+    "release_date": lambda row: _isoformat(row["release_date"]),
+    "note": lambda row: row["note"],
+    "license": lambda row: row["license"] or [],
+    "status": lambda row: _status_value(row["status"]),
+    "id": lambda row: row["id"],
+    "vendor": lambda row: {"id": row["vendor_id"], "name": row["vendor_name"], "vendor_image": row["vendor_image"]},
+    "created_at": lambda row: row["created_at"].isoformat(),
+    "updated_at": lambda row: row["updated_at"].isoformat(),
+    **{column: (lambda row, column=column: row[column]) for column in PRICE_COLUMNS},
+}
+
+MODEL_READ_FIELDS: Tuple[str, ...] = tuple(ModelRead.__fields__)
+MODEL_SPARSE_FIELDS: Tuple[str, ...] = tuple(_ROW_FIELD_SERIALIZERS)
+MODEL_FIELD_PRESETS: Dict[str, Tuple[str, ...]] = {
+    # What the catalog grid renders: identity, vendor, limits, capabilities and headline price.
+    "summary": (
+        "id",
+        "model",
+        "vendor",
+        "max_context_tokens",
+        "max_output_tokens",
+        "model_capability",
+        "price_model",
+        "price_currency",
+        "price_headline",
+    ),
+    "full": MODEL_READ_FIELDS,
+}
+
+
+def serialize_model_row(row: Mapping[str, Any], fields: Optional[Sequence[str]] = None) -> dict:
+    """Render a listing row as the JSON-ready dict ``ModelRead`` would produce.
+
+    Keys, order and value formats match ``jsonable_encoder(ModelRead.from_orm(model))`` so the
+    listing fast path stays byte-compatible with responses rendered through the schema. With
+    ``fields`` (names from ``MODEL_SPARSE_FIELDS``, in that order) only those keys are rendered.
+    """
+    return {field: _ROW_FIELD_SERIALIZERS[field](row) for field in fields or MODEL_READ_FIELDS}
+
+
+class ModelBatchRequest(BaseModel):
+    ids: List[int] = Field(..., min_items=1, max_items=100)
+
+
+class ModelBatchResponse(BaseModel):
+    items: List[ModelRead]
+    missing: List[int]
+
+
+class FacetValue(BaseModel):
+    value: str
+    count: int
+
+
+class VendorFacetValue(FacetValue):
+    id: int
+
+
+class RangeFacet(BaseModel):
+    min: Optional[int] = None
+    max: Optional[int] = None
+
+
+class ModelFacets(BaseModel):
+    total: int
+    vendors: List[VendorFacetValue]
+    capabilities: List[FacetValue]
+    licenses: List[FacetValue]
+    categories: List[FacetValue]
+    price_models: List[FacetValue]
+    price_currencies: List[FacetValue]
+    max_context_tokens: RangeFacet
+    max_output_tokens: RangeFacet
 
 
 class ModelBulkItem(BaseModel):
@@ -184,32 +233,24 @@ class ModelBulkImportRequest(BaseModel):
 
 
 class ModelBulkImportResult(BaseModel):
-    created: int
-    updated: int
+    created: int = 0
+    updated: int = 0
+    # Existing models whose content hash already matched the imported row; not written.
+    unchanged: int = 0
     errors: List[str]
 
 
+class ModelImportChunkResult(ModelBulkImportResult):
+    offset: int
+    items: int
+
+
+class ModelChunkedImportResult(ModelBulkImportResult):
+    chunks: List[ModelImportChunkResult]
+    # Items committed so far; pass it back as ``offset`` to resume an interrupted import.
+    next_offset: int
+    completed: bool
+
+
 class ModelBulkExportItem(ModelBulkItem):
     vendor_name: str = Field(..., alias="vendorName")
-
-    @classmethod
-    def from_read_model(cls, model: ModelRead) -> "ModelBulkExportItem":
-        return cls(
-            vendorName=model.vendor.name,
-            model=model.model,
-            vendorModelId=model.vendor_model_id,
-            description=model.description,
-            modelImage=model.model_image,
-            maxContextTokens=model.max_context_tokens,
-            maxOutputTokens=model.max_output_tokens,
-            modelCapability=model.model_capability,
-            modelUrl=model.model_url,
-            priceModel=model.price_model,
-            priceCurrency=model.price_currency,
-            priceData=model.price_data,
-            categories=model.categories,
-            releaseDate=model.release_date,
-            note=model.note,
-            license=model.license,
-            status=model.status,
-        )
@@ -1,24 +1,43 @@
-import json
-import json
-from typing import Iterable, Optional
+from itertools import islice
+from typing import Callable, ContextManager, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
 
 from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.engine import RowMapping
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from ..models.model import Model
-from ..repositories.model_repository import ModelRepository
+from ..core.cache import LRUCache, filter_hash
+from ..core.catalog import catalog_version
+from ..core.config import get_settings
+from ..models.model import MODEL_CONTENT_FIELDS, MODEL_TAG_LINKS, Model
+from ..repositories.model_repository import AsyncModelRepository, ModelRepository
 from ..repositories.vendor_repository import VendorRepository
 from ..schemas.model import (
     ModelBulkExportItem,
     ModelBulkImportRequest,
     ModelBulkImportResult,
+    ModelBulkItem,
     ModelCreate,
-    ModelRead,
+    ModelFacets,
+    ModelImportChunkResult,
+    ModelChunkedImportResult,
     ModelUpdate,
 )
 from ..utils.pagination import Page, paginate
+from ..utils.filters import decode_string_list
+from ..utils.hashing import content_hash
+from ..utils.pricing import decode_price_data, extract_price_columns
 from .vendor_service import VendorService
 
+T = TypeVar("T")
+
+EXPORT_FIELDS = tuple(field for field in ModelBulkExportItem.__fields__ if field != "vendor_name")
+
+# Facet aggregates keyed by (catalog version, filter hash).
+facet_cache = LRUCache(get_settings().facet_cache_size)
+
 
 class ModelService:
     def __init__(self) -> None:
@@ -26,112 +45,20 @@ class ModelService:
 
     def _serialize(self, payload: ModelCreate | ModelUpdate) -> dict:
         data = payload.dict(exclude_unset=True, by_alias=False)
-
-        def _prepare_string_list(value):
-            if value is None:
-                return None
-
-            if isinstance(value, list):
-                cleaned = [str(item).strip() for item in value if isinstance(item, (str, int, float)) and str(item).strip()]
-                return json.dumps(cleaned, ensure_ascii=False) if cleaned else None
-
-            if isinstance(value, str):
-                stripped = value.strip()
-                if not stripped:
-                    return None
-                try:
-                    parsed = json.loads(stripped)
-                    if isinstance(parsed, list):
-                        cleaned = [str(item).strip() for item in parsed if isinstance(item, (str, int, float)) and str(item).strip()]
-                        return json.dumps(cleaned, ensure_ascii=False) if cleaned else None
-                except json.JSONDecodeError:
-                    pass
-                return json.dumps([stripped], ensure_ascii=False)
-
-            return json.dumps([str(value).strip()], ensure_ascii=False)
-
-        def _prepare_price_data(value):
-            if value is None:
-                return None
-
-            if isinstance(value, str):
-                try:
-                    parsed = json.loads(value)
-                except json.JSONDecodeError:
-                    return None
-                if isinstance(parsed, dict):
-                    return json.dumps(parsed)
-                return None
-
-            if isinstance(value, dict):
-                return json.dumps(value)
-
-            return None
-
-        for key in ("model_capability", "license", "categories"):
+        for key in MODEL_TAG_LINKS:
             if key in data:
-                data[key] = _prepare_string_list(data[key])
-
+                data[key] = decode_string_list(data[key]) or None
         if "price_data" in data:
-            data["price_data"] = _prepare_price_data(data["price_data"])
+            data["price_data"] = decode_price_data(data["price_data"])
         return data
 
-    def _parse_price_data(self, value: Optional[str | dict]) -> Optional[dict]:
-        if value is None:
-            return None
-        if isinstance(value, dict):
-            return value
-        if isinstance(value, str):
-            try:
-                parsed = json.loads(value)
-            except json.JSONDecodeError:
-                return None
-            return parsed if isinstance(parsed, dict) else None
-        return None
-
-    def _price_sort_value(self, model: Model) -> Optional[float]:
-        data = self._parse_price_data(model.price_data)
-        if not data:
-            return None
-        model_type = model.price_model or ""
-        if model_type == "free":
-            return 0.0
-        if model_type == "token":
-            base = data.get("base")
-            if isinstance(base, dict):
-                for key in ("input_token_1m", "output_token_1m", "input_token_cached_1m"):
-                    value = base.get(key)
-                    if isinstance(value, (int, float)):
-                        return float(value)
-        elif model_type == "call":
-            base = data.get("base")
-            if isinstance(base, dict):
-                price = base.get("price_per_call")
-                if isinstance(price, (int, float)):
-                    return float(price)
-        elif model_type == "tiered":
-            tiers = data.get("tiers")
-            if isinstance(tiers, list) and tiers:
-                first = tiers[0]
-                if isinstance(first, dict):
-                    def _as_float(value):
-                        if isinstance(value, (int, float)):
-                            return float(value)
-                        if isinstance(value, str):
-                            try:
-                                return float(value)
-                            except (TypeError, ValueError):
-                                return None
-                        return None
-
-                    price = _as_float(first.get("price_per_unit"))
-                    if price is not None:
-                        return price
-                    for key in ("input_price_per_unit", "cached_price_per_unit", "output_price_per_unit"):
-                        price = _as_float(first.get(key))
-                        if price is not None:
-                            return price
-        return None
+    def _with_price_columns(self, data: dict, model: Optional[Model] = None) -> dict:
+        if model is not None and "price_model" not in data and "price_data" not in data:
+            return data
+        price_model = data["price_model"] if "price_model" in data else getattr(model, "price_model", None)
+        price_data = data["price_data"] if "price_data" in data else getattr(model, "price_data", None)
+        data.update(extract_price_columns(price_model, price_data))
+        return data
 
     def list_models(
         self,
@@ -150,59 +77,97 @@ class ModelService:
         price_currency: Optional[str] = None,
         license_values: Optional[Iterable[str]] = None,
         categories: Optional[Iterable[str]] = None,
+        tag_match: str = "all",
         status: Optional[str] = None,
         search: Optional[str] = None,
         sort: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        as_rows: bool = False,
+        fields: Optional[Iterable[str]] = None,
         page: int = 1,
         page_size: int = 20,
     ) -> Page[Model]:
         offset = (page - 1) * page_size
-        fetch_all = sort in {"price_asc", "price_desc"}
-        query_sort = None if fetch_all else sort
-        models, total = repository.search(
-            session,
-            vendor_id=vendor_id,
-            vendor_name=vendor_name,
-            model_name=model_name,
-            vendor_model_id=vendor_model_id,
-            description=description,
-            min_context_tokens=min_context_tokens,
-            max_context_tokens=max_context_tokens,
-            capabilities=capabilities,
-            price_model=price_model,
-            price_currency=price_currency,
-            license_values=license_values,
-            categories=categories,
-            status=status,
-            search=search,
-            offset=offset,
-            limit=page_size,
-            sort=query_sort,
-            fetch_all=fetch_all,
-        )
-
-        if fetch_all:
-            descending = sort == "price_desc"
-
-            def sort_key(model: Model) -> float:
-                value = self._price_sort_value(model)
-                if value is None:
-                    return float("-inf") if descending else float("inf")
-                return value
-
-            models = sorted(models, key=sort_key, reverse=descending)
-            models = models[offset : offset + page_size]
+        try:
+            result = repository.search(
+                session,
+                vendor_id=vendor_id,
+                vendor_name=vendor_name,
+                model_name=model_name,
+                vendor_model_id=vendor_model_id,
+                description=description,
+                min_context_tokens=min_context_tokens,
+                max_context_tokens=max_context_tokens,
+                capabilities=capabilities,
+                price_model=price_model,
+                price_currency=price_currency,
+                license_values=license_values,
+                categories=categories,
+                tag_match=tag_match,
+                status=status,
+                search=search,
+                offset=offset,
+                limit=page_size,
+                sort=sort,
+                cursor=cursor,
+                include_total=include_total,
+                as_rows=as_rows,
+                fields=fields,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        return paginate(result.items, result.total, page, page_size, result.has_more, result.next_cursor)
 
-        return paginate(models, total, page, page_size)
+    async def list_models_async(
+        self, session: AsyncSession, *, repository: AsyncModelRepository, page: int = 1, page_size: int = 20, **filters
+    ) -> Page[Model]:
+        """``list_models`` on an ``AsyncSession``; ``filters`` are its keyword filters."""
+        try:
+            result = await repository.search(session, offset=(page - 1) * page_size, limit=page_size, **filters)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        return paginate(result.items, result.total, page, page_size, result.has_more, result.next_cursor)
+
+    def get_facets(self, session: Session, *, repository: ModelRepository, **filters) -> ModelFacets:
+        key = (*catalog_version.current_key(session, get_settings().catalog_version_poll_seconds), filter_hash(filters))
+        cached = facet_cache.get(key)
+        if cached is not None:
+            return cached
+        facets = ModelFacets(**repository.facets(session, **filters))
+        facet_cache.set(key, facets)
+        return facets
+
+    async def get_facets_async(self, session: AsyncSession, *, repository: AsyncModelRepository, **filters) -> ModelFacets:
+        version_key = await session.run_sync(catalog_version.current_key, get_settings().catalog_version_poll_seconds)
+        key = (*version_key, filter_hash(filters))
+        cached = facet_cache.get(key)
+        if cached is not None:
+            return cached
+        facets = ModelFacets(**await repository.facets(session, **filters))
+        facet_cache.set(key, facets)
+        return facets
 
     def _ensure_vendor(self, session: Session, vendor_id: int, vendor_service: VendorService, vendor_repo: VendorRepository) -> None:
         vendor_service.get_vendor(session, vendor_id, vendor_repo)
 
+    def _ensure_unique(
+        self, session: Session, vendor_id: int, vendor_model_id: Optional[str], repository: ModelRepository, model_id: Optional[int] = None
+    ) -> None:
+        if not vendor_model_id:
+            return
+        existing = repository.get_by_vendor_and_vendor_model_id(session, vendor_id, vendor_model_id)
+        if existing is not None and existing.id != model_id:
+            raise HTTPException(status_code=409, detail="Vendor already has a model with this vendor model id")
+
     def create_model(self, session: Session, payload: ModelCreate, repository: ModelRepository, vendor_service: VendorService, vendor_repo: VendorRepository) -> Model:
         self._ensure_vendor(session, payload.vendor_id, vendor_service, vendor_repo)
-        data = self._serialize(payload)
+        self._ensure_unique(session, payload.vendor_id, payload.vendor_model_id, repository)
+        data = self._with_price_columns(self._serialize(payload))
         model = Model(**data)
-        return repository.create(session, model)
+        model = repository.create(session, model)
+        repository.sync_tags(session, model)
+        return model
 
     def get_model(self, session: Session, model_id: int, repository: ModelRepository) -> Model:
         model = repository.get(session, model_id)
@@ -210,82 +175,239 @@ class ModelService:
             raise HTTPException(status_code=404, detail="Model not found")
         return model
 
+    def get_model_rows(
+        self, session: Session, model_ids: Iterable[int], repository: ModelRepository
+    ) -> Tuple[List[RowMapping], List[int]]:
+        """Listing rows of the requested models in request order, plus the ids that were not found."""
+        ids = list(dict.fromkeys(model_ids))
+        return _in_request_order(ids, repository.get_rows(session, ids))
+
+    async def get_model_rows_async(
+        self, session: AsyncSession, model_ids: Iterable[int], repository: AsyncModelRepository
+    ) -> Tuple[List[RowMapping], List[int]]:
+        ids = list(dict.fromkeys(model_ids))
+        return _in_request_order(ids, await repository.get_rows(session, ids))
+
     def update_model(self, session: Session, model_id: int, payload: ModelUpdate, repository: ModelRepository, vendor_service: VendorService, vendor_repo: VendorRepository) -> Model:
         model = self.get_model(session, model_id, repository)
         if payload.vendor_id:
             self._ensure_vendor(session, payload.vendor_id, vendor_service, vendor_repo)
-        data = self._serialize(payload)
-        return repository.update(session, model, data)
+        data = self._with_price_columns(self._serialize(payload), model)
+        self._ensure_unique(
+            session, data.get("vendor_id", model.vendor_id), data.get("vendor_model_id", model.vendor_model_id), repository, model.id
+        )
+        changed_tags = [field for field in MODEL_TAG_LINKS if field in data and data[field] != getattr(model, field)]
+        model = repository.update(session, model, data)
+        repository.sync_tags(session, model, changed_tags)
+        return model
 
     def delete_model(self, session: Session, model_id: int, repository: ModelRepository) -> None:
         model = self.get_model(session, model_id, repository)
         repository.delete(session, model)
 
-    def export_models(
+    def iter_export_items(self, session: Session, repository: ModelRepository) -> Iterator[ModelBulkExportItem]:
+        """Export items built one database batch at a time, so memory stays flat with catalog size."""
+        for row in repository.iter_export_rows(session, get_settings().export_batch_size):
+            data = {field: row[field] for field in EXPORT_FIELDS}
+            for field in MODEL_TAG_LINKS:
+                data[field] = data[field] or []
+            yield ModelBulkExportItem(vendor_name=row["vendor_name"], **data)
+
+    def import_models(
         self,
         session: Session,
+        payload: ModelBulkImportRequest,
         repository: ModelRepository,
-    ) -> list[ModelBulkExportItem]:
-        models = repository.list_with_vendor(session)
-        exports: list[ModelBulkExportItem] = []
-        for model in models:
-            read_model = ModelRead.from_orm(model)
-            exports.append(ModelBulkExportItem.from_read_model(read_model))
-        return exports
+        vendor_repository: VendorRepository,
+        dry_run: bool = False,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> ModelBulkImportResult:
+        return self.import_rows(
+            session,
+            enumerate(payload.items, start=1),
+            repository,
+            vendor_repository,
+            dry_run=dry_run,
+            on_progress=on_progress,
+        )
 
-    def import_models(
+    def import_rows(
         self,
         session: Session,
-        payload: ModelBulkImportRequest,
+        rows: Iterable[Tuple[int, ModelBulkItem]],
         repository: ModelRepository,
         vendor_repository: VendorRepository,
+        errors: Optional[List[Tuple[int, str]]] = None,
+        dry_run: bool = False,
+        on_progress: Optional[Callable[[int], None]] = None,
     ) -> ModelBulkImportResult:
-        created = 0
-        updated = 0
-        errors: list[str] = []
+        """Upsert ``(row number, item)`` pairs; ``errors`` may carry earlier problems with other rows.
+
+        Updates whose content hash matches the stored one are counted as ``unchanged`` and not
+        written. With ``dry_run`` nothing is written; the counts show what the import would do.
+        ``on_progress`` receives the number of ``rows`` handled so far: once the rejected and
+        unchanged ones are known, then after every written batch.
+        """
+        errors = list(errors or [])
         seen: set[tuple[str, str]] = set()
+        valid: list[tuple[int, ModelBulkItem]] = []
+        received = 0
 
-        for index, item in enumerate(payload.items, start=1):
+        for index, item in rows:
+            received += 1
             vendor_key = item.vendor_name.strip().lower()
             model_key = (item.vendor_model_id or "").strip().lower()
 
             if not vendor_key:
-                errors.append(f"Row {index}: vendor name is required")
+                errors.append((index, f"Row {index}: vendor name is required"))
                 continue
 
             if not model_key:
-                errors.append(f"Row {index}: vendor model id is required")
+                errors.append((index, f"Row {index}: vendor model id is required"))
                 continue
 
             key = (vendor_key, model_key)
             if key in seen:
-                errors.append(
-                    f"Row {index}: duplicate entry for vendor '{item.vendor_name}' and vendor model id '{item.vendor_model_id}'"
-                )
+                errors.append((
+                    index,
+                    f"Row {index}: duplicate entry for vendor '{item.vendor_name}' and vendor model id '{item.vendor_model_id}'",
+                ))
                 continue
             seen.add(key)
+            valid.append((index, item))
 
-            vendor = vendor_repository.get_by_name(session, item.vendor_name)
+        # Resolve vendors and existing models for the whole payload in a few set-based queries.
+        vendors = vendor_repository.get_by_names(session, [item.vendor_name for _, item in valid])
+        resolved: list[tuple[int, ModelBulkItem, int]] = []
+        for index, item in valid:
+            vendor = vendors.get(item.vendor_name.lower())
             if not vendor:
-                errors.append(
-                    f"Row {index}: vendor '{item.vendor_name}' does not exist"
-                )
+                errors.append((index, f"Row {index}: vendor '{item.vendor_name}' does not exist"))
                 continue
+            resolved.append((index, item, vendor.id))
+        existing = repository.get_by_vendor_model_keys(
+            session, [(vendor_id, item.vendor_model_id.lower()) for _, item, vendor_id in resolved]
+        )
 
-            existing = repository.get_by_vendor_and_vendor_model_id(
-                session, vendor.id, item.vendor_model_id
-            )
-
-            if existing:
-                update_payload = item.to_model_update()
-                data = self._serialize(update_payload)
-                repository.update(session, existing, data)
+        rows: list[dict] = []
+        tags: list[dict] = []
+        updated = unchanged = 0
+        for _, item, vendor_id in resolved:
+            found = existing.get((vendor_id, item.vendor_model_id.lower()))
+            if found is not None:
+                data = self._with_price_columns(self._serialize(item.to_model_update()), found)
+                content = {field: data.get(field, getattr(found, field)) for field in MODEL_CONTENT_FIELDS}
+                data["content_hash"] = content_hash(content, MODEL_CONTENT_FIELDS)
+                if data["content_hash"] == found.content_hash:
+                    unchanged += 1
+                    continue
+                tags.append({field: data[field] for field in MODEL_TAG_LINKS if field in data})
                 updated += 1
             else:
-                create_payload = item.to_model_create(vendor.id)
-                data = self._serialize(create_payload)
-                model = Model(**data)
-                repository.create(session, model)
-                created += 1
+                data = self._with_price_columns(self._serialize(item.to_model_create(vendor_id)))
+                data["content_hash"] = Model(**data).compute_content_hash()
+                tags.append({field: data.get(field) for field in MODEL_TAG_LINKS})
+            rows.append({**data, "vendor_id": vendor_id})
+
+        processed = received if dry_run else received - len(rows)
+        if on_progress is not None:
+            on_progress(processed)
+
+        def batch_written(count: int) -> None:
+            nonlocal processed
+            processed += count
+            if on_progress is not None:
+                on_progress(processed)
+
+        if not dry_run:
+            # One upsert per batch; rows inserted concurrently since the lookup above are updated, not duplicated.
+            model_ids = repository.upsert(session, rows, on_batch=batch_written)
+            repository.replace_tags(session, dict(zip(model_ids, tags)))
+
+        return ModelBulkImportResult(
+            created=len(rows) - updated,
+            updated=updated,
+            unchanged=unchanged,
+            errors=[message for _, message in sorted(errors)],
+        )
 
-        return ModelBulkImportResult(created=created, updated=updated, errors=errors)
+    def import_ndjson(self, lines: Iterable[bytes], **options) -> ModelChunkedImportResult:
+        """Import one ``ModelBulkItem`` JSON document per line; blank lines are ignored.
+
+        Rows are numbered from 1 over the remaining lines. See ``import_chunked`` for ``options``.
+        """
+        return self.import_chunked((line for line in lines if line.strip()), **options)
+
+    def import_chunked(
+        self,
+        items: Iterable[Union[bytes, ModelBulkItem]],
+        *,
+        session_factory: Callable[[], ContextManager[Session]],
+        repository: ModelRepository,
+        vendor_repository: VendorRepository,
+        chunk_size: int,
+        offset: int = 0,
+        on_chunk: Optional[Callable[[ModelChunkedImportResult], None]] = None,
+        dry_run: bool = False,
+    ) -> ModelChunkedImportResult:
+        """Import items (parsed models or raw JSON documents), committing every ``chunk_size`` items.
+
+        The first ``offset`` items are skipped so an interrupted import can be resumed from
+        ``next_offset``. A chunk that fails to write is rolled back and stops the import.
+        ``on_chunk`` receives the running result after each committed chunk. ``dry_run`` is passed
+        to ``import_rows`` for every chunk.
+        """
+        result = ModelChunkedImportResult(errors=[], chunks=[], next_offset=offset, completed=False)
+        for chunk_offset, chunk in _numbered_chunks(iter(items), chunk_size, offset):
+            errors: list[tuple[int, str]] = []
+            parsed: list[tuple[int, ModelBulkItem]] = []
+            for index, item in chunk:
+                if isinstance(item, ModelBulkItem):
+                    parsed.append((index, item))
+                    continue
+                try:
+                    parsed.append((index, ModelBulkItem.parse_raw(item)))
+                except ValidationError as exc:
+                    details = "; ".join(
+                        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in exc.errors()
+                    )
+                    errors.append((index, f"Row {index}: invalid item ({details})"))
+            try:
+                with session_factory() as session:
+                    chunk_result = self.import_rows(
+                        session, parsed, repository, vendor_repository, errors, dry_run=dry_run
+                    )
+            except SQLAlchemyError as exc:
+                first, last = chunk[0][0], chunk[-1][0]
+                result.errors.append(f"Rows {first}-{last}: import failed, nothing written ({exc.__class__.__name__})")
+                return result
+            result.chunks.append(ModelImportChunkResult(offset=chunk_offset, items=len(chunk), **chunk_result.dict()))
+            result.created += chunk_result.created
+            result.updated += chunk_result.updated
+            result.unchanged += chunk_result.unchanged
+            result.errors.extend(chunk_result.errors)
+            result.next_offset = chunk_offset + len(chunk)
+            if on_chunk is not None:
+                on_chunk(result)
+        result.completed = True
+        return result
+
+
+def _in_request_order(ids: List[int], rows: Iterable[RowMapping]) -> Tuple[List[RowMapping], List[int]]:
+    found = {row["id"]: row for row in rows}
+    return (
+        [found[model_id] for model_id in ids if model_id in found],
+        [model_id for model_id in ids if model_id not in found],
+    )
+
+
+def _numbered_chunks(items: Iterator[T], size: int, offset: int) -> Iterator[Tuple[int, List[Tuple[int, T]]]]:
+    """``(offset, [(row number, item), ...])`` chunks of ``items``, skipping the first ``offset`` items."""
+    numbered = enumerate(items, start=1)
+    for _ in islice(numbered, offset):
+        pass
+    while True:
+        chunk = list(islice(numbered, size))
+        if not chunk:
+            return
+        yield chunk[0][0] - 1, chunk
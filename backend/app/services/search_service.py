@@ -1,7 +1,8 @@
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 
-from fastapi import Query
+from fastapi import HTTPException, Query
 
+from ..schemas.model import MODEL_FIELD_PRESETS, MODEL_READ_FIELDS, MODEL_SPARSE_FIELDS
 from ..utils.filters import parse_csv
 
 
@@ -21,9 +22,12 @@ class ModelSearchParams:
         price_currency: Optional[str] = Query(default=None),
         license: Optional[str] = Query(default=None),
         categories: Optional[str] = Query(default=None),
+        match: str = Query(default="all", pattern="^(all|any)$"),
         status: Optional[str] = Query(default=None),
         search: Optional[str] = Query(default=None),
         sort: Optional[str] = Query(default=None),
+        cursor: Optional[str] = Query(default=None),
+        include_total: bool = Query(default=True),
         page: int = Query(default=1, ge=1),
         page_size: int = Query(default=20, ge=1, le=100),
     ) -> None:
@@ -39,13 +43,17 @@ class ModelSearchParams:
         self.price_currency = price_currency
         self.license = parse_csv(license)
         self.categories = parse_csv(categories)
+        self.match = match
         self.status = status
         self.search = search
         self.sort = sort
+        self.cursor = cursor or None
+        self.include_total = include_total
         self.page = page
         self.page_size = page_size
 
-    def dict(self) -> Dict[str, Optional[Any]]:
+    def filters(self) -> Dict[str, Optional[Any]]:
+        """Filter arguments only, without sorting and pagination."""
         return {
             "vendor_id": self.vendor_id,
             "vendor_name": self.vendor_name,
@@ -59,24 +67,70 @@ class ModelSearchParams:
             "price_currency": self.price_currency,
             "license_values": self.license,
             "categories": self.categories,
+            "tag_match": self.match,
             "status": self.status,
             "search": self.search,
+        }
+
+    def dict(self) -> Dict[str, Optional[Any]]:
+        return {
+            **self.filters(),
             "sort": self.sort,
+            "cursor": self.cursor,
+            "include_total": self.include_total,
             "page": self.page,
             "page_size": self.page_size,
         }
 
 
+def resolve_model_fields(value: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Expand a ``fields=`` value into field names in ``MODEL_SPARSE_FIELDS`` order.
+
+    Accepts preset names (``summary``, ``full``) and field names, comma separated; ``id`` is
+    always included. Returns ``None`` for the full ``ModelRead`` field set.
+    """
+    names = parse_csv(value)
+    if not names:
+        return None
+    requested = {"id"}
+    for name in names:
+        if name in MODEL_FIELD_PRESETS:
+            requested.update(MODEL_FIELD_PRESETS[name])
+        elif name in MODEL_SPARSE_FIELDS:
+            requested.add(name)
+        else:
+            raise ValueError(f"Unknown field '{name}'")
+    if requested == set(MODEL_READ_FIELDS):
+        return None
+    return tuple(field for field in MODEL_SPARSE_FIELDS if field in requested)
+
+
+class ModelFieldsParams:
+    def __init__(
+        self,
+        fields: Optional[str] = Query(
+            default=None,
+            description="Sparse fieldset: preset (summary, full) and/or comma separated field names",
+        ),
+    ) -> None:
+        try:
+            self.fields = resolve_model_fields(fields)
+        except ValueError as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
 class VendorQueryParams:
     def __init__(
         self,
         *,
         status: Optional[str] = Query(default=None),
         search: Optional[str] = Query(default=None),
+        include_total: bool = Query(default=True),
         page: int = Query(default=1, ge=1),
         page_size: int = Query(default=20, ge=1, le=100),
     ) -> None:
         self.status = status
         self.search = search
+        self.include_total = include_total
         self.page = page
         self.page_size = page_size
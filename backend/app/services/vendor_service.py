@@ -1,8 +1,9 @@
 from fastapi import HTTPException
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..models.vendor import Vendor
-from ..repositories.vendor_repository import VendorRepository
+from ..repositories.vendor_repository import AsyncVendorRepository, VendorRepository
 from ..schemas.vendor import VendorCreate, VendorUpdate
 from ..utils.pagination import Page, paginate
 
@@ -20,16 +21,39 @@ class VendorService:
         search: str | None = None,
         page: int = 1,
         page_size: int = 20,
+        include_total: bool = True,
     ) -> Page[Vendor]:
         offset = (page - 1) * page_size
-        vendors, total = repository.search(
+        result = repository.search(
             session,
             status=status_filter,
             search=search,
             offset=offset,
             limit=page_size,
+            include_total=include_total,
         )
-        return paginate(vendors, total, page, page_size)
+        return paginate(result.items, result.total, page, page_size, result.has_more)
+
+    async def list_vendors_async(
+        self,
+        session: AsyncSession,
+        repository: AsyncVendorRepository,
+        *,
+        status_filter: str | None = None,
+        search: str | None = None,
+        page: int = 1,
+        page_size: int = 20,
+        include_total: bool = True,
+    ) -> Page[Vendor]:
+        result = await repository.search(
+            session,
+            status=status_filter,
+            search=search,
+            offset=(page - 1) * page_size,
+            limit=page_size,
+            include_total=include_total,
+        )
+        return paginate(result.items, result.total, page, page_size, result.has_more)
 
     def create_vendor(self, session: Session, payload: VendorCreate, repository: VendorRepository) -> Vendor:
         vendor = Vendor(**payload.dict())
@@ -1,5 +1,6 @@
 import os
 from collections.abc import Generator
+from contextlib import contextmanager
 
 import pytest
 from fastapi.testclient import TestClient
@@ -9,7 +10,7 @@ from sqlalchemy.pool import StaticPool
 os.environ.setdefault("DATABASE_URL", "sqlite://")
 os.environ.setdefault("SECRET_KEY", "test-secret")
 
-from app.api.deps import get_db  # noqa: E402
+from app.api.deps import get_db, get_read_db, get_read_session_factory, get_session_factory  # noqa: E402
 from app.core import database  # noqa: E402
 from app.core.config import get_settings  # noqa: E402
 from app.core.security import hash_password  # noqa: E402
@@ -21,12 +22,13 @@ TEST_ENGINE = create_engine(
     poolclass=StaticPool,
 )
 
+database.configure_sqlite(TEST_ENGINE, database.sqlite_pragmas(get_settings()))
 database.engine = TEST_ENGINE
+database.read_engine = TEST_ENGINE
 
 
 @pytest.fixture(scope="session", autouse=True)
 def prepare_database() -> Generator[None, None, None]:
-    SQLModel.metadata.create_all(TEST_ENGINE)
     database.init_db()
     yield
     SQLModel.metadata.drop_all(TEST_ENGINE)
@@ -43,7 +45,14 @@ def override_dependencies(session: Session) -> Generator[None, None, None]:
     def get_session_override() -> Generator[Session, None, None]:
         yield session
 
+    @contextmanager
+    def session_factory_override() -> Generator[Session, None, None]:
+        yield session
+
     app.dependency_overrides[get_db] = get_session_override
+    app.dependency_overrides[get_read_db] = get_session_override
+    app.dependency_overrides[get_session_factory] = lambda: session_factory_override
+    app.dependency_overrides[get_read_session_factory] = lambda: session_factory_override
 
     settings = get_settings()
     settings.admin_password_hash = hash_password("adminpass")
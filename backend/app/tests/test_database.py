@@ -0,0 +1,216 @@
+import asyncio
+import shutil
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlmodel import Session
+
+from app.api.deps import get_db, get_read_db
+from app.api.routers import public, public_async
+from app.core import database, pool
+from app.core.catalog import catalog_version
+from app.core.config import Settings
+from app.main import app
+from app.models.vendor import Vendor
+from app.repositories.model_repository import ModelRepository
+from app.repositories.vendor_repository import VendorRepository
+from app.schemas.model import ModelBulkImportRequest, ModelBulkItem
+from app.services.model_service import ModelService
+
+
+def read_pragmas(engine) -> dict:
+    names = ("journal_mode", "synchronous", "busy_timeout", "cache_size", "temp_store", "foreign_keys")
+    with engine.connect() as connection:
+        return {name: connection.execute(text(f"PRAGMA {name}")).scalar() for name in names}
+
+
+def test_sqlite_profile_is_applied_to_every_connection(tmp_path):
+    settings = Settings(sqlite_journal_mode="wal", sqlite_synchronous="normal", sqlite_busy_timeout_ms=1234)
+    engine = create_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+    database.configure_sqlite(engine, database.sqlite_pragmas(settings))
+
+    assert read_pragmas(engine) == {
+        "journal_mode": "wal",
+        "synchronous": 1,
+        "busy_timeout": 1234,
+        "cache_size": -64 * 1024,
+        "temp_store": 2,
+        "foreign_keys": 1,
+    }
+    engine.dispose()
+
+    plain = create_engine(f"sqlite:///{tmp_path / 'plain.db'}")
+    database.configure_sqlite(plain, database.sqlite_pragmas(Settings(sqlite_pragmas_enabled=False)))
+    assert read_pragmas(plain)["journal_mode"] == "delete"
+    assert read_pragmas(plain)["foreign_keys"] == 0
+
+
+def test_sqlite_profile_rejects_unknown_modes():
+    with pytest.raises(ValueError, match="journal_mode"):
+        Settings(sqlite_journal_mode="fast")
+
+
+def test_async_database_url_uses_the_async_driver():
+    assert database.async_database_url("sqlite:///./app.db") == "sqlite+aiosqlite:///./app.db"
+    assert database.async_database_url("postgresql://hub:secret@db/hub") == "postgresql+asyncpg://hub:secret@db/hub"
+    with pytest.raises(RuntimeError, match="ASYNC_DATABASE_URL"):
+        database.async_database_url("mysql://hub@db/hub")
+
+
+def test_async_read_database_url_honours_its_override():
+    replica = "sqlite:///file:/data/replica.db?mode=ro&uri=true"
+    assert database.async_read_database_url(Settings(read_database_url=replica)) == (
+        "sqlite+aiosqlite:///file:/data/replica.db?mode=ro&uri=true"
+    )
+    settings = Settings(read_database_url="mysql://hub@replica/hub")
+    with pytest.raises(RuntimeError, match="ASYNC_READ_DATABASE_URL"):
+        database.async_read_database_url(settings)
+    override = "mysql+aiomysql://hub@replica/hub"
+    assert database.async_read_database_url(settings.copy(update={"async_read_database_url": override})) == override
+
+
+def test_async_public_routes_match_sync_routes(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'catalog.db'}"
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+    monkeypatch.setattr(database, "engine", engine)
+    database.init_db()
+    items = [
+        ModelBulkItem(vendorName="Async Vendor", model=f"Async {index}", vendorModelId=f"async-{index}", modelCapability=["chat"])
+        for index in range(3)
+    ]
+    with Session(engine) as session:
+        VendorRepository().create(session, Vendor(name="Async Vendor"))
+        ModelService().import_models(session, ModelBulkImportRequest(items=items), ModelRepository(), VendorRepository())
+        session.commit()
+
+    async_engine = database.create_async_db_engine(database.async_database_url(url), Settings())
+    monkeypatch.setattr(database, "async_engine", async_engine)
+    monkeypatch.setattr(database, "async_read_engine", async_engine)
+
+    def sync_db():
+        with Session(engine) as session:
+            yield session
+
+    paths = [
+        "/api/public/vendors",
+        "/api/public/models?sort=model&capabilities=chat",
+        "/api/public/models?search=async&page_size=2",
+        "/api/public/models/facets",
+        "/api/public/models/batch?ids=1,2,99",
+        "/api/public/models/1",
+        "/api/public/models/99",
+    ]
+    responses = []
+    for router in (public.router, public_async.router):
+        app = FastAPI()
+        app.include_router(router, prefix="/api")
+        app.dependency_overrides[get_read_db] = sync_db
+        # Start from empty version-keyed caches so both passes query the database.
+        catalog_version.bump()
+        with TestClient(app) as client:
+            responses.append([(response.status_code, response.json()) for response in map(client.get, paths)])
+    asyncio.run(async_engine.dispose())
+    engine.dispose()
+
+    sync_responses, async_responses = responses
+    assert async_responses == sync_responses
+    assert async_responses[1][1]["total"] == 3
+    assert async_responses[-1][0] == 404
+
+
+def test_reads_use_the_read_database_until_the_client_writes(tmp_path, monkeypatch, client, admin_headers):
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}", connect_args={"check_same_thread": False})
+    monkeypatch.setattr(database, "engine", primary)
+    database.init_db()
+    with Session(primary) as session:
+        VendorRepository().create(session, Vendor(name="Replicated"))
+        session.commit()
+    shutil.copy(tmp_path / "primary.db", tmp_path / "replica.db")
+    replica = database.create_db_engine(
+        f"sqlite:///file:{tmp_path / 'replica.db'}?mode=ro&uri=true", Settings(), read_only=True
+    )
+    monkeypatch.setattr(database, "read_engine", replica)
+    for dependency in (get_db, get_read_db):
+        monkeypatch.delitem(app.dependency_overrides, dependency)
+
+    def vendor_names(path: str) -> list:
+        response = client.get(path, headers=admin_headers)
+        assert response.status_code == 200
+        return [vendor["name"] for vendor in response.json()["items"]]
+
+    assert vendor_names("/api/public/vendors") == ["Replicated"]
+
+    created = client.post("/api/admin/vendors", json={"name": "Fresh"}, headers=admin_headers)
+    assert created.status_code == 201
+    assert "read_primary=1" in created.headers["set-cookie"]
+    # Read-your-writes: this client now reads from the primary...
+    assert vendor_names("/api/public/vendors") == ["Replicated", "Fresh"]
+    assert vendor_names("/api/admin/vendors") == ["Replicated", "Fresh"]
+
+    # ...while everyone else keeps reading the (stale) replica.
+    client.cookies.clear()
+    assert vendor_names("/api/public/vendors") == ["Replicated"]
+    assert vendor_names("/api/admin/vendors") == ["Replicated"]
+    # The admin UI runs on another origin and does not send cookies: it echoes a header instead.
+    origin = {"Origin": "http://localhost:3000"}
+    preflight = client.options(
+        "/api/admin/vendors",
+        headers={**origin, "Access-Control-Request-Method": "GET", "Access-Control-Request-Headers": "x-read-primary"},
+    )
+    assert preflight.status_code == 200
+    assert "x-read-primary" in preflight.headers["access-control-allow-headers"].lower()
+    created = client.post("/api/admin/vendors", json={"name": "Cross"}, headers={**admin_headers, **origin})
+    assert created.headers["x-read-primary-seconds"] == "10"
+    assert "x-read-primary-seconds" in created.headers["access-control-expose-headers"].lower()
+    client.cookies.clear()
+    pinned = client.get("/api/admin/vendors", headers={**admin_headers, **origin, "X-Read-Primary": "1"})
+    assert [vendor["name"] for vendor in pinned.json()["items"]] == ["Replicated", "Fresh", "Cross"]
+    assert vendor_names("/api/admin/vendors") == ["Replicated"]
+    replica.dispose()
+    primary.dispose()
+
+
+def test_pool_is_configurable_and_reports_checkout_waits(tmp_path, monkeypatch, caplog, client, admin_headers):
+    assert "poolclass" not in pool.pool_options("sqlite://", Settings())
+    settings = Settings(db_pool_size=1, db_pool_max_overflow=0, db_pool_timeout_seconds=0.3, db_pool_slow_checkout_ms=50)
+    engine = database.create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}", settings)
+    assert isinstance(engine.pool, pool.InstrumentedQueuePool)
+    monkeypatch.setattr(pool, "engines", {})
+    pool.instrument("primary", engine, settings)
+    # Opening a connection is slow, but it is not time spent waiting for the pool.
+    event.listen(engine, "connect", lambda *args: time.sleep(0.1))
+
+    held = threading.Event()
+
+    def hold_connection() -> None:
+        with engine.connect():
+            held.set()
+            time.sleep(0.1)
+
+    holder = threading.Thread(target=hold_connection)
+    holder.start()
+    held.wait()
+    connection = engine.connect()  # waits for the holder to return its connection
+    holder.join()
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+
+    stats = client.get("/api/admin/system/pool", headers=admin_headers).json()["pools"]["primary"]
+    assert stats["pool"] == "InstrumentedQueuePool"
+    assert (stats["size"], stats["checked_out"], stats["overflow"]) == (1, 1, 0)
+    assert (stats["checkouts"], stats["slow_checkouts"], stats["timeouts"]) == (3, 1, 1)
+    assert sum(stats["wait_ms"]["histogram"].values()) == 3
+    assert stats["wait_ms"]["max"] >= 300
+    warnings = [record.getMessage() for record in caplog.records if record.name == "app.core.pool"]
+    assert len(warnings) == 2
+    assert warnings[1].startswith("Timed out waiting for a primary database connection")
+
+    connection.close()
+    recorder = engine.pool.stats
+    engine.dispose()
+    assert engine.pool.stats is recorder
@@ -1,57 +1,85 @@
-from sqlalchemy import create_engine, inspect, text
+import json
+
+import pytest
+from sqlalchemy import create_engine, inspect, select, text
 
 from app.core import database
 
 
+def create_legacy_schema(connection, model_columns: str = "") -> None:
+    """Create the tables of a release before versioned migrations, with only the ``model_model`` index."""
+    connection.execute(
+        text(
+            """
+            CREATE TABLE vendor (
+                id INTEGER PRIMARY KEY,
+                created_at DATETIME NOT NULL,
+                updated_at DATETIME NOT NULL,
+                name VARCHAR NOT NULL,
+                description VARCHAR,
+                vendor_image VARCHAR,
+                url VARCHAR,
+                api_url VARCHAR,
+                note VARCHAR,
+                status VARCHAR NOT NULL
+            )
+            """
+        )
+    )
+    connection.execute(
+        text(
+            f"""
+            CREATE TABLE model (
+                id INTEGER PRIMARY KEY,
+                created_at DATETIME NOT NULL,
+                updated_at DATETIME NOT NULL,
+                vendor_id INTEGER NOT NULL,
+                model VARCHAR NOT NULL,
+                vendor_model_id VARCHAR,
+                description VARCHAR,
+                model_image VARCHAR,
+                max_context_tokens INTEGER,
+                max_output_tokens INTEGER,
+                model_capability VARCHAR,
+                model_url VARCHAR,
+                price_model VARCHAR,
+                price_currency VARCHAR,
+                price_data VARCHAR,
+                note VARCHAR,
+                license VARCHAR,
+                status VARCHAR NOT NULL,
+                {model_columns}
+                FOREIGN KEY(vendor_id) REFERENCES vendor(id)
+            )
+            """
+        )
+    )
+    connection.execute(text("CREATE INDEX ix_model_model ON model (model)"))
+    connection.execute(
+        text(
+            "INSERT INTO vendor (id, created_at, updated_at, name, status) "
+            "VALUES (1, '2024-01-01', '2024-01-01', 'OpenAI', 'enabled')"
+        )
+    )
+
+
 def test_init_db_adds_release_date_column(tmp_path, monkeypatch):
     db_path = tmp_path / "legacy.db"
     engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
 
     with engine.begin() as connection:
+        create_legacy_schema(connection)
         connection.execute(
             text(
-                """
-                CREATE TABLE vendor (
-                    id INTEGER PRIMARY KEY,
-                    created_at DATETIME NOT NULL,
-                    updated_at DATETIME NOT NULL,
-                    name VARCHAR NOT NULL,
-                    description VARCHAR,
-                    vendor_image VARCHAR,
-                    url VARCHAR,
-                    api_url VARCHAR,
-                    note VARCHAR,
-                    status VARCHAR NOT NULL
-                )
-                """
-            )
-        )
-        connection.execute(
-            text(
-                """
-                CREATE TABLE model (
-                    id INTEGER PRIMARY KEY,
-                    created_at DATETIME NOT NULL,
-                    updated_at DATETIME NOT NULL,
-                    vendor_id INTEGER NOT NULL,
-                    model VARCHAR NOT NULL,
-                    vendor_model_id VARCHAR,
-                    description VARCHAR,
-                    model_image VARCHAR,
-                    max_context_tokens INTEGER,
-                    max_output_tokens INTEGER,
-                    model_capability VARCHAR,
-                    model_url VARCHAR,
-                    price_model VARCHAR,
-                    price_currency VARCHAR,
-                    price_data VARCHAR,
-                    note VARCHAR,
-                    license VARCHAR,
-                    status VARCHAR NOT NULL,
-                    FOREIGN KEY(vendor_id) REFERENCES vendor(id)
-                )
-                """
-            )
+                "INSERT INTO model (id, created_at, updated_at, vendor_id, model, model_capability, license, "
+                "price_model, price_data, status) VALUES (1, '2024-01-01', '2024-01-01', 1, 'gpt-4', "
+                ":capabilities, '[]', 'token', :price_data, 'enabled')"
+            ),
+            {
+                # Double-encoded values as written by older releases.
+                "capabilities": json.dumps(json.dumps(["chat", "code"])),
+                "price_data": json.dumps(json.dumps({"base": {"input_token_1m": 30.0, "output_token_1m": 60.0}})),
+            },
         )
 
     monkeypatch.setattr(database, "engine", engine, raising=False)
@@ -63,3 +91,173 @@ def test_init_db_adds_release_date_column(tmp_path, monkeypatch):
 
     assert "release_date" in columns
     assert "categories" in columns
+
+    with engine.connect() as connection:
+        row = connection.execute(
+            text("SELECT price_headline, price_input, price_output, price_per_call FROM model WHERE id = 1")
+        ).one()
+    assert tuple(row) == (30.0, 30.0, 60.0, None)
+
+    with engine.connect() as connection:
+        row = connection.execute(text("SELECT model_capability, license, price_data FROM model WHERE id = 1")).one()
+    assert row.model_capability == '["chat", "code"]'
+    assert row.license is None
+    assert json.loads(row.price_data) == {"base": {"input_token_1m": 30.0, "output_token_1m": 60.0}}
+
+    database.init_db()
+    with engine.connect() as connection:
+        applied = connection.execute(text("SELECT name FROM schema_migration ORDER BY version")).scalars().all()
+    assert applied == [migration.name for migration in database.MIGRATIONS]
+
+    from app.models.model import MODEL_CONTENT_FIELDS, Model
+    from app.utils.hashing import content_hash
+
+    with engine.connect() as connection:
+        row = connection.execute(select(Model.__table__).where(Model.__table__.c.id == 1)).mappings().one()
+    assert row["content_hash"] == content_hash(row, MODEL_CONTENT_FIELDS)
+
+    with engine.connect() as connection:
+        indexes = set(
+            connection.execute(text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'model'")).scalars()
+        )
+    assert "ix_model_model" not in indexes
+    assert {"ix_model_sort_model", "ix_model_enabled_sort_price_asc", "ix_model_vendor_id_status"} <= indexes
+
+
+def test_init_db_backfills_model_tag_links(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'tags.db'}", connect_args={"check_same_thread": False})
+    monkeypatch.setattr(database, "engine", engine, raising=False)
+
+    with engine.begin() as connection:
+        create_legacy_schema(connection, "release_date DATE, categories VARCHAR,")
+        connection.execute(
+            text(
+                "INSERT INTO model (id, created_at, updated_at, vendor_id, model, model_capability, "
+                "license, categories, status) VALUES (1, '2024-01-01', '2024-01-01', 1, 'gpt-4', "
+                ":capabilities, :license, :categories, 'enabled')"
+            ),
+            {
+                "capabilities": json.dumps(["chat", "code"]),
+                "license": json.dumps(["commercial"]),
+                # Double-encoded value as produced by older imports.
+                "categories": json.dumps(json.dumps(["文本生成"], ensure_ascii=False), ensure_ascii=False),
+            },
+        )
+
+    applied = [migration.name for migration in database.migrate()]
+
+    assert "add_model_release_date" not in applied and "add_model_categories" not in applied
+    assert applied == [migration.name for migration in database.MIGRATIONS[3:]]
+    with engine.connect() as connection:
+        capabilities = connection.execute(text("SELECT value FROM model_capability_link ORDER BY value")).scalars()
+        assert list(capabilities) == ["chat", "code"]
+        assert connection.execute(text("SELECT value FROM model_license_link")).scalars().all() == ["commercial"]
+        assert connection.execute(text("SELECT value FROM model_category_link")).scalars().all() == ["文本生成"]
+        assert connection.execute(text("SELECT categories FROM model")).scalar() == '["文本生成"]'
+        assert connection.execute(text("SELECT version FROM catalog_state")).scalar() == 0
+        assert database.schema_version(connection) == database.SCHEMA_VERSION
+
+
+def test_init_db_refuses_duplicate_vendor_model_ids(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'duplicates.db'}", connect_args={"check_same_thread": False})
+    monkeypatch.setattr(database, "engine", engine, raising=False)
+
+    with engine.begin() as connection:
+        create_legacy_schema(connection)
+        for model_id, vendor_model_id in ((1, "gpt-4"), (2, "GPT-4")):
+            connection.execute(
+                text(
+                    "INSERT INTO model (id, created_at, updated_at, vendor_id, model, vendor_model_id, status) "
+                    "VALUES (:id, '2024-01-01', '2024-01-01', 1, 'gpt-4', :vendor_model_id, 'enabled')"
+                ),
+                {"id": model_id, "vendor_model_id": vendor_model_id},
+            )
+
+    with pytest.raises(RuntimeError, match="vendor 1 / 'gpt-4' \\(2 rows\\)"):
+        database.init_db()
+
+
+def test_versioned_migrations_run_once_and_startup_only_reads_the_version(tmp_path, monkeypatch):
+    from sqlalchemy import event
+
+    from app.core.migrations import Migration
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'versions.db'}", connect_args={"check_same_thread": False})
+    monkeypatch.setattr(database, "engine", engine, raising=False)
+    database.init_db()
+
+    statements: list[str] = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+    database.init_db()
+    assert len(statements) == 2
+    assert "max(schema_migration.version)" in statements[0]
+
+    def add_column(connection) -> None:
+        connection.execute(text("ALTER TABLE model ADD COLUMN extra VARCHAR"))
+
+    def broken(connection) -> None:
+        connection.execute(text("ALTER TABLE model ADD COLUMN half_done VARCHAR"))
+        raise RuntimeError("broken migration")
+
+    current = database.SCHEMA_VERSION
+    extra = Migration(current + 1, "add_model_extra", add_column)
+    monkeypatch.setattr(database, "MIGRATIONS", [*database.MIGRATIONS, extra])
+    monkeypatch.setattr(database, "SCHEMA_VERSION", current + 1)
+    monkeypatch.setattr(database.settings, "auto_migrate", False)
+    with pytest.raises(
+        RuntimeError, match=f"at version {current} but this release needs {current + 1}; run `python -m app.migrate`"
+    ):
+        database.init_db()
+
+    assert database.migrate() == [extra]
+    assert database.migrate() == []
+    database.init_db()
+
+    monkeypatch.setattr(database, "MIGRATIONS", [*database.MIGRATIONS, Migration(current + 2, "broken", broken)])
+    with pytest.raises(RuntimeError, match="broken migration"):
+        database.migrate()
+    columns = {column["name"] for column in inspect(engine).get_columns("model")}
+    assert "extra" in columns
+    # DDL and the version record commit together, so a failed migration leaves nothing behind.
+    assert "half_done" not in columns
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT version, name FROM schema_migration ORDER BY version")).all()[-2:] == [
+            (current, database.MIGRATIONS[current - 1].name),
+            (current + 1, "add_model_extra"),
+        ]
+
+
+def test_fresh_database_is_created_at_the_latest_version(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'fresh.db'}", connect_args={"check_same_thread": False})
+    monkeypatch.setattr(database, "engine", engine, raising=False)
+
+    assert database.migrate() == database.MIGRATIONS
+    with engine.connect() as connection:
+        assert database.schema_version(connection) == database.SCHEMA_VERSION
+        assert connection.execute(text("SELECT version FROM catalog_state")).scalar() == 0
+
+
+def test_concurrent_migrations_on_a_fresh_database(tmp_path, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    from threading import Barrier
+
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'fresh.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+        pool_size=8,
+    )
+    monkeypatch.setattr(database, "engine", engine, raising=False)
+    barrier = Barrier(8)
+
+    def start() -> None:
+        barrier.wait()
+        database.init_db()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for future in [executor.submit(start) for _ in range(8)]:
+            future.result()
+
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT version FROM schema_migration")).scalars().all() == [
+            migration.version for migration in database.MIGRATIONS
+        ]
@@ -1,5 +1,6 @@
 import json
 
+import pytest
 from fastapi.testclient import TestClient
 
 from .test_vendor import VENDOR_PAYLOAD
@@ -131,3 +132,857 @@ def test_model_bulk_import_export(client: TestClient, admin_headers: dict[str, s
     )
     assert updated_item["description"] == "Updated description"
     assert "analysis" in updated_item["modelCapability"]
+
+
+def test_model_export_streams_json_and_ndjson(client: TestClient, admin_headers: dict[str, str], monkeypatch):
+    from app.api import streaming
+    from app.core.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "export_batch_size", 2)
+    monkeypatch.setattr(streaming, "STREAM_CHUNK_BYTES", 100)
+    vendor_id = create_vendor(client, admin_headers)
+    for index in range(5):
+        payload = {**MODEL_PAYLOAD, "vendor_id": vendor_id, "model": f"m{index}", "vendor_model_id": f"m{index}"}
+        assert client.post("/api/admin/models", json=payload, headers=admin_headers).status_code == 201
+
+    items = client.get("/api/admin/models/export", headers=admin_headers).json()
+    assert [item["vendorModelId"] for item in items] == [f"m{index}" for index in range(5)]
+    assert items[0]["vendorName"] == VENDOR_PAYLOAD["name"]
+    assert items[0]["model_image"] == MODEL_PAYLOAD["model_image"]
+    assert items[0]["releaseDate"] == "2024-01-01"
+
+    response = client.get("/api/admin/models/export", params={"format": "ndjson"}, headers=admin_headers)
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in response.text.splitlines()] == items
+
+    response = client.get("/api/admin/models/export", params={"format": "ndjson", "gzip": "true"}, headers=admin_headers)
+    # httpx decodes the gzip transfer transparently.
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.num_bytes_downloaded < len(response.content)
+    assert [json.loads(line) for line in response.text.splitlines()] == items
+
+    import_result = client.post("/api/admin/models/import", json={"items": items}, headers=admin_headers).json()
+    assert (import_result["created"], import_result["updated"], import_result["unchanged"]) == (0, 0, 5)
+
+    assert client.get("/api/admin/models/export", params={"format": "xml"}, headers=admin_headers).status_code == 422
+
+
+def test_model_bulk_import_is_set_based(client: TestClient, admin_headers: dict[str, str], monkeypatch):
+    from sqlalchemy import event
+
+    from app.core.config import get_settings
+
+    from .conftest import TEST_ENGINE
+
+    monkeypatch.setattr(get_settings(), "import_batch_size", 100)
+    create_vendor(client, admin_headers)
+    item = {
+        "vendorName": VENDOR_PAYLOAD["name"].upper(),
+        "priceModel": "token",
+        "priceCurrency": "USD",
+        "priceData": {"base": {"input_token_1m": 1.0}},
+        "modelCapability": ["chat"],
+    }
+    items = [{**item, "model": f"model-{index}", "vendorModelId": f"model-{index}"} for index in range(45)]
+    items.insert(3, {**item, "model": "dup", "vendorModelId": "MODEL-0"})
+    items.insert(5, {**item, "vendorName": "missing", "model": "x", "vendorModelId": "x"})
+
+    statements: list[str] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(TEST_ENGINE, "before_cursor_execute", capture)
+    try:
+        response = client.post("/api/admin/models/import", json={"items": items}, headers=admin_headers)
+    finally:
+        event.remove(TEST_ENGINE, "before_cursor_execute", capture)
+
+    assert response.status_code == 200
+    result = response.json()
+    assert (result["created"], result["updated"]) == (45, 0)
+    assert [error.split(":")[0] for error in result["errors"]] == ["Row 4", "Row 6"]
+    assert "does not exist" in result["errors"][1]
+    # Round-trips grow with the number of batches, not with the number of rows.
+    assert len(statements) < 20
+
+    monkeypatch.setattr(get_settings(), "import_batch_size", 10)
+
+    items = [{**item, "model": f"model-{index}", "vendorModelId": f"MODEL-{index}", "modelCapability": ["code"]} for index in range(50)]
+    result = client.post("/api/admin/models/import", json={"items": items}, headers=admin_headers).json()
+    assert (result["created"], result["updated"], result["errors"]) == (5, 45, [])
+
+    response = client.get("/api/public/models", params={"capabilities": "code", "page_size": 1})
+    assert response.json()["total"] == 50
+    response = client.get("/api/public/models", params={"capabilities": "chat", "page_size": 1})
+    assert response.json()["total"] == 0
+
+
+def test_model_ndjson_import_commits_per_chunk(client: TestClient, admin_headers: dict[str, str], monkeypatch):
+    import gzip
+
+    from sqlalchemy.exc import OperationalError
+
+    from app.repositories.model_repository import ModelRepository
+
+    create_vendor(client, admin_headers)
+    item = {"vendorName": VENDOR_PAYLOAD["name"], "priceModel": "token", "modelCapability": ["chat"]}
+    lines = [json.dumps({**item, "model": f"m{index}", "vendorModelId": f"m{index}"}) for index in range(7)]
+    lines[2] = "{not json"
+    lines[4] = json.dumps({**item, "model": "x"})
+    body = ("\n".join(lines[:3]) + "\n\n" + "\n".join(lines[3:]) + "\n").encode("utf-8")
+    headers = {**admin_headers, "Content-Type": "application/x-ndjson"}
+
+    response = client.post("/api/admin/models/import/ndjson", params={"chunk_size": 3}, content=body, headers=headers)
+    assert response.status_code == 200
+    result = response.json()
+    assert (result["created"], result["updated"], result["completed"], result["next_offset"]) == (5, 0, True, 7)
+    assert [(chunk["offset"], chunk["items"], chunk["created"]) for chunk in result["chunks"]] == [(0, 3, 2), (3, 3, 2), (6, 1, 1)]
+    assert result["errors"][0].startswith("Row 3: invalid item (__root__: ")
+    assert result["errors"][1] == "Row 5: vendor model id is required"
+    assert result["chunks"][1]["errors"] == [result["errors"][1]]
+
+    # Resume from an offset, gzip-compressed; a failing chunk stops the import where it can be resumed.
+    calls = []
+    upsert = ModelRepository.upsert
+
+    def flaky_upsert(self, session, rows, **kwargs):
+        calls.append(rows)
+        if len(calls) == 2:
+            raise OperationalError("INSERT", {}, Exception("database is locked"))
+        return upsert(self, session, rows, **kwargs)
+
+    monkeypatch.setattr(ModelRepository, "upsert", flaky_upsert)
+    response = client.post(
+        "/api/admin/models/import/ndjson",
+        params={"chunk_size": 2, "offset": 3},
+        content=gzip.compress(body),
+        headers={**headers, "Content-Encoding": "gzip"},
+    )
+    result = response.json()
+    assert (result["updated"], result["unchanged"], result["completed"], result["next_offset"]) == (0, 1, False, 5)
+    assert result["errors"] == ["Row 5: vendor model id is required", "Rows 6-7: import failed, nothing written (OperationalError)"]
+
+
+def test_model_ndjson_import_rejects_bad_gzip_bodies(client: TestClient, admin_headers: dict[str, str]):
+    import gzip
+
+    create_vendor(client, admin_headers)
+    lines = [
+        json.dumps({"vendorName": VENDOR_PAYLOAD["name"], "model": f"m{index}", "vendorModelId": f"m{index}"})
+        for index in range(50)
+    ]
+    compressed = gzip.compress(("\n".join(lines) + "\n").encode("utf-8"))
+    corrupt = compressed[:20] + bytes(byte ^ 0xFF for byte in compressed[20:40]) + compressed[40:]
+    headers = {**admin_headers, "Content-Type": "application/x-ndjson", "Content-Encoding": "gzip"}
+
+    for body in (compressed[: len(compressed) // 2], corrupt, b"not gzip at all"):
+        response = client.post("/api/admin/models/import/ndjson", params={"chunk_size": 1}, content=body, headers=headers)
+        assert response.status_code == 400
+        assert response.json()["detail"].startswith("Request body is not valid gzip data")
+    # Rejected before the first chunk, so nothing was imported.
+    assert client.get("/api/admin/models", headers=admin_headers).json()["total"] == 0
+
+
+def test_model_import_runs_as_background_job(client: TestClient, admin_headers: dict[str, str], monkeypatch):
+    import time
+
+    from app.core.jobs import import_jobs
+
+    create_vendor(client, admin_headers)
+    items = [{"vendorName": VENDOR_PAYLOAD["name"], "model": f"m{index}", "vendorModelId": f"m{index}"} for index in range(5)]
+    items.append({"vendorName": "missing", "model": "x", "vendorModelId": "x"})
+
+    response = client.post("/api/admin/models/import", params={"async": "true"}, json={"items": items}, headers=admin_headers)
+    assert response.status_code == 202
+    job = response.json()
+    assert (job["kind"], job["total"]) == ("model_import", 6)
+
+    deadline = time.monotonic() + 10
+    while job["status"] in ("queued", "running") and time.monotonic() < deadline:
+        time.sleep(0.01)
+        job = client.get(f"/api/admin/jobs/{job['id']}", headers=admin_headers).json()
+    assert job["status"] == "succeeded"
+    assert job["processed"] == 6 and job["duration_seconds"] >= 0
+    # Same result as the synchronous import, which runs in the same single transaction.
+    assert job["result"] == {
+        "created": 5,
+        "updated": 0,
+        "unchanged": 0,
+        "errors": ["Row 6: vendor 'missing' does not exist"],
+    }
+    assert client.get("/api/admin/models", headers=admin_headers).json()["total"] == 5
+
+    monkeypatch.setattr(import_jobs, "max_pending", 0)
+    response = client.post("/api/admin/models/import", params={"async": "true"}, json={"items": items}, headers=admin_headers)
+    assert response.status_code == 429
+    assert client.get("/api/admin/jobs/unknown", headers=admin_headers).status_code == 404
+
+
+def test_background_model_import_reports_progress_per_batch(
+    client: TestClient, admin_headers: dict[str, str], monkeypatch
+):
+    import threading
+    import time
+
+    from app.core.config import get_settings
+    from app.repositories.search_index import model_search_index
+
+    monkeypatch.setattr(get_settings(), "import_batch_size", 2)
+    create_vendor(client, admin_headers)
+    items = [{"vendorName": VENDOR_PAYLOAD["name"], "model": f"m{index}", "vendorModelId": f"m{index}"} for index in range(5)]
+    items.append({"vendorName": "missing", "model": "x", "vendorModelId": "x"})
+
+    # Hold the import inside its second batch, after the first one was written.
+    refresh = model_search_index.refresh
+    batches = []
+    reached, release = threading.Event(), threading.Event()
+
+    def slow_refresh(session, model_ids):
+        batches.append(model_ids)
+        if len(batches) == 2:
+            reached.set()
+            release.wait(10)
+        return refresh(session, model_ids)
+
+    monkeypatch.setattr(model_search_index, "refresh", slow_refresh)
+    job = client.post("/api/admin/models/import", params={"async": "true"}, json={"items": items}, headers=admin_headers).json()
+    assert reached.wait(10)
+    running = client.get(f"/api/admin/jobs/{job['id']}", headers=admin_headers).json()
+    release.set()
+    # The rejected row plus the first batch of two.
+    assert (running["status"], running["processed"], running["total"]) == ("running", 3, 6)
+
+    deadline = time.monotonic() + 10
+    while job["status"] in ("queued", "running") and time.monotonic() < deadline:
+        time.sleep(0.01)
+        job = client.get(f"/api/admin/jobs/{job['id']}", headers=admin_headers).json()
+    assert (job["status"], job["processed"]) == ("succeeded", 6)
+
+
+def test_background_model_import_is_all_or_nothing(client: TestClient, admin_headers: dict[str, str], tmp_path, monkeypatch):
+    import time
+
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.exc import OperationalError
+
+    from app.api.deps import get_session_factory
+    from app.core import database
+    from app.core.config import get_settings
+    from app.main import app
+    from app.repositories.model_repository import ModelRepository
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}", connect_args={"check_same_thread": False})
+    monkeypatch.setattr(database, "engine", engine)
+    database.init_db()
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO vendor (created_at, updated_at, name, status) "
+                "VALUES ('2024-01-01', '2024-01-01', :name, 'enabled')"
+            ),
+            {"name": VENDOR_PAYLOAD["name"]},
+        )
+    monkeypatch.setitem(app.dependency_overrides, get_session_factory, lambda: database.session_context)
+
+    replace_tags = ModelRepository.replace_tags
+
+    def fail_on_last_model(self, session, tags_by_model):
+        if 3 in tags_by_model:
+            raise OperationalError("INSERT INTO model_capability_link", {}, Exception("disk I/O error"))
+        return replace_tags(self, session, tags_by_model)
+
+    # Even with one-item chunks configured, nothing may be committed before the failing row.
+    monkeypatch.setattr(get_settings(), "import_chunk_size", 1)
+    monkeypatch.setattr(ModelRepository, "replace_tags", fail_on_last_model)
+    items = [{"vendorName": VENDOR_PAYLOAD["name"], "model": f"m{index}", "vendorModelId": f"m{index}"} for index in range(3)]
+    job = client.post("/api/admin/models/import", params={"async": "true"}, json={"items": items}, headers=admin_headers).json()
+
+    deadline = time.monotonic() + 10
+    while job["status"] in ("queued", "running") and time.monotonic() < deadline:
+        time.sleep(0.01)
+        job = client.get(f"/api/admin/jobs/{job['id']}", headers=admin_headers).json()
+    assert job["status"] == "failed"
+    # The models upserted before the failure were rolled back with it.
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT count(*) FROM model")).scalar() == 0
+
+
+@pytest.mark.parametrize("on_conflict", [True, False], ids=["on_conflict", "lookup_fallback"])
+def test_vendor_model_ids_are_unique_per_vendor(
+    client: TestClient, admin_headers: dict[str, str], session, monkeypatch, on_conflict: bool
+):
+    from app.repositories import model_repository
+    from app.repositories.model_repository import ModelRepository
+
+    if not on_conflict:
+        # As on a dialect without INSERT ... ON CONFLICT.
+        monkeypatch.setattr(model_repository, "_UPSERT_INSERTS", {})
+
+    vendor_id = create_vendor(client, admin_headers)
+    payload = {**MODEL_PAYLOAD, "vendor_id": vendor_id}
+    first = client.post("/api/admin/models", json=payload, headers=admin_headers).json()
+
+    duplicate = {**payload, "vendor_model_id": payload["vendor_model_id"].upper()}
+    assert client.post("/api/admin/models", json=duplicate, headers=admin_headers).status_code == 409
+    second = client.post("/api/admin/models", json={**payload, "vendor_model_id": "other"}, headers=admin_headers).json()
+    response = client.put(
+        f"/api/admin/models/{second['id']}", json={"vendor_model_id": "GPT-4-2024"}, headers=admin_headers
+    )
+    assert response.status_code == 409
+    response = client.put(f"/api/admin/models/{first['id']}", json={"vendor_model_id": "GPT-4-2024"}, headers=admin_headers)
+    assert response.status_code == 200
+
+    # A row the caller did not know about (e.g. written by a concurrent import) is updated in place.
+    ids = ModelRepository().upsert(
+        session,
+        [
+            {"vendor_id": vendor_id, "model": "renamed", "vendor_model_id": "gpt-4-2024"},
+            {"vendor_id": vendor_id, "model": "new", "vendor_model_id": "new"},
+        ],
+    )
+    assert ids[0] == first["id"] and ids[1] not in (first["id"], second["id"])
+    # The upsert bypasses the identity map; drop the ORM copies the earlier requests loaded.
+    session.expire_all()
+    models = client.get("/api/admin/models", headers=admin_headers).json()["items"]
+    assert sorted((item["model"], item["vendor_model_id"]) for item in models) == [
+        ("gpt-4", "other"),
+        ("new", "new"),
+        ("renamed", "gpt-4-2024"),
+    ]
+    renamed = next(item for item in models if item["model"] == "renamed")
+    assert renamed["description"] == MODEL_PAYLOAD["description"]
+
+
+def test_model_import_skips_unchanged_rows_and_supports_dry_run(client: TestClient, admin_headers: dict[str, str], session):
+    vendor_id = create_vendor(client, admin_headers)
+    model = client.post("/api/admin/models", json={**MODEL_PAYLOAD, "vendor_id": vendor_id}, headers=admin_headers).json()
+
+    response = client.put(f"/api/admin/models/{model['id']}", json=MODEL_PAYLOAD | {"vendor_id": vendor_id}, headers=admin_headers)
+    assert response.json()["updated_at"] == model["updated_at"]
+
+    items = client.get("/api/admin/models/export", headers=admin_headers).json()
+    items[0]["description"] = "Changed"
+    items.append({**items[0], "model": "new", "vendorModelId": "new"})
+
+    result = client.post("/api/admin/models/import", params={"dry_run": "true"}, json={"items": items}, headers=admin_headers).json()
+    assert (result["created"], result["updated"], result["unchanged"]) == (1, 1, 0)
+    assert client.get("/api/admin/models", headers=admin_headers).json()["total"] == 1
+    assert client.get(f"/api/admin/models/{model['id']}", headers=admin_headers).json()["description"] == MODEL_PAYLOAD["description"]
+
+    result = client.post("/api/admin/models/import", json={"items": items}, headers=admin_headers).json()
+    assert (result["created"], result["updated"], result["unchanged"]) == (1, 1, 0)
+    session.expire_all()  # the upsert bypasses the identity map shared by these requests
+    updated = client.get(f"/api/admin/models/{model['id']}", headers=admin_headers).json()
+    assert updated["description"] == "Changed" and updated["updated_at"] != model["updated_at"]
+
+    result = client.post("/api/admin/models/import", json={"items": items}, headers=admin_headers).json()
+    assert (result["created"], result["updated"], result["unchanged"]) == (0, 0, 2)
+    assert client.get(f"/api/admin/models/{model['id']}", headers=admin_headers).json()["updated_at"] == updated["updated_at"]
+
+
+def test_model_tag_filters_match_exactly(client: TestClient, admin_headers: dict[str, str]):
+    vendor_id = create_vendor(client, admin_headers)
+    for name, capabilities in (
+        ("chat-model", ["chat"]),
+        ("vision-model", ["chat-vision"]),
+        ("code-model", ["chat", "code"]),
+    ):
+        payload = MODEL_PAYLOAD.copy()
+        payload.update(vendor_id=vendor_id, model=name, vendor_model_id=name, model_capability=capabilities)
+        response = client.post("/api/admin/models", json=payload, headers=admin_headers)
+        assert response.status_code == 201
+
+    response = client.get("/api/public/models", params={"capabilities": "chat"})
+    assert {item["model"] for item in response.json()["items"]} == {"chat-model", "code-model"}
+
+    response = client.get("/api/public/models", params={"capabilities": "chat,code"})
+    assert [item["model"] for item in response.json()["items"]] == ["code-model"]
+
+    response = client.get(
+        "/api/public/models", params={"capabilities": "code,chat-vision", "match": "any"}
+    )
+    assert {item["model"] for item in response.json()["items"]} == {"vision-model", "code-model"}
+
+    response = client.get("/api/public/models", params={"categories": "文本生成", "license": "commercial"})
+    assert response.json()["total"] == 3
+
+
+def _create_search_fixtures(client: TestClient, admin_headers: dict[str, str]) -> None:
+    vendor_id = create_vendor(client, admin_headers)
+    for name, description in (
+        ("gpt-4o", "Omni model with vision"),
+        ("gpt-4o-mini", "Small omni model"),
+        ("o1", "Reasoning model, successor of gpt-4o"),
+    ):
+        payload = MODEL_PAYLOAD.copy()
+        payload.update(vendor_id=vendor_id, model=name, vendor_model_id=name, description=description)
+        assert client.post("/api/admin/models", json=payload, headers=admin_headers).status_code == 201
+
+
+def test_model_search_ranks_by_relevance(client: TestClient, admin_headers: dict[str, str]):
+    from app.repositories.search_index import model_search_index
+
+    assert model_search_index.available
+    _create_search_fixtures(client, admin_headers)
+
+    response = client.get("/api/public/models", params={"search": "gpt-4o", "sort": "relevance"})
+    names = [item["model"] for item in response.json()["items"]]
+    assert set(names) == {"gpt-4o", "gpt-4o-mini", "o1"}
+    assert names[-1] == "o1"
+
+    response = client.get("/api/public/models", params={"search": "omni small"})
+    assert [item["model"] for item in response.json()["items"]] == ["gpt-4o-mini"]
+
+    response = client.get("/api/public/models", params={"search": "openai reasoning"})
+    assert [item["model"] for item in response.json()["items"]] == ["o1"]
+
+    vendor_id = client.get("/api/public/vendors").json()["items"][0]["id"]
+    client.put(f"/api/admin/vendors/{vendor_id}", json={"name": "ClosedAI"}, headers=admin_headers)
+    response = client.get("/api/public/models", params={"search": "closedai reasoning"})
+    assert [item["model"] for item in response.json()["items"]] == ["o1"]
+
+
+def test_model_search_falls_back_without_fts(client: TestClient, admin_headers: dict[str, str], monkeypatch):
+    from app.repositories.search_index import model_search_index
+
+    _create_search_fixtures(client, admin_headers)
+    monkeypatch.setattr(model_search_index, "available", False)
+
+    response = client.get("/api/public/models", params={"search": "omni small", "sort": "relevance"})
+    assert [item["model"] for item in response.json()["items"]] == ["gpt-4o-mini"]
+
+
+def test_model_price_sort_runs_in_sql(client: TestClient, admin_headers: dict[str, str]):
+    vendor_id = create_vendor(client, admin_headers)
+    prices = {
+        "cheap": ("token", {"base": {"input_token_1m": 1.0, "output_token_1m": 2.0}}),
+        "mid": ("call", {"base": {"price_per_call": 5}}),
+        "pricey": ("tiered", {"tiers": [{"input_price_per_unit": "12.5"}]}),
+        "free": ("free", {"base": {}}),
+        "unpriced": ("token", None),
+    }
+    for name, (price_model, price_data) in prices.items():
+        payload = MODEL_PAYLOAD.copy()
+        payload.update(
+            vendor_id=vendor_id, model=name, vendor_model_id=name, price_model=price_model, price_data=price_data
+        )
+        response = client.post("/api/admin/models", json=payload, headers=admin_headers)
+        assert response.status_code == 201
+
+    response = client.get("/api/public/models", params={"sort": "price_asc"})
+    assert [item["model"] for item in response.json()["items"]] == ["free", "cheap", "mid", "pricey", "unpriced"]
+
+    response = client.get("/api/public/models", params={"sort": "price_desc", "page": 2, "page_size": 2})
+    data = response.json()
+    assert data["total"] == 5
+    assert [item["model"] for item in data["items"]] == ["cheap", "free"]
+
+    model_id = next(item["id"] for item in response.json()["items"] if item["model"] == "cheap")
+    client.put(
+        f"/api/admin/models/{model_id}",
+        json={"price_data": {"base": {"input_token_1m": 50.0}}},
+        headers=admin_headers,
+    )
+    response = client.get("/api/public/models", params={"sort": "price_desc", "page_size": 1})
+    assert response.json()["items"][0]["model"] == "cheap"
+
+
+def test_model_cursor_pagination_matches_offset_order(client: TestClient, admin_headers: dict[str, str]):
+    vendor_id = create_vendor(client, admin_headers)
+    for index, (release_date, price) in enumerate(
+        [("2024-01-01", 3.0), (None, None), ("2023-06-01", 1.0), ("2024-01-01", None), (None, 3.0), ("2025-02-01", 0.5)]
+    ):
+        payload = MODEL_PAYLOAD.copy()
+        payload.update(
+            vendor_id=vendor_id,
+            model=f"Model-{index % 3}",
+            vendor_model_id=f"model-{index}",
+            release_date=release_date,
+            price_data={"base": {"input_token_1m": price}} if price is not None else None,
+        )
+        assert client.post("/api/admin/models", json=payload, headers=admin_headers).status_code == 201
+
+    sorts = [None, "relevance"] + [
+        f"{key}_{direction}"
+        for key in ("vendor", "model", "release", "created", "updated", "price")
+        for direction in ("asc", "desc")
+    ]
+    for sort in sorts:
+        params = {"sort": sort, "search": "model"} if sort else {}
+        expected = [
+            item["id"]
+            for item in client.get("/api/public/models", params={**params, "page_size": 100}).json()["items"]
+        ]
+
+        seen: list[int] = []
+        data = client.get("/api/public/models", params={**params, "page_size": 4}).json()
+        seen.extend(item["id"] for item in data["items"])
+        while data["next_cursor"]:
+            data = client.get(
+                "/api/public/models", params={**params, "page_size": 4, "cursor": data["next_cursor"]}
+            ).json()
+            assert data["total"] is None
+            seen.extend(item["id"] for item in data["items"])
+        assert seen == expected, sort
+
+    response = client.get("/api/public/models", params={"sort": "price_asc", "cursor": "bogus"})
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "sort,keys",
+    [
+        ("created_desc", [[1], 2]),
+        ("created_desc", ["notadate", 2]),
+        ("created_desc", [{"dt": "notadate"}, 2]),
+        ("created_desc", [{"dt": 1}, 2]),
+        ("release_desc", [{"d": "2024-01-01", "x": 1}, 2]),
+        ("release_desc", [{"dt": "2024-01-01T00:00:00"}, 2]),
+        ("price_desc", ["abc", 2]),
+        ("price_asc", [0, True, 2]),
+        ("model_asc", [1, 2]),
+        ("model_asc", ["model-0", "2"]),
+        ("model_asc", ["model-0"]),
+    ],
+)
+def test_model_listing_rejects_tampered_cursors(client: TestClient, sort: str, keys: list):
+    from app.utils.pagination import encode_cursor
+
+    cursor = encode_cursor(sort, keys)
+    response = client.get("/api/public/models", params={"sort": sort, "cursor": cursor})
+    assert response.status_code == 400
+
+
+def test_model_listing_accepts_encoded_cursor_values(client: TestClient, admin_headers: dict[str, str]):
+    from datetime import date, datetime
+
+    from app.utils.pagination import encode_cursor
+
+    payload = MODEL_PAYLOAD.copy()
+    payload["vendor_id"] = create_vendor(client, admin_headers)
+    assert client.post("/api/admin/models", json=payload, headers=admin_headers).status_code == 201
+    for sort, keys, count in [
+        ("created_desc", [datetime(2100, 1, 1), 10**6], 1),
+        ("release_desc", [date(2100, 1, 1), 10**6], 1),
+        ("release_desc", [None, 10**6], 0),
+        ("price_asc", [0, 1.5, 10**6], 1),
+        ("model_asc", ["a", 10**6], 1),
+        ("model_asc", ["zzz", 10**6], 0),
+    ]:
+        response = client.get("/api/public/models", params={"sort": sort, "cursor": encode_cursor(sort, keys)})
+        assert response.status_code == 200, sort
+        assert len(response.json()["items"]) == count, sort
+
+
+def test_model_listing_optional_and_cached_totals(client: TestClient, admin_headers: dict[str, str]):
+    from app.core.catalog import catalog_version
+    from app.repositories.base import count_cache
+
+    vendor_id = create_vendor(client, admin_headers)
+    for index in range(3):
+        payload = MODEL_PAYLOAD.copy()
+        payload.update(vendor_id=vendor_id, model=f"model-{index}", vendor_model_id=f"model-{index}")
+        client.post("/api/admin/models", json=payload, headers=admin_headers)
+
+    data = client.get("/api/public/models", params={"page_size": 2, "include_total": "false"}).json()
+    assert data["total"] is None
+    assert data["has_more"] is True
+    data = client.get("/api/public/models", params={"page": 2, "page_size": 2, "include_total": "false"}).json()
+    assert [item["model"] for item in data["items"]] == ["model-0"]
+    assert data["has_more"] is False
+
+    version = catalog_version.value
+    data = client.get("/api/public/models", params={"page_size": 2, "capabilities": "code,chat"}).json()
+    assert data["total"] == 3
+    assert data["has_more"] is True
+    cached_keys = [key for key in count_cache._data if key[0] == "model" and key[1] == version]
+    assert len(cached_keys) == 1
+    data = client.get("/api/public/models", params={"page": 2, "page_size": 2, "capabilities": "chat,code"}).json()
+    assert data["total"] == 3
+    assert [key for key in count_cache._data if key[0] == "model" and key[1] == version] == cached_keys
+
+    payload = MODEL_PAYLOAD.copy()
+    payload.update(vendor_id=vendor_id, model="model-3", vendor_model_id="model-3")
+    client.post("/api/admin/models", json=payload, headers=admin_headers)
+    assert catalog_version.value > version
+    data = client.get("/api/public/models", params={"capabilities": "chat,code"}).json()
+    assert data["total"] == 4
+
+
+def test_model_facets_reflect_filters(client: TestClient, admin_headers: dict[str, str]):
+    vendor_id = create_vendor(client, admin_headers)
+    for name, capabilities, price_model, context in (
+        ("gpt-4", ["chat", "code"], "token", 8192),
+        ("gpt-4-mini", ["chat"], "token", 128000),
+        ("dall-e", ["image"], "call", None),
+    ):
+        payload = MODEL_PAYLOAD.copy()
+        payload.update(
+            vendor_id=vendor_id,
+            model=name,
+            vendor_model_id=name,
+            model_capability=capabilities,
+            price_model=price_model,
+            max_context_tokens=context,
+        )
+        client.post("/api/admin/models", json=payload, headers=admin_headers)
+
+    facets = client.get("/api/public/models/facets").json()
+    assert facets["total"] == 3
+    assert facets["vendors"] == [{"id": vendor_id, "value": VENDOR_PAYLOAD["name"], "count": 3}]
+    assert facets["capabilities"] == [
+        {"value": "chat", "count": 2},
+        {"value": "code", "count": 1},
+        {"value": "image", "count": 1},
+    ]
+    assert facets["price_models"] == [{"value": "token", "count": 2}, {"value": "call", "count": 1}]
+    assert facets["categories"] == [{"value": "文本生成", "count": 3}]
+    assert facets["max_context_tokens"] == {"min": 8192, "max": 128000}
+
+    facets = client.get("/api/public/models/facets", params={"capabilities": "chat"}).json()
+    assert facets["total"] == 2
+    assert {item["value"] for item in facets["capabilities"]} == {"chat", "code"}
+    assert facets["price_models"] == [{"value": "token", "count": 2}]
+
+
+def test_model_batch_lookup(client: TestClient, admin_headers: dict[str, str]):
+    vendor_id = create_vendor(client, admin_headers)
+    ids = []
+    for name in ("gpt-4", "gpt-4-mini"):
+        payload = MODEL_PAYLOAD.copy()
+        payload.update(vendor_id=vendor_id, model=name, vendor_model_id=name)
+        ids.append(client.post("/api/admin/models", json=payload, headers=admin_headers).json()["id"])
+
+    missing_id = max(ids) + 100
+    response = client.get("/api/public/models/batch", params={"ids": f"{ids[1]},{missing_id},{ids[0]},{ids[1]}"})
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["id"] for item in data["items"]] == [ids[1], ids[0]]
+    assert data["items"][0]["vendor"]["name"] == VENDOR_PAYLOAD["name"]
+    assert data["missing"] == [missing_id]
+
+    response = client.post("/api/public/models/batch", json={"ids": [ids[0]]})
+    assert [item["model"] for item in response.json()["items"]] == ["gpt-4"]
+
+    assert client.get("/api/public/models/batch", params={"ids": "1,abc"}).status_code == 422
+
+
+def test_public_responses_are_cached_until_catalog_changes(client: TestClient, admin_headers: dict[str, str]):
+    vendor_id = create_vendor(client, admin_headers)
+    payload = MODEL_PAYLOAD.copy()
+    payload["vendor_id"] = vendor_id
+    model_id = client.post("/api/admin/models", json=payload, headers=admin_headers).json()["id"]
+
+    stats = client.get("/api/admin/system/cache", headers=admin_headers).json()["caches"]["response"]
+    first = client.get("/api/public/models", params={"page_size": 5, "search": "gpt"})
+    second = client.get("/api/public/models", params={"search": "gpt", "page_size": 5})
+    assert first.content == second.content
+    assert first.json()["items"][0]["id"] == model_id
+
+    after = client.get("/api/admin/system/cache", headers=admin_headers).json()["caches"]["response"]
+    assert after["hits"] == stats["hits"] + 1
+    assert after["misses"] == stats["misses"] + 1
+
+    client.put(f"/api/admin/models/{model_id}", json={"description": "Changed"}, headers=admin_headers)
+    detail = client.get(f"/api/public/models/{model_id}").json()
+    assert detail["description"] == "Changed"
+    listing = client.get("/api/public/models", params={"page_size": 5, "search": "gpt"}).json()
+    assert listing["items"][0]["description"] == "Changed"
+
+
+def test_public_responses_support_conditional_requests(client: TestClient, admin_headers: dict[str, str]):
+    vendor_id = create_vendor(client, admin_headers)
+    payload = MODEL_PAYLOAD.copy()
+    payload["vendor_id"] = vendor_id
+    model_id = client.post("/api/admin/models", json=payload, headers=admin_headers).json()["id"]
+
+    response = client.get(f"/api/public/models/{model_id}")
+    etag = response.headers["etag"]
+    last_modified = response.headers["last-modified"]
+    assert response.headers["cache-control"] == "public, no-cache"
+
+    not_modified = client.get(f"/api/public/models/{model_id}", headers={"If-None-Match": f'"x", W/{etag}'})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+    assert client.get(f"/api/public/models/{model_id}", headers={"If-Modified-Since": last_modified}).status_code == 304
+    # A validator from another URL does not match.
+    assert client.get("/api/public/models", headers={"If-None-Match": etag}).status_code == 200
+
+    client.put(f"/api/admin/models/{model_id}", json={"description": "Changed"}, headers=admin_headers)
+    changed = client.get(f"/api/public/models/{model_id}", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["description"] == "Changed"
+
+    currency = client.get("/api/public/currency")
+    assert "last-modified" not in currency.headers
+    assert client.get("/api/public/currency", headers={"If-None-Match": currency.headers["etag"]}).status_code == 304
+
+
+def test_catalog_changes_from_other_processes_invalidate_cache(client: TestClient, session, monkeypatch):
+    from sqlalchemy import text
+
+    from app.api import caching
+
+    monkeypatch.setattr(caching.settings, "catalog_version_poll_seconds", 0)
+    first = client.get("/api/public/vendors")
+    assert client.get("/api/public/vendors", headers={"If-None-Match": first.headers["etag"]}).status_code == 304
+
+    # Simulate another worker committing a write: only the shared catalog_state row changes.
+    session.connection().execute(
+        text("UPDATE catalog_state SET version = version + 1, modified_at = modified_at + 1 WHERE id = 1")
+    )
+    second = client.get("/api/public/vendors", headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 200
+    assert second.headers["etag"] != first.headers["etag"]
+
+
+def test_catalog_changes_from_other_processes_refresh_cached_totals(
+    client: TestClient, admin_headers: dict[str, str], session, monkeypatch
+):
+    from sqlalchemy import text
+
+    from app.core.catalog import CatalogVersion
+    from app.core.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "catalog_version_poll_seconds", 0)
+    vendor_id = create_vendor(client, admin_headers)
+    payload = MODEL_PAYLOAD.copy()
+    payload["vendor_id"] = vendor_id
+    client.post("/api/admin/models", json=payload, headers=admin_headers)
+    assert client.get("/api/admin/models", headers=admin_headers).json()["total"] == 1
+
+    def write_elsewhere(name: str) -> None:
+        # Another worker's insert: the model row and the shared catalog_state row, no in-process bump.
+        session.connection().execute(
+            text(
+                "INSERT INTO model (created_at, updated_at, vendor_id, model, status) "
+                "VALUES ('2024-01-01', '2024-01-01', :vendor_id, :name, 'enabled')"
+            ),
+            {"vendor_id": vendor_id, "name": name},
+        )
+        session.connection().execute(
+            text("UPDATE catalog_state SET version = version + 1, modified_at = modified_at + 1 WHERE id = 1")
+        )
+
+    write_elsewhere("elsewhere-1")
+    data = client.get("/api/admin/models", headers=admin_headers).json()
+    assert data["total"] == len(data["items"]) == 2
+
+    # A process that has not read the catalog state yet must not trust totals cached before it did.
+    monkeypatch.setattr("app.core.catalog.catalog_version._states", CatalogVersion()._states)
+    write_elsewhere("elsewhere-2")
+    assert client.get("/api/public/models").json()["total"] == 3
+    assert client.get("/api/public/models/facets").json()["total"] == 3
+
+
+def test_public_listing_fast_path_matches_model_read(client: TestClient, admin_headers: dict[str, str], session):
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+
+    from app.repositories.model_repository import ModelRepository
+    from app.schemas.common import PaginatedResponse
+    from app.schemas.model import ModelRead
+
+    vendor_id = create_vendor(client, admin_headers)
+    payload = MODEL_PAYLOAD.copy()
+    payload["vendor_id"] = vendor_id
+    client.post("/api/admin/models", json=payload, headers=admin_headers)
+    sparse = {"vendor_id": vendor_id, "model": "sparse", "status": "disabled", "categories": ["视觉", "文本生成"]}
+    client.post("/api/admin/models", json=sparse, headers=admin_headers)
+
+    response = client.get("/api/public/models", params={"page_size": 50, "sort": "model_asc"})
+    result = ModelRepository().search(session, limit=50, sort="model_asc")
+    expected = PaginatedResponse[ModelRead](
+        items=[ModelRead.from_orm(model) for model in result.items],
+        total=result.total,
+        page=1,
+        page_size=50,
+        has_more=result.has_more,
+        next_cursor=result.next_cursor,
+    )
+    assert response.content == JSONResponse(content=jsonable_encoder(expected, by_alias=False)).body
+    assert response.json()["items"][1]["categories"] == ["视觉", "文本生成"]
+
+
+def test_model_fragments_are_cached_per_update(client: TestClient, admin_headers: dict[str, str], session):
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+
+    from app.api.caching import model_fragment_cache
+    from app.models.model import Model
+    from app.schemas.model import ModelRead
+
+    vendor_id = create_vendor(client, admin_headers)
+    payload = MODEL_PAYLOAD.copy()
+    payload["vendor_id"] = vendor_id
+    model_id = client.post("/api/admin/models", json=payload, headers=admin_headers).json()["id"]
+
+    detail = client.get(f"/api/public/models/{model_id}")
+    expected = ModelRead.from_orm(session.get(Model, model_id))
+    assert detail.content == JSONResponse(content=jsonable_encoder(expected, by_alias=False)).body
+    assert client.get("/api/public/models/999999").status_code == 404
+
+    # The response cache is keyed by URL; the batch reuses the fragment rendered for the detail.
+    hits = model_fragment_cache.hits
+    batch = client.post("/api/public/models/batch", json={"ids": [model_id, 999999]})
+    assert batch.json()["missing"] == [999999]
+    assert batch.json()["items"] == [detail.json()]
+    assert model_fragment_cache.hits == hits + 1
+
+    # Vendor updates touch the vendor's updated_at, which is part of the fragment key.
+    client.put(f"/api/admin/vendors/{vendor_id}", json={"name": "Renamed"}, headers=admin_headers)
+    assert client.get(f"/api/public/models/{model_id}").json()["vendor"]["name"] == "Renamed"
+    client.put(f"/api/admin/models/{model_id}", json={"description": "Changed"}, headers=admin_headers)
+    assert client.get(f"/api/public/models/{model_id}").json()["description"] == "Changed"
+
+    stats = client.get("/api/admin/system/cache", headers=admin_headers).json()["caches"]["model_fragment"]
+    assert stats["size"] >= 3
+
+
+def test_model_listing_sparse_fieldsets(client: TestClient, admin_headers: dict[str, str]):
+    from sqlalchemy import event
+
+    from app.tests.conftest import TEST_ENGINE
+
+    vendor_id = create_vendor(client, admin_headers)
+    payload = MODEL_PAYLOAD.copy()
+    payload["vendor_id"] = vendor_id
+    client.post("/api/admin/models", json=payload, headers=admin_headers)
+
+    statements: list[str] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(TEST_ENGINE, "before_cursor_execute", capture)
+    try:
+        response = client.get("/api/public/models", params={"fields": "summary"})
+    finally:
+        event.remove(TEST_ENGINE, "before_cursor_execute", capture)
+    item = response.json()["items"][0]
+    assert list(item) == [
+        "model",
+        "max_context_tokens",
+        "max_output_tokens",
+        "model_capability",
+        "price_model",
+        "price_currency",
+        "id",
+        "vendor",
+        "price_headline",
+    ]
+    assert item["price_headline"] == 30.0
+    assert item["vendor"]["name"] == "OpenAI"
+    listing = next(statement for statement in statements if "FROM model JOIN vendor" in statement)
+    assert "model.description" not in listing and "model.price_data" not in listing
+
+    admin = client.get("/api/admin/models", params={"fields": "model,note"}, headers=admin_headers).json()
+    assert admin["total"] == 1
+    assert admin["items"] == [{"model": "gpt-4", "note": "Flagship model", "id": item["id"]}]
+
+    full = client.get("/api/public/models", params={"fields": "full"}).json()
+    assert full["items"] == client.get("/api/public/models").json()["items"]
+    assert client.get("/api/public/models", params={"fields": "secret"}).status_code == 422
@@ -0,0 +1,70 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.repositories.model_repository import SORT_OPTIONS, ModelRepository
+from app.repositories.vendor_repository import VendorRepository
+
+from .conftest import TEST_ENGINE
+
+
+@contextmanager
+def captured_selects():
+    statements: list[tuple[str, tuple]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(TEST_ENGINE, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(TEST_ENGINE, "before_cursor_execute", capture)
+
+
+def query_plan(session: Session, run) -> str:
+    """EXPLAIN QUERY PLAN of the first SELECT issued by ``run``."""
+    with captured_selects() as statements:
+        run()
+    statement, parameters = statements[0]
+    rows = session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    return "\n".join(row[3] for row in rows)
+
+
+@pytest.mark.parametrize("status", [None, "enabled", "disabled"])
+@pytest.mark.parametrize("sort", sorted(SORT_OPTIONS - {"vendor_asc", "vendor_desc"}))
+def test_model_sorts_scan_an_index_in_order(session: Session, sort: str, status):
+    repo = ModelRepository()
+    plan = query_plan(session, lambda: repo.search(session, sort=sort, status=status, include_total=False))
+
+    assert "USE TEMP B-TREE" not in plan
+    prefix = "ix_model_enabled_sort_" if status == "enabled" else "ix_model_sort_"
+    assert f"SCAN model USING INDEX {prefix}" in plan
+
+
+@pytest.mark.parametrize(
+    "filters, expected",
+    [
+        ({"sort": "vendor_asc"}, "SCAN model USING INDEX"),
+        ({"vendor_id": 1, "status": "enabled"}, "ix_model_vendor_id_status (vendor_id=? AND status=?)"),
+        ({"capabilities": ["chat"]}, "USING COVERING INDEX"),
+        ({"search": "gpt", "sort": "relevance"}, "VIRTUAL TABLE INDEX"),
+    ],
+)
+def test_model_filters_use_indexes(session: Session, filters: dict, expected: str):
+    repo = ModelRepository()
+    plan = query_plan(session, lambda: repo.search(session, include_total=False, **filters))
+
+    assert expected in plan
+    assert "SCAN model\n" not in f"{plan}\n"
+
+
+def test_case_insensitive_lookups_use_expression_indexes(session: Session):
+    plan = query_plan(session, lambda: ModelRepository().get_by_vendor_and_vendor_model_id(session, 1, "GPT-4"))
+    assert "uq_model_vendor_id_lower_vendor_model_id (vendor_id=? AND <expr>=?)" in plan
+
+    plan = query_plan(session, lambda: VendorRepository().get_by_name(session, "OpenAI"))
+    assert "ix_vendor_lower_name (<expr>=?)" in plan
@@ -1,3 +1,4 @@
+import json
 from typing import Iterable, List, Optional
 
 
@@ -21,3 +22,38 @@ def normalize_iterable(values: Optional[Iterable[str]]) -> List[str]:
     if not values:
         return []
     return sorted({value.strip() for value in values if value.strip()})
+
+
+def decode_string_list(value: object) -> List[str]:
+    """Flatten a (possibly JSON-encoded, possibly nested) value into unique strings."""
+
+    def expand(item: object) -> List[str]:
+        if item is None:
+            return []
+        if isinstance(item, list):
+            result: List[str] = []
+            for entry in item:
+                result.extend(expand(entry))
+            return result
+        if isinstance(item, str):
+            stripped = item.strip()
+            if not stripped:
+                return []
+            # Only JSON lists and strings expand further; skip parsing plain values.
+            if stripped[0] not in '["':
+                return [stripped]
+            try:
+                parsed = json.loads(stripped)
+            except Exception:
+                return [stripped]
+            if isinstance(parsed, (list, str)):
+                return expand(parsed)
+            return [stripped]
+        return []
+
+    decoded: List[str] = []
+    for entry in expand(value):
+        normalized = entry.strip()
+        if normalized and normalized not in decoded:
+            decoded.append(normalized)
+    return decoded
@@ -0,0 +1,24 @@
+import hashlib
+import json
+from datetime import date
+from enum import Enum
+from typing import Any, Iterable, Mapping
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def content_hash(values: Mapping[str, Any], fields: Iterable[str]) -> str:
+    """SHA-256 over ``fields`` of ``values`` (missing ones count as null).
+
+    Enums hash as their value and dates as ISO strings, so values read back from the database
+    hash the same as the payload they were written from.
+    """
+    normalized = {field: _normalize(values.get(field)) for field in fields}
+    raw = json.dumps(normalized, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
@@ -1,5 +1,8 @@
+import base64
+import json
+from datetime import date, datetime
 from math import ceil
-from typing import Generic, Iterable, List, Sequence, TypeVar
+from typing import Any, Generic, Iterable, List, Optional, Sequence, TypeVar
 
 from pydantic.generics import GenericModel
 
@@ -8,16 +11,84 @@ T = TypeVar("T")
 
 class Page(GenericModel, Generic[T]):
     items: List[T]
-    total: int
+    total: Optional[int]
     page: int
     page_size: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
     @property
     def pages(self) -> int:
-        if self.page_size == 0:
+        if self.page_size == 0 or self.total is None:
             return 0
         return ceil(self.total / self.page_size)
 
 
-def paginate(items: Sequence[T], total: int, page: int, page_size: int) -> Page[T]:
-    return Page(items=list(items), total=total, page=page, page_size=page_size)
+def paginate(
+    items: Sequence[T],
+    total: Optional[int],
+    page: int,
+    page_size: int,
+    has_more: bool = False,
+    next_cursor: Optional[str] = None,
+) -> Page[T]:
+    return Page(
+        items=list(items),
+        total=total,
+        page=page,
+        page_size=page_size,
+        has_more=has_more,
+        next_cursor=next_cursor,
+    )
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any, kind: type) -> Any:
+    """Decode one cursor key, rejecting anything an ``encode_cursor`` for a ``kind`` column can't produce."""
+    if value is None:
+        return None
+    if kind is datetime or kind is date:
+        tag = "dt" if kind is datetime else "d"
+        if not isinstance(value, dict) or set(value) != {tag} or not isinstance(value[tag], str):
+            raise ValueError("Invalid cursor value")
+        return kind.fromisoformat(value[tag])
+    if isinstance(value, bool):
+        raise ValueError("Invalid cursor value")
+    if kind is float and isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, kind) and isinstance(value, (int, str)):
+        return value
+    raise ValueError("Invalid cursor value")
+
+
+def encode_cursor(sort: str, values: Sequence[Any]) -> str:
+    """Encode the sort key values of the last row of a page into an opaque cursor."""
+    payload = {"s": sort, "k": [_encode_value(value) for value in values]}
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, kinds: Sequence[type]) -> List[Any]:
+    """Decode a cursor produced by ``encode_cursor`` for the same sort order.
+
+    ``kinds`` are the Python types of the sort keys (``int``, ``float``, ``str``, ``date`` or
+    ``datetime``); each value must be ``None`` or a scalar of its key's type.
+    Raises ``ValueError`` when the cursor is malformed or belongs to another sort.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception as exc:
+        raise ValueError("Invalid cursor") from exc
+    if not isinstance(payload, dict) or payload.get("s") != sort or not isinstance(payload.get("k"), list):
+        raise ValueError("Cursor does not match the requested sort order")
+    if len(payload["k"]) != len(kinds):
+        raise ValueError("Cursor does not match the requested sort order")
+    return [_decode_value(value, kind) for value, kind in zip(payload["k"], kinds)]
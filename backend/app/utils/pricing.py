@@ -0,0 +1,74 @@
+import json
+from typing import Any, Dict, Optional
+
+PRICE_COLUMNS = ("price_headline", "price_input", "price_output", "price_per_call")
+
+
+def decode_price_data(value: Any) -> Optional[dict]:
+    """Decode ``price_data`` that may have been JSON-encoded one or more times."""
+    seen = set()
+    current = value
+    while isinstance(current, str) and current not in seen:
+        seen.add(current)
+        try:
+            current = json.loads(current)
+        except Exception:
+            return None
+    return current if isinstance(current, dict) else None
+
+
+def _as_float(value: Any, *, allow_str: bool = False) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if allow_str and isinstance(value, str):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def extract_price_columns(price_model: Optional[str], price_data: Any) -> Dict[str, Optional[float]]:
+    """Derive the sortable numeric price columns stored alongside ``price_data``.
+
+    ``price_headline`` is the single figure used for price sorting: the input token price
+    (falling back to output/cached) for token pricing, the per-call price for call pricing,
+    the first tier's unit price for tiered pricing and ``0`` for free models. Prices stay in
+    the model's own ``price_currency``.
+    """
+    columns: Dict[str, Optional[float]] = dict.fromkeys(PRICE_COLUMNS)
+    data = decode_price_data(price_data)
+    if not data:
+        return columns
+
+    model_type = price_model or ""
+    base = data.get("base") if isinstance(data.get("base"), dict) else {}
+
+    if model_type == "free":
+        columns["price_headline"] = 0.0
+    elif model_type == "token":
+        columns["price_input"] = _as_float(base.get("input_token_1m"))
+        columns["price_output"] = _as_float(base.get("output_token_1m"))
+        for key in ("input_token_1m", "output_token_1m", "input_token_cached_1m"):
+            value = _as_float(base.get(key))
+            if value is not None:
+                columns["price_headline"] = value
+                break
+    elif model_type == "call":
+        columns["price_per_call"] = _as_float(base.get("price_per_call"))
+        columns["price_headline"] = columns["price_per_call"]
+    elif model_type == "tiered":
+        tiers = data.get("tiers")
+        first = tiers[0] if isinstance(tiers, list) and tiers else None
+        if isinstance(first, dict):
+            columns["price_input"] = _as_float(first.get("input_price_per_unit"), allow_str=True)
+            columns["price_output"] = _as_float(first.get("output_price_per_unit"), allow_str=True)
+            for key in ("price_per_unit", "input_price_per_unit", "cached_price_per_unit", "output_price_per_unit"):
+                value = _as_float(first.get(key), allow_str=True)
+                if value is not None:
+                    columns["price_headline"] = value
+                    break
+
+    return columns
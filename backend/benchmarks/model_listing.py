@@ -0,0 +1,126 @@
+"""Per-row cost of rendering model listings: ORM + ``ModelRead`` vs. the Core fast path.
+
+The ``cached`` column is the fast path with a warm model fragment cache.
+
+Run from ``backend/``::
+
+    python -m benchmarks.model_listing --rows 10000 100000
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import date, datetime
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+from sqlmodel import Session, create_engine  # noqa: E402
+
+from app.api.caching import encode_items_response, model_fragment, model_fragment_cache  # noqa: E402
+from app.core import database  # noqa: E402
+from app.models.model import Model  # noqa: E402
+from app.models.vendor import Vendor  # noqa: E402
+from app.repositories.model_repository import ModelRepository  # noqa: E402
+from app.schemas.model import ModelRead, serialize_model_row  # noqa: E402
+
+
+def populate(engine, rows: int) -> None:
+    now = datetime.utcnow()
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Vendor),
+            [{"id": 1, "name": "Vendor", "vendor_image": "https://example.com/v.png", "status": "enabled",
+              "created_at": now, "updated_at": now}],
+        )
+        batch = []
+        for index in range(rows):
+            batch.append(
+                {
+                    "vendor_id": 1,
+                    "model": f"model-{index}",
+                    "vendor_model_id": f"vendor/model-{index}",
+                    "description": "A benchmark model " * 4,
+                    "max_context_tokens": 128000,
+                    "max_output_tokens": 8192,
+                    "model_capability": ["chat", "code", "vision"],
+                    "price_model": "token",
+                    "price_currency": "USD",
+                    "price_data": {"base": {"input_token_1m": 1.5, "output_token_1m": 6.0}},
+                    "categories": ["文本生成"],
+                    "release_date": date(2024, 1, 1),
+                    "license": ["commercial"],
+                    "status": "enabled",
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+            if len(batch) == 5000:
+                connection.execute(insert(Model), batch)
+                batch = []
+        if batch:
+            connection.execute(insert(Model), batch)
+
+
+def render_orm(session: Session, repo: ModelRepository, rows: int) -> bytes:
+    result = repo.search(session, limit=rows, include_total=False)
+    items = [ModelRead.from_orm(model) for model in result.items]
+    return JSONResponse(content=jsonable_encoder(items, by_alias=False)).body
+
+
+def render_fast(session: Session, repo: ModelRepository, rows: int) -> bytes:
+    result = repo.search(session, limit=rows, include_total=False, as_rows=True)
+    return JSONResponse(content=[serialize_model_row(row) for row in result.items]).body
+
+
+def render_cached(session: Session, repo: ModelRepository, rows: int) -> bytes:
+    result = repo.search(session, limit=rows, include_total=False, as_rows=True)
+    return encode_items_response([model_fragment(row) for row in result.items])
+
+
+def measure(engine, render, rows: int, repeat: int) -> float:
+    repo = ModelRepository()
+    timings = []
+    for _ in range(repeat):
+        with Session(engine) as session:
+            started = time.perf_counter()
+            render(session, repo, rows)
+            timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'orm us/row':>12} {'fast us/row':>12} {'cached us/row':>14} {'speedup':>8}")
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as directory:
+            engine = create_engine(f"sqlite:///{directory}/bench.db")
+            database.engine = engine
+            database.init_db()
+            populate(engine, rows)
+            with Session(engine) as session:
+                repo = ModelRepository()
+                assert render_orm(session, repo, rows) == render_fast(session, repo, rows)
+            orm = measure(engine, render_orm, rows, args.repeat)
+            fast = measure(engine, render_fast, rows, args.repeat)
+            model_fragment_cache.maxsize = max(model_fragment_cache.maxsize, rows)
+            with Session(engine) as session:
+                render_cached(session, ModelRepository(), rows)
+            cached = measure(engine, render_cached, rows, args.repeat)
+            engine.dispose()
+        print(
+            f"{rows:>8} {orm / rows * 1e6:>12.1f} {fast / rows * 1e6:>12.1f} "
+            f"{cached / rows * 1e6:>14.1f} {orm / cached:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
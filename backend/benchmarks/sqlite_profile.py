@@ -0,0 +1,145 @@
+"""Catalog read latency while a long import transaction is writing, with and without the SQLite profile.
+
+``default`` is SQLite as shipped (rollback journal, ``synchronous=FULL``, 2 MiB page cache);
+``profile`` applies the ``SQLITE_*`` settings (WAL, ``synchronous=NORMAL``, mmap, cache, busy timeout).
+
+Readers run in separate processes, like the workers of a deployment, and page through the catalog
+while a writer process runs ``--imports`` import transactions of ``--batch`` models each (by default
+the whole catalog, like an admin import job). With the rollback journal a transaction larger than
+the page cache spills to the database file and holds the exclusive lock until it commits, so every
+reader stalls for the rest of the import; ``max ms`` shows the stall. With WAL readers keep reading
+the last committed snapshot, and the writer's commits pay for the checkpoints instead.
+
+Run from ``backend/``::
+
+    python -m benchmarks.sqlite_profile --rows 20000 --imports 2 --readers 4
+"""
+import argparse
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from sqlmodel import Session, create_engine  # noqa: E402
+
+from app.core import database  # noqa: E402
+from app.core.config import get_settings  # noqa: E402
+from app.repositories.model_repository import ModelRepository  # noqa: E402
+from app.repositories.vendor_repository import VendorRepository  # noqa: E402
+from app.schemas.model import ModelBulkImportRequest, ModelBulkItem  # noqa: E402
+from app.services.model_service import ModelService  # noqa: E402
+
+from .model_listing import populate  # noqa: E402
+
+
+def open_engine(path: str, profile: bool):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    settings = get_settings().copy(update={"sqlite_pragmas_enabled": profile})
+    database.configure_sqlite(engine, database.sqlite_pragmas(settings))
+    return engine
+
+
+def reader(path: str, profile: bool, start, stop, results) -> None:
+    engine = open_engine(path, profile)
+    repo = ModelRepository()
+    latencies: list = []
+    failures = 0
+    page = 0
+    start.wait()
+    while not stop.is_set():
+        started = time.perf_counter()
+        try:
+            with Session(engine) as session:
+                repo.search(session, offset=(page % 50) * 20, limit=20, include_total=False, as_rows=True)
+        except OperationalError:
+            failures += 1
+            continue
+        latencies.append(time.perf_counter() - started)
+        page += 1
+    engine.dispose()
+    results.put(("reader", latencies, failures))
+
+
+def writer(path: str, profile: bool, rows: int, batch: int, imports: int, start, stop, results) -> None:
+    engine = open_engine(path, profile)
+    service, repo, vendor_repo = ModelService(), ModelRepository(), VendorRepository()
+    start.wait()
+    started = time.perf_counter()
+    for revision in range(imports):
+        first = (revision * batch) % rows
+        items = [
+            ModelBulkItem(vendorName="Vendor", model=f"model-{index}", vendorModelId=f"vendor/model-{index}",
+                          description=f"Revision {revision} " + "x" * 200)
+            for index in range(first, min(first + batch, rows))
+        ]
+        with Session(engine) as session:
+            service.import_models(session, ModelBulkImportRequest(items=items), repo, vendor_repo)
+            session.commit()
+    elapsed = time.perf_counter() - started
+    stop.set()
+    engine.dispose()
+    results.put(("writer", [elapsed], 0))
+
+
+def run(profile: bool, rows: int, imports: int, readers: int, batch: int) -> dict:
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as directory:
+        path = f"{directory}/bench.db"
+        engine = open_engine(path, profile)
+        database.engine = engine
+        database.init_db()
+        populate(engine, rows)
+        engine.dispose()
+
+        start, stop, results = context.Event(), context.Event(), context.Queue()
+        processes = [
+            context.Process(target=reader, args=(path, profile, start, stop, results)) for _ in range(readers)
+        ]
+        processes.append(
+            context.Process(target=writer, args=(path, profile, rows, batch, imports, start, stop, results))
+        )
+        for process in processes:
+            process.start()
+        # Let the processes import the app before the clock starts.
+        time.sleep(3)
+        start.set()
+        reports = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+
+    seconds = next(values[0] for kind, values, _ in reports if kind == "writer")
+    latencies = sorted(latency for kind, values, _ in reports if kind == "reader" for latency in values)
+    return {
+        "reads_per_second": len(latencies) / seconds,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else float("nan"),
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000 if latencies else float("nan"),
+        "max_ms": latencies[-1] * 1000 if latencies else float("nan"),
+        "failed_reads": sum(failures for kind, _, failures in reports if kind == "reader"),
+        "import_seconds": seconds / imports,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--imports", type=int, default=2, help="import transactions to read through")
+    parser.add_argument("--readers", type=int, default=4, help="reader processes")
+    parser.add_argument("--batch", type=int, help="rows per import transaction (default: all rows)")
+    args = parser.parse_args()
+
+    print(f"{'profile':>8} {'reads/s':>10} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'failed':>7} {'import s':>9}")
+    for name, profile in (("default", False), ("profile", True)):
+        result = run(profile, args.rows, args.imports, args.readers, args.batch or args.rows)
+        print(
+            f"{name:>8} {result['reads_per_second']:>10.0f} {result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f} "
+            f"{result['max_ms']:>8.0f} {result['failed_reads']:>7} {result['import_seconds']:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
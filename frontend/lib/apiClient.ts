@@ -5,6 +5,18 @@ export interface ApiClientOptions {
 
 const defaultBaseUrl = process.env.NEXT_PUBLIC_API_BASE_URL ?? "http://localhost:8000";
 
+// Read-your-writes: after an admin write the API answers with the number of seconds during which
+// this client must read from the primary database. The API is on another origin, so this is
+// echoed back as a header rather than relying on its cookie.
+let readPrimaryUntil = 0;
+
+function trackReadPrimary(response: Response) {
+  const seconds = Number(response.headers.get("X-Read-Primary-Seconds"));
+  if (seconds > 0) {
+    readPrimaryUntil = Date.now() + seconds * 1000;
+  }
+}
+
 export class ApiClient {
   constructor(private readonly options: ApiClientOptions = {}) {}
 
@@ -16,6 +28,9 @@ export class ApiClient {
     if (token) {
       headers["Authorization"] = `Bearer ${token}`;
     }
+    if (Date.now() < readPrimaryUntil) {
+      headers["X-Read-Primary"] = "1";
+    }
     return headers;
   }
 
@@ -32,6 +47,7 @@ export class ApiClient {
       },
       cache: "no-store"
     });
+    trackReadPrimary(response);
     if (!response.ok) {
       throw new Error(`Request failed: ${response.status}`);
     }
@@ -59,6 +75,7 @@ export class ApiClient {
         ...init?.headers
       }
     });
+    trackReadPrimary(response);
 
     if (!response.ok) {
       const errorBody = await response.json().catch(() => ({}));
@@ -76,6 +93,7 @@ export class ApiClient {
       method: "DELETE",
       headers: this.buildHeaders()
     });
+    trackReadPrimary(response);
     if (!response.ok) {
       const errorBody = await response.json().catch(() => ({}));
       throw new Error(errorBody.detail ?? `Request failed: ${response.status}`);
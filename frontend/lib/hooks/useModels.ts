@@ -60,6 +60,9 @@ export function useModels(filters: ModelFilters = {}) {
   });
 }
 
+// The batch endpoint accepts at most this many ids per request.
+const BATCH_MAX_IDS = 100;
+
 export function useModelsByIds(modelIds: number[]) {
   const token = useAuthStore((state) => state.token);
   const client = new ApiClient({ getToken: () => token });
@@ -71,10 +74,20 @@ export function useModelsByIds(modelIds: number[]) {
       if (!uniqueIds.length) {
         return [] as any[];
       }
-      const responses = await Promise.all(uniqueIds.map((id) => client.get<any>(`/api/public/models/${id}`)));
+      const chunks: number[][] = [];
+      for (let start = 0; start < uniqueIds.length; start += BATCH_MAX_IDS) {
+        chunks.push(uniqueIds.slice(start, start + BATCH_MAX_IDS));
+      }
+      const responses = await Promise.all(
+        chunks.map((ids) =>
+          client.get<{ items: any[]; missing: number[] }>(`/api/public/models/batch?ids=${ids.join(",")}`)
+        )
+      );
       const lookup = new Map<number, any>();
-      uniqueIds.forEach((id, index) => {
-        lookup.set(id, responses[index]);
+      responses.forEach((response) => {
+        (response.items ?? []).forEach((model) => {
+          lookup.set(model.id, model);
+        });
       });
       return modelIds
         .map((id) => lookup.get(id))
@@ -114,99 +127,38 @@ export function useAdminModel(modelId?: number) {
   });
 }
 
-const FILTER_META_PAGE_SIZE = 100;
+interface FacetValue {
+  value: string;
+  count: number;
+}
+
+interface ModelFacetsResponse {
+  total: number;
+  vendors: (FacetValue & { id: number })[];
+  capabilities: FacetValue[];
+  licenses: FacetValue[];
+  categories: FacetValue[];
+  price_models: FacetValue[];
+  price_currencies: FacetValue[];
+  max_context_tokens: { min: number | null; max: number | null };
+  max_output_tokens: { min: number | null; max: number | null };
+}
 
 export function useModelFilterOptions() {
   const client = new ApiClient();
 
-  const normalizeStringArray = (value: unknown): string[] => {
-    if (!value) return [];
-    if (Array.isArray(value)) {
-      return value.filter((item): item is string => typeof item === "string" && item.trim().length > 0);
-    }
-    if (typeof value === "string") {
-      try {
-        const parsed = JSON.parse(value);
-        if (Array.isArray(parsed)) {
-          return parsed.filter((item): item is string => typeof item === "string" && item.trim().length > 0);
-        }
-      } catch (error) {
-        // ignore parse errors and fall back to raw string
-      }
-      return value.trim() ? [value.trim()] : [];
-    }
-    return [];
-  };
+  const sortedValues = (values: FacetValue[] | undefined): string[] =>
+    Array.from(new Set((values ?? []).map((item) => item.value).filter(Boolean))).sort((a, b) => a.localeCompare(b));
 
   return useQuery<ModelFilterMetadata>({
     queryKey: ["model-filter-options"],
     queryFn: async () => {
-      const fetchAll = async (path: string) => {
-        const items: any[] = [];
-        let page = 1;
-        while (true) {
-          const response = await client.get<ListResponse<any>>(
-            `${path}?page=${page}&page_size=${FILTER_META_PAGE_SIZE}`
-          );
-          items.push(...(response.items ?? []));
-          if ((response.items?.length ?? 0) < FILTER_META_PAGE_SIZE || items.length >= (response.total ?? 0)) {
-            break;
-          }
-          page += 1;
-        }
-        return items;
-      };
-
-      const [vendorsItems, modelsItems] = await Promise.all([
-        fetchAll("/api/public/vendors"),
-        fetchAll("/api/public/models")
-      ]);
-
-      const vendors = Array.from(
-        new Set(
-          vendorsItems
-            .map((vendor) => vendor?.name)
-            .filter((name): name is string => Boolean(name))
-        )
-      ).sort((a, b) => a.localeCompare(b));
-
-      const capabilitySet = new Set<string>();
-      const licenseSet = new Set<string>();
-      const categorySet = new Set<string>();
-
-      modelsItems.forEach((model) => {
-        const capabilityCandidates = [
-          model?.model_capability,
-          (model as Record<string, unknown> | null | undefined)?.modelCapability,
-          (model as Record<string, unknown> | null | undefined)?.capabilities,
-          (model as Record<string, unknown> | null | undefined)?.capability
-        ];
-        capabilityCandidates.forEach((candidate) => {
-          normalizeStringArray(candidate).forEach((cap) => capabilitySet.add(cap));
-        });
-
-        const licenseCandidates = [
-          model?.license,
-          (model as Record<string, unknown> | null | undefined)?.licenses
-        ];
-        licenseCandidates.forEach((candidate) => {
-          normalizeStringArray(candidate).forEach((license) => licenseSet.add(license));
-        });
-
-        const categoryCandidates = [
-          model?.categories,
-          (model as Record<string, unknown> | null | undefined)?.categories
-        ];
-        categoryCandidates.forEach((candidate) => {
-          normalizeStringArray(candidate).forEach((category) => categorySet.add(category));
-        });
-      });
-
+      const facets = await client.get<ModelFacetsResponse>("/api/public/models/facets");
       return {
-        vendors,
-        capabilities: Array.from(capabilitySet).sort((a, b) => a.localeCompare(b)),
-        licenses: Array.from(licenseSet).sort((a, b) => a.localeCompare(b)),
-        categories: Array.from(categorySet).sort((a, b) => a.localeCompare(b))
+        vendors: sortedValues(facets.vendors),
+        capabilities: sortedValues(facets.capabilities),
+        licenses: sortedValues(facets.licenses),
+        categories: sortedValues(facets.categories)
       };
     },
     staleTime: 5 * 60 * 1000
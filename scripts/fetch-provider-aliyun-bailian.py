@@ -433,7 +433,7 @@ def format_database_url(db: str) -> str:
     return f"sqlite:///{db}"
 
 
-def do_import(path: str, database: Optional[str] = None) -> None:
+def do_import(path: str, database: Optional[str] = None, dry_run: bool = False) -> None:
     """Import Aliyun Bailian data into the database"""
     # Allow overriding database via CLI before backend modules initialize
     if database:
@@ -474,14 +474,18 @@ def do_import(path: str, database: Optional[str] = None) -> None:
         
         # Build request and import
         req = ModelBulkImportRequest(items=items)
-        result = m_svc.import_models(session, req, m_repo, v_repo)
+        result = m_svc.import_models(session, req, m_repo, v_repo, dry_run=dry_run)
         
         print(
-            f"Import finished: created={result.created}, updated={result.updated}, errors={len(result.errors)}"
+            f"{'Dry run' if dry_run else 'Import'} finished: created={result.created}, updated={result.updated}, "
+            f"unchanged={result.unchanged}, errors={len(result.errors)}"
         )
         if result.errors:
             for err in result.errors:
                 print(f"  - {err}")
+        if dry_run:
+            # Also discards vendors created above
+            session.rollback()
 
 
 def main() -> None:
@@ -496,6 +500,11 @@ def main() -> None:
         dest="database",
         help="Database URL or file path (e.g., backend/app.db)",
     )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what the import would create/update without writing",
+    )
     
     args = parser.parse_args()
     
@@ -503,7 +512,7 @@ def main() -> None:
         print(f"Error: File {args.input_file} does not exist.")
         sys.exit(1)
     
-    do_import(args.input_file, args.database)
+    do_import(args.input_file, args.database, args.dry_run)
 
 
 if __name__ == "__main__":
@@ -243,7 +243,7 @@ def format_database_url(db: str) -> str:
     return f"sqlite:///{db}"
 
 
-def do_import(path: str, database: Optional[str] = None) -> None:
+def do_import(path: str, database: Optional[str] = None, dry_run: bool = False) -> None:
     # Allow overriding database via CLI before backend modules initialize
     if database:
         os.environ["DATABASE_URL"] = format_database_url(database)
@@ -274,14 +274,18 @@ def do_import(path: str, database: Optional[str] = None) -> None:
 
         # Build request and import
         req = ModelBulkImportRequest(items=items)
-        result = m_svc.import_models(session, req, m_repo, v_repo)
+        result = m_svc.import_models(session, req, m_repo, v_repo, dry_run=dry_run)
 
         print(
-            f"Import finished: created={result.created}, updated={result.updated}, errors={len(result.errors)}"
+            f"{'Dry run' if dry_run else 'Import'} finished: created={result.created}, updated={result.updated}, "
+            f"unchanged={result.unchanged}, errors={len(result.errors)}"
         )
         if result.errors:
             for err in result.errors:
                 print(f"  - {err}")
+        if dry_run:
+            # Also discards vendors created above
+            session.rollback()
 
 
 def main() -> None:
@@ -305,10 +309,15 @@ def main() -> None:
         dest="database",
         help="Database URL or file path (e.g., backend/app.db)",
     )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what the import would create/update without writing",
+    )
 
     args = parser.parse_args()
     if args.import_path:
-        do_import(args.import_path, args.database)
+        do_import(args.import_path, args.database, args.dry_run)
     else:
         do_fetch(args.output)
 